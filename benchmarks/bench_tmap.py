@@ -0,0 +1,220 @@
+"""
+TmapAPI와 MCP 도구 호출 경로의 오프라인 벤치마크
+
+로컬 스텁 서버(tmap_api.stub_server)를 대상으로 실행하므로 앱 키나 네트워크가 필요 없습니다.
+각 시나리오마다 처리량(ops/s)과 p50/p95/p99 지연 시간을 측정하고 JSON으로 저장합니다.
+
+사용 예:
+    python benchmarks/bench_tmap.py --latency 0.01 --label before
+    python benchmarks/bench_tmap.py --latency 0.01 --label after --compare benchmarks/results/before.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from tmap_api import TmapAPI  # noqa: E402
+from tmap_api.stub_server import StubTmapServer  # noqa: E402
+
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+START = (126.9786567, 37.566826)
+END = (127.0282, 37.4979)
+
+# (이름, 호출 함수) - 각 TmapAPI 메서드의 대표 호출
+CLIENT_CASES: List[Tuple[str, Callable[[TmapAPI], Any]]] = [
+    ("search_poi_keyword", lambda t: t.search_poi_keyword("경복궁")),
+    ("search_coord_keyword", lambda t: t.search_coord_keyword("서울역")),
+    ("geocoding", lambda t: t.geocoding("서울특별시", "중구", "태평로1가")),
+    ("full_text_geocoding", lambda t: t.full_text_geocoding("서울특별시 중구 세종대로 110")),
+    ("reverse_geocoding", lambda t: t.reverse_geocoding(START[1], START[0])),
+    ("pedestrian_route_detail", lambda t: t.pedestrian_route_detail(*START, *END, "출발", "도착")),
+    ("pedestrian_route_summary", lambda t: t.pedestrian_route_summary(*START, *END, "출발", "도착")),
+    ("car_route", lambda t: t.car_route(*START, *END)),
+    ("time_machine_route", lambda t: t.time_machine_route(*START, *END, "2024-01-30 09:00:00")),
+    ("static_map", lambda t: t.static_map(*START, *END, None, return_bytes=True)),
+    ("get_poi_detail", lambda t: t.get_poi_detail("10067845")),
+    ("realtime_place_congestion", lambda t: t.realtime_place_congestion("10067845")),
+    ("public_transit_route", lambda t: t.public_transit_route(str(START[0]), str(START[1]), str(END[0]), str(END[1]))),
+    ("public_transit_route_summary", lambda t: t.public_transit_route_summary(str(START[0]), str(START[1]), str(END[0]), str(END[1]))),
+    ("get_subway_congestion", lambda t: t.get_subway_congestion("1호선", "서울역", "MON", "08")),
+    ("get_subway_car_congestion", lambda t: t.get_subway_car_congestion("1호선", "서울역", "MON", "08")),
+    ("get_subway_car_getoff_rate", lambda t: t.get_subway_car_getoff_rate("1호선", "서울역", "MON", "08")),
+]
+
+# (도구 이름, 인자) - MCP 도구 디스패치 측정용
+TOOL_CASES: List[Tuple[str, Dict[str, Any]]] = [
+    ("search_poi_keyword", {"keyword": "경복궁"}),
+    ("search_coord_keyword", {"keyword": "서울역"}),
+    ("full_text_geocoding", {"address": "서울특별시 중구 세종대로 110"}),
+    ("car_route", {"start_x": START[0], "start_y": START[1], "end_x": END[0], "end_y": END[1]}),
+    ("realtime_place_congestion", {"poi_id": "10067845"}),
+    ("public_transit_route_summary", {"start_x": str(START[0]), "start_y": str(START[1]),
+                                      "end_x": str(END[0]), "end_y": str(END[1])}),
+]
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """정렬된 값 목록의 최근접 순위 분위수"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: List[float], wall: float) -> Dict[str, float]:
+    values = sorted(latencies)
+    return {
+        "ops": len(values),
+        "throughput": len(values) / wall if wall > 0 else 0.0,
+        "p50_ms": percentile(values, 0.50) * 1000,
+        "p95_ms": percentile(values, 0.95) * 1000,
+        "p99_ms": percentile(values, 0.99) * 1000,
+        "mean_ms": sum(values) / len(values) * 1000 if values else 0.0,
+    }
+
+
+def timed(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run_batch(func: Callable[[], Any], iterations: int) -> Dict[str, float]:
+    """같은 호출을 순차적으로 반복"""
+    start = time.perf_counter()
+    latencies = [timed(func) for _ in range(iterations)]
+    return summarize(latencies, time.perf_counter() - start)
+
+
+def run_concurrent(func: Callable[[], Any], iterations: int, workers: int) -> Dict[str, float]:
+    """같은 호출을 스레드 풀에서 동시에 실행"""
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        start = time.perf_counter()
+        latencies = list(pool.map(lambda _: timed(func), range(iterations)))
+        wall = time.perf_counter() - start
+    return summarize(latencies, wall)
+
+
+def bench_client(base_url: str, iterations: int, workers: int, only: Optional[str]) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for name, case in CLIENT_CASES:
+        if only and only not in name:
+            continue
+        tmap = TmapAPI(app_key="stub", base_url=base_url)
+        case(tmap)  # 연결 예열
+        results[f"client.{name}.batch"] = run_batch(lambda: case(tmap), iterations)
+        results[f"client.{name}.concurrent"] = run_concurrent(lambda: case(tmap), iterations, workers)
+    return results
+
+
+def bench_mcp(base_url: str, iterations: int, only: Optional[str]) -> Dict[str, Any]:
+    """JSON 인자 → FastMCP call_tool → 결과 변환까지의 도구 디스패치 경로 측정"""
+    os.environ.setdefault("TMAP_APP_KEY", "stub")
+    os.environ["TMAP_BASE_URL"] = base_url
+    # 캐시 적중이 아닌 디스패치 경로를 재도록 응답 캐시를 끄고, 공유 캐시 파일에 스텁 응답을 남기지 않음
+    os.environ["TMAP_RESPONSE_CACHE"] = "0"
+    os.environ.pop("TMAP_CACHE_DB", None)
+    import mcp_server
+
+    mcp = mcp_server.tmap_server.mcp
+    loop = asyncio.new_event_loop()
+    results: Dict[str, Any] = {}
+    try:
+        for name, arguments in TOOL_CASES:
+            if only and only not in name:
+                continue
+
+            def call() -> Any:
+                return loop.run_until_complete(mcp.call_tool(name, json.loads(json.dumps(arguments))))
+
+            call()
+            results[f"mcp.{name}.dispatch"] = run_batch(call, iterations)
+    finally:
+        loop.close()
+    return results
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: Dict[str, Any], baseline_path: str) -> None:
+    """기준 결과 파일과 비교한 p50/p99/처리량 변화율 출력"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    print(f"\n{'scenario':55} {'p50':>9} {'p99':>9} {'ops/s':>9}")
+    for name, now in current.items():
+        before = baseline.get(name)
+        if not before:
+            continue
+
+        def delta(key: str) -> str:
+            if not before[key]:
+                return "n/a"
+            return f"{(now[key] - before[key]) / before[key] * 100:+.1f}%"
+
+        print(f"{name:55} {delta('p50_ms'):>9} {delta('p99_ms'):>9} {delta('throughput'):>9}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="TmapAPI 오프라인 벤치마크")
+    parser.add_argument("--latency", type=float, default=0.005, help="스텁 서버 응답 지연(초)")
+    parser.add_argument("--iterations", type=int, default=200, help="시나리오별 호출 횟수")
+    parser.add_argument("--workers", type=int, default=16, help="동시 실행 모드의 스레드 수")
+    parser.add_argument("--only", help="이름에 이 문자열이 포함된 시나리오만 실행")
+    parser.add_argument("--skip-mcp", action="store_true", help="MCP 도구 디스패치 측정 생략")
+    parser.add_argument("--label", default=datetime.now().strftime("%Y%m%d-%H%M%S"), help="결과 파일 이름")
+    parser.add_argument("--compare", help="비교할 기준 결과 JSON 파일")
+    parser.add_argument("--gzip-min-size", type=int, default=1024,
+                        help="스텁 서버가 gzip으로 압축할 최소 응답 크기(바이트, 0이면 압축하지 않음)")
+    args = parser.parse_args()
+
+    # 압축 여부에 따라 지연 시간과 처리량이 달라지므로 결과 파일의 config에 함께 기록
+    gzip_min_size = args.gzip_min_size or None
+    with StubTmapServer(latency=args.latency, gzip_min_size=gzip_min_size) as stub:
+        results = bench_client(stub.base_url, args.iterations, args.workers, args.only)
+        if not args.skip_mcp:
+            results.update(bench_mcp(stub.base_url, args.iterations, args.only))
+
+    for name, r in results.items():
+        print(f"{name:55} {r['throughput']:9.1f} ops/s  p50 {r['p50_ms']:7.2f}ms  "
+              f"p95 {r['p95_ms']:7.2f}ms  p99 {r['p99_ms']:7.2f}ms")
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, f"{args.label}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "label": args.label,
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "config": {"latency": args.latency, "iterations": args.iterations, "workers": args.workers,
+                       "gzip_min_size": gzip_min_size},
+            "results": results,
+        }, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {path}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,170 @@
 import os
+import argparse
+import asyncio
+import functools
+import inspect
+import multiprocessing
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.managers import SyncManager
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.utilities.types import Image
+from mcp.types import EmbeddedResource, ImageContent, TextContent
 from pymcp import PyMCP, mcpwrap
-from tmap_api.tmap_api import TmapAPI
+from tmap_api.tmap_api import TmapAPI, DEFAULT_BASE_URL
+from tmap_api.cache import BudgetStore, ResponseCache, SQLiteStore, parse_policies
+from tmap_api.cassette import Cassette
+from tmap_api.circuit_breaker import CircuitBreakers
+from tmap_api.deadline import deadline
+from tmap_api.errors import TmapError
+from tmap_api.hedging import HedgePolicy
+from tmap_api.image_cache import StaticMapCache
+from tmap_api.key_pool import KeyPool
+from tmap_api.metrics import TmapMetrics
+from tmap_api.log import configure_logging
+from tmap_api.rate_limit import INTERACTIVE, RateLimiter, SharedRateLimiter, SlotLimiter, parse_weights, priority
+from tmap_api.spatial import TileCache
+from tmap_api.tracing import create_tracer
+from tmap_api.warmup import CacheWarmer, load_warmup_config
 
-# Tmap API 클라이언트 초기화
+# 로그는 stdout(JSON-RPC 스트림) 대신 stderr 또는 TMAP_LOG_FILE로 기록
+configure_logging(
+    level=os.environ.get("TMAP_LOG_LEVEL", "WARNING"),
+    log_file=os.environ.get("TMAP_LOG_FILE"),
+    json_format=os.environ.get("TMAP_LOG_FORMAT", "json") == "json"
+)
+
+# Tmap API 클라이언트 초기화 (TMAP_APP_KEYS에 쉼표로 여러 키를 지정하면 키 풀로 분산)
 TMAP_APP_KEY = os.environ.get("TMAP_APP_KEY")
-if not TMAP_APP_KEY:
+TMAP_APP_KEYS = [k.strip() for k in os.environ.get("TMAP_APP_KEYS", "").split(",") if k.strip()]
+if TMAP_APP_KEY and TMAP_APP_KEY not in TMAP_APP_KEYS:
+    TMAP_APP_KEYS.insert(0, TMAP_APP_KEY)
+if not TMAP_APP_KEYS:
     raise ValueError("TMAP_APP_KEY 환경 변수가 설정되지 않았습니다.")
+TMAP_KEY_QUOTA = os.environ.get("TMAP_KEY_QUOTA")
+key_pool = KeyPool(TMAP_APP_KEYS, quota=int(TMAP_KEY_QUOTA) if TMAP_KEY_QUOTA else None)
+
+# 정적 지도 이미지 캐시 (TMAP_STATIC_MAP_CACHE_DIR 설정 시 사용)
+STATIC_MAP_CACHE_DIR = os.environ.get("TMAP_STATIC_MAP_CACHE_DIR")
+STATIC_MAP_SNAP_DIGITS = os.environ.get("TMAP_STATIC_MAP_SNAP_DIGITS")
+static_map_cache = None
+if STATIC_MAP_CACHE_DIR:
+    static_map_cache = StaticMapCache(
+        STATIC_MAP_CACHE_DIR,
+        snap_digits=int(STATIC_MAP_SNAP_DIGITS) if STATIC_MAP_SNAP_DIGITS else None
+    )
+
+# static_map 도구가 이미지 파일을 쓰는 디렉토리 (클라이언트가 지정한 file_path는 이 디렉토리 안으로만 허용)
+STATIC_MAP_OUTPUT_DIR = os.path.realpath(
+    os.environ.get("TMAP_STATIC_MAP_OUTPUT_DIR", os.path.join(os.getcwd(), "static_maps")))
+
+# 트레이스 파일 (TMAP_TRACE_FILE 설정 시 도구 호출 → 메서드 → HTTP 요청 span 기록)
+tracer = create_tracer(
+    os.environ.get("TMAP_TRACE_FILE"),
+    os.environ.get("TMAP_TRACE_FORMAT", "jsonl")
+)
+
+# 트래픽 녹화/재생 (TMAP_CASSETTE 설정 시 사용)
+CASSETTE_PATH = os.environ.get("TMAP_CASSETTE")
+cassette = None
+if CASSETTE_PATH:
+    cassette = Cassette(
+        CASSETTE_PATH,
+        mode=os.environ.get("TMAP_CASSETTE_MODE", "replay"),
+        speed=float(os.environ.get("TMAP_REPLAY_SPEED", "1.0"))
+    )
+
+# 엔드포인트 계열별 회로 차단기 (TMAP_CIRCUIT_FAILURES=0이면 사용하지 않음)
+circuit_breakers = CircuitBreakers(
+    failure_threshold=int(os.environ.get("TMAP_CIRCUIT_FAILURES", "5")),
+    recovery_timeout=float(os.environ.get("TMAP_CIRCUIT_RESET", "30"))
+)
 
-tmap_client = TmapAPI(app_key=TMAP_APP_KEY)
+# 멱등 조회(search_poi_keyword, geocoding, get_poi_detail)의 헤지 요청 (TMAP_HEDGE=1 설정 시 사용)
+hedging = None
+if os.environ.get("TMAP_HEDGE", "").lower() in ("1", "true", "yes"):
+    hedging = HedgePolicy(
+        percentile=float(os.environ.get("TMAP_HEDGE_PERCENTILE", "0.95")),
+        budget=float(os.environ.get("TMAP_HEDGE_BUDGET", "0.05"))
+    )
+
+# 혼잡도/POI/주소 조회 응답 캐시 (만료 후에도 최대 허용 시간까지는 바로 응답하고 백그라운드에서 갱신)
+# 캐시는 기본적으로 프로세스 메모리에 TMAP_CACHE_MAX_BYTES 예산 안에서만 저장하며,
+# TMAP_CACHE_DB를 설정하면 같은 호스트의 모든 MCP 서버 프로세스가 그 SQLite 파일을 공유
+CACHE_DB = os.environ.get("TMAP_CACHE_DB")
+CACHE_MAX_BYTES = int(os.environ.get("TMAP_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+response_cache = None
+if os.environ.get("TMAP_RESPONSE_CACHE", "1").lower() not in ("0", "false", "no"):
+    # 엔드포인트별 캐시 정책 (TMAP_CACHE_POLICIES로 경로/지하철 통계 캐시를 켜거나 기본 정책을 바꿈)
+    response_cache = ResponseCache(policies=parse_policies(os.environ.get("TMAP_CACHE_POLICIES")),
+                                   store=SQLiteStore(CACHE_DB) if CACHE_DB else BudgetStore(CACHE_MAX_BYTES))
+
+# 주변 POI 검색의 타일 캐시 (응답 캐시와 같은 저장소를 사용, TMAP_TILE_TTL초 동안 유효)
+tile_cache = TileCache(
+    store=response_cache.store if response_cache is not None else None,
+    ttl=float(os.environ.get("TMAP_TILE_TTL", "86400"))
+)
+
+# 우선순위 레인(interactive: 도구 호출, normal, background: 예열/일괄 작업)별 토큰과 연결 슬롯 배분 가중치
+PRIORITY_WEIGHTS = parse_weights(os.environ.get("TMAP_PRIORITY_WEIGHTS"))
+
+# 업스트림 초당 요청 수 제한 (TMAP_RATE_LIMIT 설정 시 사용)
+RATE_LIMIT = os.environ.get("TMAP_RATE_LIMIT")
+rate_limiter = None
+if RATE_LIMIT:
+    RATE_BURST = os.environ.get("TMAP_RATE_BURST")
+    rate_limiter = RateLimiter(float(RATE_LIMIT), burst=float(RATE_BURST) if RATE_BURST else None,
+                               weights=PRIORITY_WEIGHTS)
+
+# 프로세스당 동시 업스트림 요청 수(연결 슬롯) 제한 (TMAP_MAX_IN_FLIGHT 설정 시 사용)
+MAX_IN_FLIGHT = os.environ.get("TMAP_MAX_IN_FLIGHT")
+slot_limiter = SlotLimiter(int(MAX_IN_FLIGHT), weights=PRIORITY_WEIGHTS) if MAX_IN_FLIGHT else None
+
+# 경로 상세 응답의 좌표 단순화 허용 오차(m) (TMAP_SIMPLIFY_TOLERANCE 설정 시 캐시 저장 전에 단순화, numpy 필요)
+SIMPLIFY_TOLERANCE = os.environ.get("TMAP_SIMPLIFY_TOLERANCE")
+
+tmap_client = TmapAPI(
+    key_pool=key_pool,
+    response_cache=response_cache,
+    tile_cache=tile_cache,
+    simplify_tolerance=float(SIMPLIFY_TOLERANCE) if SIMPLIFY_TOLERANCE else None,
+    simplify_method=os.environ.get("TMAP_SIMPLIFY_METHOD", "douglas_peucker"),
+    rate_limiter=rate_limiter,
+    slot_limiter=slot_limiter,
+    http2=os.environ.get("TMAP_HTTP2", "").lower() in ("1", "true", "yes"),
+    circuit_breakers=circuit_breakers,
+    hedging=hedging,
+    static_map_cache=static_map_cache,
+    tracer=tracer,
+    base_url=os.environ.get("TMAP_BASE_URL", DEFAULT_BASE_URL),
+    cassette=cassette
+)
+
+# HTTP 전송 모드의 워커 프로세스 여부
+IS_HTTP_WORKER = multiprocessing.parent_process() is not None
+
+# Prometheus 텍스트 형식 계측 파일 (TMAP_METRICS_FILE 설정 시 주기적으로 기록, 워커 프로세스는 제외)
+METRICS_FILE = os.environ.get("TMAP_METRICS_FILE")
+if METRICS_FILE and not IS_HTTP_WORKER:
+    tmap_client.metrics.start_file_exporter(
+        METRICS_FILE,
+        interval=float(os.environ.get("TMAP_METRICS_INTERVAL", "15"))
+    )
+
+# 캐시 예열 (TMAP_WARMUP_FILE 설정 시 자주 쓰는 장소/주소/역/경로를 서버 시작 후 백그라운드에서 미리 조회)
+WARMUP_FILE = os.environ.get("TMAP_WARMUP_FILE")
+warmer = None
+if WARMUP_FILE and not IS_HTTP_WORKER:
+    warmer = CacheWarmer(
+        tmap_client,
+        load_warmup_config(WARMUP_FILE),
+        workers=int(os.environ.get("TMAP_WARMUP_WORKERS", "2"))
+    )
+
+# 도구 호출 하나의 마감 시간(초, 0이면 제한 없음). 지나면 남은 업스트림 요청은 보내지 않고
+# DEADLINE_EXCEEDED 오류로 끝나며, 이미 보낸 요청은 남은 시간을 타임아웃으로 받음
+TOOL_TIMEOUT = float(os.environ.get("TMAP_TOOL_TIMEOUT", "60")) or None
 
 # MCP 서버 생성
 tmap_server = PyMCP(
@@ -15,23 +172,64 @@ tmap_server = PyMCP(
     instructions="A server providing Tmap API functions for location search, geocoding, route planning, and more"
 )
 
+def tool(name: str):
+    """
+    함수를 MCP 도구로 등록하고, 호출을 최상위 span으로 감싸는 데코레이터
+    
+    호출마다 TMAP_TOOL_TIMEOUT 마감 시각을 정해 그 아래의 모든 업스트림 요청에 전파하고,
+    요청은 interactive 우선순위 레인으로 보내 예열/일괄 작업보다 먼저 차례를 받습니다.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with deadline(TOOL_TIMEOUT), priority(INTERACTIVE):
+                if not tracer.enabled:
+                    return func(*args, **kwargs)
+                with tracer.span(f"tool.{name}", kind="server", **{"mcp.tool": name}):
+                    return func(*args, **kwargs)
+        tmap_server.wrap_function(name=name)(wrapper)
+        return wrapper
+    return decorator
+
 # API 함수 정의 및 MCP 서버에 등록
-@tmap_server.wrap_function(name="search_poi_keyword")
-def search_poi_keyword(keyword: str, search_type: str = "all", count: int = 20):
+@tool("search_poi_keyword")
+def search_poi_keyword(keyword: str, search_type: str = "all", count: int = 20, page: int = 1):
     """
     Search for Points of Interest (POI) using keywords
     
     Args:
         keyword: Search keyword
         search_type: Search type (all, name, telno)
-        count: Maximum number of search results
+        count: Maximum number of search results per page
+        page: Result page number (starting at 1)
     
     Returns:
         POI search result data
     """
-    return tmap_client.search_poi_keyword(keyword, search_type, count)
+    return tmap_client.search_poi_keyword(keyword, search_type, count, page)
+
+@tool("search_poi_around")
+def search_poi_around(lat: float, lon: float, categories: str, radius_m: float = 500, count: int = 30):
+    """
+    Search for POIs of given categories around a point, nearest first
+    
+    Results are cached per map tile, so repeated or overlapping searches near the
+    same spot are answered without new upstream requests.
+    
+    Args:
+        lat: Center latitude (WGS84)
+        lon: Center longitude (WGS84)
+        categories: Business categories separated by ';' (e.g. "카페;편의점")
+        radius_m: Search radius in meters
+        count: Maximum number of POIs to return
+    
+    Returns:
+        POIs sorted by distance (each with distance_m), total count within the radius,
+        and whether the result may be truncated
+    """
+    return tmap_client.search_poi_nearby(lat, lon, categories, radius_m, count)
 
-@tmap_server.wrap_function(name="search_address_keyword")
+@tool("search_address_keyword")
 def search_address_keyword(keyword: str, search_type: str = "all"):
     """
     Search for address information using keywords
@@ -46,7 +244,7 @@ def search_address_keyword(keyword: str, search_type: str = "all"):
     sido, sigungu, dong = tmap_client.search_address_keyword(keyword, search_type)
     return {"sido": sido, "sigungu": sigungu, "dong": dong}
 
-@tmap_server.wrap_function(name="search_coord_keyword")
+@tool("search_coord_keyword")
 def search_coord_keyword(keyword: str, search_type: str = "all"):
     """
     Search for coordinates using keywords
@@ -61,7 +259,7 @@ def search_coord_keyword(keyword: str, search_type: str = "all"):
     lat, lon = tmap_client.search_coord_keyword(keyword, search_type)
     return {"lat": lat, "lon": lon}
 
-@tmap_server.wrap_function(name="geocoding")
+@tool("geocoding")
 def geocoding(city_do: str, gu_gun: str, dong: str, coord_type: str = "WGS84GEO"):
     """
     Convert address to coordinates (geocoding)
@@ -70,21 +268,21 @@ def geocoding(city_do: str, gu_gun: str, dong: str, coord_type: str = "WGS84GEO"
         city_do: Province/City name
         gu_gun: County/District name
         dong: Neighborhood name
-        coord_type: Coordinate system type
+        coord_type: Coordinate system type (WGS84GEO, EPSG3857, UTMK, KATECH, BESSELGEO, GRS80GEO)
     
     Returns:
         Coordinate information
     """
     return tmap_client.geocoding(city_do, gu_gun, dong, coord_type)
 
-@tmap_server.wrap_function(name="full_text_geocoding")
+@tool("full_text_geocoding")
 def full_text_geocoding(address: str, coord_type: str = "WGS84GEO", search_count: int = 10):
     """
     Convert free-form text address to coordinates
     
     Args:
         address: Address in free-form text
-        coord_type: Coordinate system type
+        coord_type: Coordinate system type (WGS84GEO, EPSG3857, UTMK, KATECH, BESSELGEO, GRS80GEO)
         search_count: Number of search results
     
     Returns:
@@ -92,7 +290,7 @@ def full_text_geocoding(address: str, coord_type: str = "WGS84GEO", search_count
     """
     return tmap_client.full_text_geocoding(address, coord_type, search_count)
 
-@tmap_server.wrap_function(name="reverse_geocoding")
+@tool("reverse_geocoding")
 def reverse_geocoding(lat: float, lon: float, address_type: str = "A10"):
     """
     Convert coordinates to address (reverse geocoding)
@@ -107,9 +305,10 @@ def reverse_geocoding(lat: float, lon: float, address_type: str = "A10"):
     """
     return tmap_client.reverse_geocoding(lat, lon, address_type)
 
-@tmap_server.wrap_function(name="pedestrian_route_detail")
+@tool("pedestrian_route_detail")
 def pedestrian_route_detail(start_x: float, start_y: float, end_x: float, end_y: float, 
-                            startName: str, endName: str, search_option: str = "0"):
+                            startName: str, endName: str, search_option: str = "0",
+                            simplify_tolerance: float = None):
     """
     Get detailed pedestrian route information
     
@@ -121,16 +320,18 @@ def pedestrian_route_detail(start_x: float, start_y: float, end_x: float, end_y:
         startName: Starting point name
         endName: Destination name
         search_option: Route search option (0: recommended, 4: recommended shortest, 10: shortest)
+        simplify_tolerance: Drop route vertices within this many meters of the simplified line
+            (server default if omitted, 0 keeps every vertex)
     
     Returns:
-        Detailed route information
+        Detailed route information (with _simplified vertex counts when simplified)
     """
     return tmap_client.pedestrian_route_detail(
         start_x, start_y, end_x, end_y, 
-        startName, endName, search_option
+        startName, endName, search_option, simplify_tolerance
     )
 
-@tmap_server.wrap_function(name="pedestrian_route_summary")
+@tool("pedestrian_route_summary")
 def pedestrian_route_summary(start_x: float, start_y: float, end_x: float, end_y: float, 
                             startName: str, endName: str, search_option: str = "0"):
     """
@@ -153,8 +354,43 @@ def pedestrian_route_summary(start_x: float, start_y: float, end_x: float, end_y
         startName, endName, search_option
     )
 
-@tmap_server.wrap_function(name="car_route")
-def car_route(start_x: float, start_y: float, end_x: float, end_y: float, search_option: str = "0"):
+@tool("static_map")
+def static_map(start_x: float, start_y: float, end_x: float, end_y: float,
+               file_path: str = "route_map.png", as_image: bool = False):
+    """
+    Create a static map image of the route between two points
+    
+    Args:
+        start_x: Starting point longitude
+        start_y: Starting point latitude
+        end_x: Destination longitude
+        end_y: Destination latitude
+        file_path: Path of the image file to write, relative to the server's output directory
+        as_image: Return the image itself instead of writing it to file_path
+    
+    Returns:
+        Route map image, or the saved file path and success flag
+    """
+    if as_image:
+        data = tmap_client.static_map(start_x, start_y, end_x, end_y, None,
+                                      stream=True, return_bytes=True)
+        if not data:
+            return data
+        return Image(data=bytes(data), format="png").to_image_content()
+    # 클라이언트가 준 경로가 출력 디렉토리를 벗어나지 않도록 심볼릭 링크까지 풀어서 확인
+    target = os.path.realpath(os.path.join(STATIC_MAP_OUTPUT_DIR, file_path))
+    if target == STATIC_MAP_OUTPUT_DIR or os.path.commonpath([target, STATIC_MAP_OUTPUT_DIR]) != STATIC_MAP_OUTPUT_DIR:
+        return TmapError("static_map", "INVALID_PATH",
+                         f"file_path는 출력 디렉토리({STATIC_MAP_OUTPUT_DIR}) 안의 경로여야 합니다.")
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    result = tmap_client.static_map(start_x, start_y, end_x, end_y, target, stream=True)
+    if not result:
+        return result
+    return {"success": True, "file_path": target}
+
+@tool("car_route")
+def car_route(start_x: float, start_y: float, end_x: float, end_y: float, search_option: str = "0",
+              simplify_tolerance: float = None):
     """
     Get car route guidance
     
@@ -164,13 +400,15 @@ def car_route(start_x: float, start_y: float, end_x: float, end_y: float, search
         end_x: Destination longitude
         end_y: Destination latitude
         search_option: Route search option (0: recommended, 1: traffic optimal, 2: shortest distance)
+        simplify_tolerance: Drop route vertices within this many meters of the simplified line
+            (server default if omitted, 0 keeps every vertex)
     
     Returns:
-        Route information
+        Route information (with _simplified vertex counts when simplified)
     """
-    return tmap_client.car_route(start_x, start_y, end_x, end_y, search_option)
+    return tmap_client.car_route(start_x, start_y, end_x, end_y, search_option, simplify_tolerance)
 
-@tmap_server.wrap_function(name="time_machine_route")
+@tool("time_machine_route")
 def time_machine_route(start_x: float, start_y: float, end_x: float, end_y: float, 
                        departure_time: str, search_option: str = "0", 
                        arrival_option: str = "0", via_points=None, use_kst: bool = True):
@@ -196,7 +434,7 @@ def time_machine_route(start_x: float, start_y: float, end_x: float, end_y: floa
         departure_time, search_option, arrival_option, via_points, use_kst
     )
 
-@tmap_server.wrap_function(name="get_poi_detail")
+@tool("get_poi_detail")
 def get_poi_detail(poi_id: str):
     """
     Get detailed POI information
@@ -209,7 +447,7 @@ def get_poi_detail(poi_id: str):
     """
     return tmap_client.get_poi_detail(poi_id)
 
-@tmap_server.wrap_function(name="realtime_place_congestion")
+@tool("realtime_place_congestion")
 def realtime_place_congestion(poi_id: str, lat=None, lng=None):
     """
     Get real-time place congestion information
@@ -228,7 +466,7 @@ def realtime_place_congestion(poi_id: str, lat=None, lng=None):
         lng = float(lng)
     return tmap_client.realtime_place_congestion(poi_id, lat, lng)
 
-@tmap_server.wrap_function(name="public_transit_route")
+@tool("public_transit_route")
 def public_transit_route(start_x: str, start_y: str, end_x: str, end_y: str,
                         lang: int = 0, format: str = "json", count: int = 10,
                         search_dttm: str = None):
@@ -253,7 +491,7 @@ def public_transit_route(start_x: str, start_y: str, end_x: str, end_y: str,
         lang, format, count, search_dttm
     )
 
-@tmap_server.wrap_function(name="public_transit_route_summary")
+@tool("public_transit_route_summary")
 def public_transit_route_summary(start_x: str, start_y: str, end_x: str, end_y: str,
                                format: str = "json", count: int = 10,
                                search_dttm: str = None):
@@ -277,7 +515,27 @@ def public_transit_route_summary(start_x: str, start_y: str, end_x: str, end_y:
         format, count, search_dttm
     )
 
-@tmap_server.wrap_function(name="get_subway_congestion")
+@tool("plan_trip")
+def plan_trip(origin_text: str, destination_text: str, modes: str = "car,pedestrian,transit"):
+    """
+    Plan a trip between two places in one call and compare travel modes side by side
+    
+    Resolves both place names (or addresses) to coordinates concurrently, then queries
+    every requested mode concurrently. Use this instead of chaining search_coord_keyword,
+    car_route, pedestrian_route_summary and public_transit_route_summary.
+    
+    Args:
+        origin_text: Starting place name or address (e.g. "서울역")
+        destination_text: Destination place name or address (e.g. "강남역")
+        modes: Comma-separated travel modes to compare (car, pedestrian, transit)
+    
+    Returns:
+        Resolved origin/destination, per-mode distance (m), time (s), fares, transfers and
+        walking distance, and the fastest mode. A failed mode carries its own error.
+    """
+    return tmap_client.plan_trip(origin_text, destination_text, modes)
+
+@tool("get_subway_congestion")
 def get_subway_congestion(route_nm: str, station_nm: str, dow: str = None, hh: str = None):
     """
     Get train congestion information for a subway station
@@ -295,7 +553,7 @@ def get_subway_congestion(route_nm: str, station_nm: str, dow: str = None, hh: s
     """
     return tmap_client.get_subway_congestion(route_nm, station_nm, dow, hh)
 
-@tmap_server.wrap_function(name="get_subway_car_congestion")
+@tool("get_subway_car_congestion")
 def get_subway_car_congestion(route_nm: str, station_nm: str, dow: str = None, hh: str = None):
     """
     Get car-specific congestion information for a subway station
@@ -313,7 +571,7 @@ def get_subway_car_congestion(route_nm: str, station_nm: str, dow: str = None, h
     """
     return tmap_client.get_subway_car_congestion(route_nm, station_nm, dow, hh)
 
-@tmap_server.wrap_function(name="get_subway_car_getoff_rate")
+@tool("get_subway_car_getoff_rate")
 def get_subway_car_getoff_rate(route_nm: str, station_nm: str, dow: str = None, hh: str = None):
     """
     Get car-specific passenger exit rate information for a subway station
@@ -331,7 +589,185 @@ def get_subway_car_getoff_rate(route_nm: str, station_nm: str, dow: str = None,
     """
     return tmap_client.get_subway_car_getoff_rate(route_nm, station_nm, dow, hh)
 
+@tool("tmap_stats")
+def tmap_stats(reset: bool = False):
+    """
+    Get per-endpoint call statistics of this server's Tmap API client
+    
+    Args:
+        reset: Clear the statistics after reading them
+    
+    Returns:
+        Latency histograms and percentiles, status code counts, bytes received
+        retry, hedge and abandoned (deadline/cancellation) counts per endpoint, cache hit ratios, circuit breaker state
+        per endpoint family, per-app-key usage (keys are masked), and rate
+        limiter, connection slot (per priority lane) and cache warm-up progress
+        when enabled. Response cache occupancy
+        is broken down by endpoint (entries and bytes); the in-memory cache also
+        reports its byte budget and eviction count
+    """
+    stats = tmap_client.metrics.snapshot()
+    stats["keys"] = tmap_client.key_pool.snapshot()
+    if tmap_client.rate_limiter is not None:
+        stats["rate_limiter"] = tmap_client.rate_limiter.snapshot()
+    if tmap_client.slot_limiter is not None:
+        stats["slots"] = tmap_client.slot_limiter.snapshot()
+    if warmer is not None:
+        stats["warmup"] = warmer.snapshot()
+    if response_cache is not None and hasattr(response_cache.store, "stats"):
+        stats["response_cache"] = response_cache.store.stats()
+    if response_cache is not None and hasattr(response_cache.store, "usage"):
+        stats["response_cache_usage"] = response_cache.store.usage()
+    if METRICS_FILE and not IS_HTTP_WORKER:
+        tmap_client.metrics.write_prometheus(METRICS_FILE)
+    if reset:
+        tmap_client.metrics.reset()
+    return stats
+
+# HTTP 전송 모드에서 클라이언트가 취소한 도구 호출 ID (Manager 공유 딕셔너리, 워커 프로세스에서 설정)
+cancelled_calls = None
+
+class SharedManager(SyncManager):
+    """키 풀, 계측 수집기, 메모리 응답 캐시를 Manager 프로세스 하나에 두고 모든 프로세스가 프록시로 함께 쓰는 Manager"""
+
+SharedManager.register("KeyPool", KeyPool)
+SharedManager.register("TmapMetrics", TmapMetrics)
+SharedManager.register("BudgetStore", BudgetStore)
+
+def _use_shared(shared_key_pool, shared_metrics):
+    """클라이언트와 캐시, 헤지 정책이 공유 키 풀과 계측 수집기를 쓰도록 교체"""
+    tmap_client.key_pool = shared_key_pool
+    tmap_client.metrics = shared_metrics
+    tmap_client.circuit_breakers.on_change = shared_metrics.record_circuit
+    for component in (tmap_client.hedging, tmap_client.response_cache, tmap_client.tile_cache):
+        if component is not None:
+            component.metrics = shared_metrics
+
+def _init_http_worker(shared_limiter, shared_store, shared_cancelled, shared_key_pool, shared_metrics):
+    """워커 프로세스 초기화: 부모 프로세스와 속도 제한기, 응답 캐시, 취소 목록, 키 풀, 계측 수집기를 공유"""
+    global cancelled_calls
+    cancelled_calls = shared_cancelled
+    if shared_limiter is not None:
+        tmap_client.rate_limiter = shared_limiter
+    if shared_store is not None and tmap_client.response_cache is not None:
+        tmap_client.response_cache.store = shared_store
+        tmap_client.tile_cache.store = shared_store
+    _use_shared(shared_key_pool, shared_metrics)
+
+def _run_tool(name, arguments, call_id, expires_at):
+    """
+    워커 프로세스에서 도구 함수 실행
+
+    expires_at(유닉스 시간)은 부모 프로세스가 호출을 받은 시점 기준이므로 풀에서 기다린 시간도
+    마감 시간에 포함되며, 부모가 call_id를 취소 목록에 넣으면 남은 요청을 보내지 않습니다.
+    """
+    timeout = None if expires_at is None else expires_at - time.time()
+    with deadline(timeout, is_cancelled=lambda: call_id in cancelled_calls):
+        return tmap_server.functions[name](**arguments)
+
+def _to_mcp_content(result):
+    """
+    도구 함수의 반환값을 MCP 콘텐츠 목록으로 변환 (stdio/sse에서 PyMCP가 하는 변환과 같은 결과)
+
+    PyMCP는 이 변환을 공개 API로 제공하지 않으므로 mcp.types만으로 같은 규칙을 구현합니다.
+    """
+    contents = (TextContent, ImageContent, EmbeddedResource)
+    if isinstance(result, contents):
+        return [result]
+    if isinstance(result, list) and all(isinstance(item, contents) for item in result):
+        return result
+    if isinstance(result, Image):
+        return [result.to_image_content()]
+    return [TextContent(type="text", text=str(result))]
+
+def _process_tool(pool, cancelled, name, func):
+    """도구 호출을 워커 프로세스 풀로 넘기는 비동기 도구 함수 생성"""
+    async def proxy(**kwargs):
+        call_id = uuid.uuid4().hex
+        expires_at = time.time() + TOOL_TIMEOUT if TOOL_TIMEOUT else None
+        future = pool.submit(_run_tool, name, kwargs, call_id, expires_at)
+        try:
+            result = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # 클라이언트가 호출을 취소하면(notifications/cancelled, 연결 끊김) 워커의 남은 요청도 취소
+            if not future.done():
+                cancelled[call_id] = True
+                future.add_done_callback(lambda _: cancelled.pop(call_id, None))
+            raise
+        return _to_mcp_content(result)
+    proxy.__name__ = name
+    proxy.__doc__ = func.__doc__
+    proxy.__signature__ = inspect.signature(func)
+    return proxy
+
+def run_http(host, port, workers):
+    """
+    Streamable HTTP 전송으로 서버 실행
+
+    여러 MCP 세션의 요청은 이벤트 루프에서 받고, 도구 실행은 workers개의 워커 프로세스로
+    분산합니다. 속도 제한기는 공유 메모리로, 취소한 호출 목록은 Manager 공유 딕셔너리로,
+    메모리 응답 캐시와 키별 사용량, 계측 정보는 Manager 프로세스의 BudgetStore/KeyPool/TmapMetrics로
+    모든 프로세스가 함께 씁니다. 그래서 TMAP_KEY_QUOTA는 워커 수와 상관없이 키 하나의 전체 한도이고, tmap_stats와
+    TMAP_METRICS_FILE은 모든 워커의 호출을 합친 통계입니다.
+
+    대신 키 선택/반환, 캐시 조회/저장, 계측 기록이 모두 Manager 프로세스로의 동기 왕복(로컬에서 한 번에
+    약 30µs)이라, 캐시되지 않은 업스트림 요청 하나에 5~6번, 캐시 적중 하나에 2번의 왕복이 더해집니다.
+    업스트림 지연(수십~수백 ms)에 비하면 작지만, Manager 프로세스 하나가 모든 워커의 왕복을 차례로
+    처리하므로 초당 수천 건 이상의 캐시 적중을 처리하는 배포에서는 병목이 될 수 있습니다.
+    """
+    context = multiprocessing.get_context("spawn")
+    manager = SharedManager(ctx=context)
+    manager.start()
+    cancelled = manager.dict()
+    shared_key_pool = manager.KeyPool(TMAP_APP_KEYS, quota=int(TMAP_KEY_QUOTA) if TMAP_KEY_QUOTA else None)
+    shared_metrics = manager.TmapMetrics()
+    _use_shared(shared_key_pool, shared_metrics)
+    if METRICS_FILE:
+        # 부모 프로세스의 계측 정보 대신 모든 프로세스가 기록하는 공유 계측 정보를 Manager 프로세스에서 기록
+        tmap_client.metrics.stop_file_exporter()
+        shared_metrics.start_file_exporter(METRICS_FILE, float(os.environ.get("TMAP_METRICS_INTERVAL", "15")))
+    shared_limiter = None
+    if rate_limiter is not None:
+        shared_limiter = SharedRateLimiter(rate_limiter.rate, rate_limiter.burst,
+                                           rate_limiter.background_reserve, context=context,
+                                           weights=PRIORITY_WEIGHTS)
+        tmap_client.rate_limiter = shared_limiter
+    shared_store = None
+    # SQLite 캐시는 워커도 같은 파일을 열어 공유하므로 메모리 캐시일 때만 Manager 프로세스의
+    # BudgetStore로 공유 (모든 워커를 합쳐 TMAP_CACHE_MAX_BYTES 예산 안으로 유지)
+    if response_cache is not None and isinstance(response_cache.store, BudgetStore):
+        shared_store = manager.BudgetStore(CACHE_MAX_BYTES)
+        response_cache.store = shared_store
+        tile_cache.store = shared_store
+
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                               initializer=_init_http_worker, initargs=(shared_limiter, shared_store, cancelled, shared_key_pool, shared_metrics))
+    http_server = FastMCP(name=tmap_server.mcp.name, instructions=tmap_server.mcp.instructions,
+                          host=host, port=port)
+    for name, func in tmap_server.functions.items():
+        http_server.add_tool(_process_tool(pool, cancelled, name, func), name=name, description=inspect.getdoc(func))
+    if warmer is not None:
+        warmer.start()
+    try:
+        http_server.run(transport="streamable-http")
+    finally:
+        pool.shutdown(cancel_futures=True)
+
 # 서버 실행 코드
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tmap MCP 서버")
+    parser.add_argument("--transport", choices=["stdio", "sse", "http"], default="stdio",
+                        help="전송 방식 (http: 여러 세션을 받는 Streamable HTTP + 워커 프로세스 풀)")
+    parser.add_argument("--host", default="127.0.0.1", help="HTTP 전송 바인딩 주소")
+    parser.add_argument("--port", type=int, default=8000, help="HTTP 전송 포트")
+    parser.add_argument("--workers", type=int, default=2 * (os.cpu_count() or 1),
+                        help="HTTP 전송 워커 프로세스 수 (도구 호출은 대부분 네트워크 대기이므로 코어 수보다 크게 설정 가능)")
+    args = parser.parse_args()
+
     # 서버 시작
-    tmap_server.run() 
\ No newline at end of file
+    if args.transport == "http":
+        run_http(args.host, args.port, args.workers)
+    else:
+        if warmer is not None:
+            warmer.start()
+        tmap_server.run(args.transport)
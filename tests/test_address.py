@@ -0,0 +1,45 @@
+import pytest
+
+from tmap_api import ResponseCache, TmapAPI, normalize_address, split_address
+from tmap_api.address import normalize_province
+from tmap_api.stub_server import StubTmapServer
+
+
+@pytest.mark.parametrize("variant", [
+    "서울특별시 중구 세종대로 110",
+    "서울시 중구 세종대로110",
+    "서울 중구  세종대로 110 (태평로1가)",
+    "대한민국 서울특별시, 중구 세종대로 110",
+    "서울시 중구 세종대로１１０",
+])
+def test_road_address_variants_normalize_to_one_form(variant):
+    assert normalize_address(variant) == "서울특별시 중구 세종대로 110"
+
+
+@pytest.mark.parametrize("variant, expected", [
+    ("경기 성남시 분당구 성남대로 331 번길 8", "경기도 성남시 분당구 성남대로331번길 8"),
+    ("서울 중구 태평로 1가 31 번지", "서울특별시 중구 태평로1가 31"),
+    ("강원도 춘천시 산 12 - 3", "강원특별자치도 춘천시 산12-3"),
+])
+def test_numbered_roads_and_lot_numbers(variant, expected):
+    assert normalize_address(variant) == expected
+
+
+def test_gwangju_is_metropolitan_only_before_its_districts():
+    assert normalize_address("광주 광산구 첨단중앙로 1").startswith("광주광역시 광산구")
+    assert normalize_address("광주시 오포읍 1").startswith("광주시 오포읍")
+    assert normalize_province("서울 ") == "서울특별시"
+
+
+def test_split_address():
+    assert split_address("서울시 중구 태평로1가 31") == ("서울특별시", "중구", "태평로1가")
+    assert split_address("경기 성남시 분당구 정자동 1") == ("경기도", "성남시 분당구", "정자동")
+    assert split_address("") == (None, None, None)
+
+
+def test_address_variants_share_one_cache_entry():
+    with StubTmapServer() as stub:
+        tmap = TmapAPI(app_key="stub", base_url=stub.base_url, response_cache=ResponseCache())
+        first = tmap.full_text_geocoding("서울시 중구 세종대로110")
+        second = tmap.full_text_geocoding("서울특별시 중구 세종대로 110")
+    assert "_cache" not in first and second["_cache"]["stale"] is False
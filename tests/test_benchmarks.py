@@ -0,0 +1,38 @@
+import importlib.util
+import os
+
+import pytest
+
+from tmap_api.stub_server import StubTmapServer
+
+BENCH_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "bench_tmap.py")
+
+
+@pytest.fixture(scope="module")
+def bench():
+    spec = importlib.util.spec_from_file_location("bench_tmap", BENCH_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_percentile_is_nearest_rank(bench):
+    values = [i / 100 for i in range(1, 101)]
+    assert bench.percentile(values, 0.5) == 0.5
+    assert bench.percentile(values, 0.99) == 0.99
+    assert bench.percentile([], 0.5) == 0.0
+
+
+def test_summarize(bench):
+    summary = bench.summarize([0.001, 0.002, 0.003, 0.004], wall=0.01)
+    assert summary["ops"] == 4
+    assert summary["throughput"] == pytest.approx(400)
+    assert summary["mean_ms"] == pytest.approx(2.5)
+    assert summary["p50_ms"] == pytest.approx(2.0)
+
+
+def test_client_scenarios_run_against_stub(bench):
+    with StubTmapServer() as stub:
+        results = bench.bench_client(stub.base_url, iterations=3, workers=2, only="search_poi_keyword")
+    assert set(results) == {"client.search_poi_keyword.batch", "client.search_poi_keyword.concurrent"}
+    assert all(result["ops"] == 3 and result["throughput"] > 0 for result in results.values())
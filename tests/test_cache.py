@@ -0,0 +1,128 @@
+import threading
+import time
+
+from tmap_api import BudgetStore, CachePolicy, ResponseCache, Tracer
+from tmap_api.cache import CacheEntry, SQLiteStore, cache_key
+from tmap_api.rate_limit import BACKGROUND, current_priority
+from tmap_api.tracing import current_span
+
+
+class ListExporter:
+    def __init__(self):
+        self.spans = []
+
+    def export(self, span):
+        self.spans.append(span)
+
+
+def test_fresh_hit_and_miss():
+    cache = ResponseCache({"ep": CachePolicy(ttl=60)})
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return {"value": len(calls)}
+
+    assert cache.get_or_fetch("ep", "k", fetch) == {"value": 1}
+    hit = cache.get_or_fetch("ep", "k", fetch)
+    assert hit["value"] == 1 and hit["_cache"]["stale"] is False
+    assert len(calls) == 1
+
+
+def test_cache_hit_is_recorded_on_current_span():
+    tracer = Tracer(ListExporter())
+    cache = ResponseCache({"ep": CachePolicy(ttl=60)})
+    with tracer.span("miss") as miss:
+        cache.get_or_fetch("ep", "k", lambda: {"value": 1})
+    with tracer.span("hit") as hit:
+        cache.get_or_fetch("ep", "k", lambda: {"value": 2})
+    assert miss.attributes["cache.hit"] is False
+    assert hit.attributes["cache.hit"] is True
+    assert hit.attributes["cache.stale"] is False
+
+
+def test_stale_refresh_runs_in_background_lane_under_caller_span():
+    tracer = Tracer(ListExporter())
+    cache = ResponseCache({"ep": CachePolicy(ttl=1, max_stale=60)})
+    cache.store.set("k", CacheEntry({"value": "old"}, time.time() - 10))
+    seen = {}
+    done = threading.Event()
+
+    def fetch():
+        seen["priority"] = current_priority()
+        seen["parent"] = current_span()
+        done.set()
+        return {"value": "new"}
+
+    with tracer.span("lookup") as span:
+        result = cache.get_or_fetch("ep", "k", fetch)
+    assert result["value"] == "old" and result["_cache"]["stale"] is True
+    assert done.wait(5)
+    assert seen["priority"] == BACKGROUND
+    assert seen["parent"] is span
+    assert span.attributes["cache.hit"] is True
+    assert span.attributes["cache.stale"] is True
+    for _ in range(100):
+        if cache.store.get("k").value == {"value": "new"}:
+            break
+        time.sleep(0.01)
+    assert cache.store.get("k").value == {"value": "new"}
+    cache.shutdown()
+
+
+def test_budget_store_evicts_large_rarely_used_entries_first():
+    store = BudgetStore(max_bytes=40000, max_entry_bytes=20000)
+    small = {"name": "x" * 100}
+    store.set("poi:small", CacheEntry(small, time.time()))
+    for _ in range(20):
+        store.get("poi:small")
+    for i in range(10):
+        store.set(f"route:{i}", CacheEntry({"path": ["y" * 100] * 60}, time.time()))
+    usage = store.usage()
+    assert usage["bytes"] <= usage["max_bytes"]
+    assert usage["evictions"] > 0
+    assert store.get("poi:small") is not None
+    assert store.stats()["route"]["entries"] < 10
+
+
+def test_budget_store_rejects_oversized_entries():
+    store = BudgetStore(max_bytes=10000, max_entry_bytes=1000)
+    store.set("route:big", CacheEntry({"path": ["y" * 100] * 50}, time.time()))
+    assert store.get("route:big") is None
+    assert store.usage()["rejected"] == 1
+
+
+def test_sqlite_store_is_shared_between_connections(tmp_path):
+    path = str(tmp_path / "cache" / "responses.db")
+    writer, reader = SQLiteStore(path), SQLiteStore(path)
+    writer.set("geocoding:abc", CacheEntry({"주소": "서울특별시"}, 1234.5))
+    entry = reader.get("geocoding:abc")
+    assert entry == CacheEntry({"주소": "서울특별시"}, 1234.5)
+    assert reader._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert reader.stats()["geocoding"]["entries"] == 1
+    writer.delete("geocoding:abc")
+    assert reader.get("geocoding:abc") is None
+    writer.close()
+    reader.close()
+
+
+def test_sqlite_store_evicts_least_recently_used(tmp_path):
+    store = SQLiteStore(str(tmp_path / "responses.db"), max_entries=3, touch_interval=0, evict_every=1)
+    for i in range(3):
+        store.set(f"ep:{i}", CacheEntry({"i": i}, time.time()))
+        time.sleep(0.01)
+    store.get("ep:0")
+    store.set("ep:3", CacheEntry({"i": 3}, time.time()))
+    assert len(store) == 3
+    assert store.get("ep:1") is None and store.get("ep:0") is not None
+    store.close()
+
+
+def test_cache_key_ignores_app_key_and_separates_hosts():
+    params = {"appKey": "secret", "lat": 37.5, "lon": 127.0}
+    key = cache_key("reverse_geocoding", "GET", "https://apis.openapi.sk.com/tmap/geo/reversegeocoding", params)
+    same = cache_key("reverse_geocoding", "GET", "https://apis.openapi.sk.com/tmap/geo/reversegeocoding",
+                     {"lon": 127.0, "lat": 37.5, "appKey": "other"})
+    stub = cache_key("reverse_geocoding", "GET", "http://127.0.0.1:8080/tmap/geo/reversegeocoding", params)
+    assert key == same and key != stub
+    assert key.startswith("reverse_geocoding:")
@@ -0,0 +1,61 @@
+import sqlite3
+
+import pytest
+
+from tmap_api import TmapAPI
+from tmap_api.cassette import Cassette, replay_traffic, request_key
+from tmap_api.stub_server import StubTmapServer
+
+SECRET = "secret-app-key-0001"
+
+
+def test_request_key_ignores_app_key_host_and_order():
+    a = request_key("GET", f"https://apis.openapi.sk.com/tmap/pois?b=2&a=1&appKey={SECRET}", None)
+    b = request_key("get", "http://127.0.0.1:8080/tmap/pois?a=1&b=2", None)
+    assert a == b
+    assert request_key("POST", "http://x/tmap/routes", b'{"a":1,"appKey":"k"}') == \
+        request_key("POST", "http://y/tmap/routes", b'{"appKey":"other","a":1}')
+
+
+def test_record_then_replay_without_network(tmp_path):
+    path = str(tmp_path / "traffic.db")
+    with StubTmapServer() as stub:
+        cassette = Cassette(path, mode="record")
+        recorded = TmapAPI(app_key=SECRET, base_url=stub.base_url, cassette=cassette)
+        expected = recorded.reverse_geocoding(37.5665, 126.978)
+        route = recorded.car_route(126.97, 37.55, 127.02, 37.49)
+        cassette.close()
+        base_url = stub.base_url
+
+    # 스텁 서버를 내린 뒤에도 녹화된 응답으로 재생
+    cassette = Cassette(path, mode="replay", speed=0)
+    replayed = TmapAPI(app_key="another-key", base_url=base_url, cassette=cassette)
+    assert replayed.reverse_geocoding(37.5665, 126.978) == expected
+    assert replayed.car_route(126.97, 37.55, 127.02, 37.49) == route
+    miss = replayed.reverse_geocoding(35.1796, 129.0756)
+    assert not miss and miss.status is None
+    assert cassette.stats()["GET /tmap/geo/reversegeocoding"]["requests"] == 1
+
+    with sqlite3.connect(path) as conn:
+        stored = " ".join(str(row) for row in conn.execute("SELECT url, request_body FROM interactions"))
+    assert SECRET not in stored
+    cassette.close()
+
+
+def test_replay_traffic_resends_every_interaction(tmp_path):
+    path = str(tmp_path / "traffic.db")
+    with StubTmapServer() as stub:
+        cassette = Cassette(path, mode="record")
+        tmap = TmapAPI(app_key="stub", base_url=stub.base_url, cassette=cassette)
+        for i in range(5):
+            tmap.reverse_geocoding(37.56 + i / 1000, 126.97)
+        sent = []
+        summary = replay_traffic(cassette, lambda interaction: sent.append(interaction.url), speed=0, workers=2)
+        cassette.close()
+    assert summary["requests"] == 5 and len(sent) == 5
+    assert summary["p50"] is not None
+
+
+def test_unknown_mode_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        Cassette(str(tmp_path / "traffic.db"), mode="rewind")
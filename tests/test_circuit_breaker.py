@@ -0,0 +1,72 @@
+import time
+
+import pytest
+
+from tmap_api import CircuitBreakers, TmapAPI
+from tmap_api.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from tmap_api.stub_server import StubTmapServer
+
+
+def test_opens_after_consecutive_failures_and_rejects():
+    changes = []
+    breaker = CircuitBreaker("/tmap/routes", failure_threshold=3, recovery_timeout=60,
+                             on_change=lambda family, state: changes.append(state))
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == OPEN and changes == [OPEN]
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert breaker.snapshot()["rejections"] == 1
+
+
+def test_success_resets_consecutive_failures():
+    breaker = CircuitBreaker("/tmap/pois", failure_threshold=2)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+
+def test_half_open_lets_one_probe_through():
+    breaker = CircuitBreaker("/tmap/pois", failure_threshold=1, recovery_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    breaker.before_call()
+
+
+def test_failed_probe_reopens():
+    breaker = CircuitBreaker("/tmap/pois", failure_threshold=1, recovery_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == OPEN and breaker.opens == 2
+
+
+def test_families_are_isolated_against_stub():
+    with StubTmapServer(path_error_rates={"/transit": {503: 1.0}}) as stub:
+        breakers = CircuitBreakers(failure_threshold=2, recovery_timeout=60)
+        tmap = TmapAPI(app_key="stub", base_url=stub.base_url, circuit_breakers=breakers)
+        for _ in range(2):
+            assert tmap.public_transit_route_summary("126.97", "37.55", "127.02", "37.49").status == 503
+        rejected = tmap.public_transit_route_summary("126.97", "37.55", "127.02", "37.49")
+        assert rejected.code == "CIRCUIT_OPEN"
+        assert tmap.reverse_geocoding(37.5665, 126.978)
+    assert breakers.snapshot()["/transit/routes"]["state"] == OPEN
+    assert all(state["state"] == CLOSED for family, state in breakers.snapshot().items()
+               if family != "/transit/routes")
+
+
+def test_family_groups_first_two_path_segments():
+    assert CircuitBreakers.family("https://apis.openapi.sk.com/transit/routes/sub") == "/transit/routes"
+    assert CircuitBreakers.family("https://apis.openapi.sk.com/tmap/pois/123") == "/tmap/pois"
@@ -0,0 +1,44 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from tmap_api.coords import COORD_TYPES, convert, convert_geocoding, normalize_coord_type  # noqa: E402
+
+LON = [126.9784, 129.0756, 126.5312, 128.6014]
+LAT = [37.5666, 35.1796, 33.4996, 35.8714]
+
+
+@pytest.mark.parametrize("target", COORD_TYPES)
+def test_round_trip_through_each_coord_type(target):
+    x, y = convert(LON, LAT, "WGS84GEO", target)
+    lon, lat = convert(x, y, target, "WGS84GEO")
+    assert np.allclose(lon, LON, atol=1e-7) and np.allclose(lat, LAT, atol=1e-7)
+
+
+def test_projection_origins():
+    assert convert(127.5, 38.0, "GRS80GEO", "UTMK") == pytest.approx((1000000.0, 2000000.0), abs=1e-3)
+    # 베셀 좌표계끼리도 WGS84를 거쳐 변환하므로 Helmert 왕복 오차(수 mm)가 있음
+    assert convert(128.0, 38.0, "BESSELGEO", "KATECH") == pytest.approx((400000.0, 600000.0), abs=0.01)
+    assert convert(180.0, 0.0, "WGS84GEO", "EPSG3857") == pytest.approx((20037508.3428, 0.0), abs=1e-3)
+
+
+def test_bessel_datum_shift_is_a_few_hundred_meters():
+    lon, lat = convert(126.9784, 37.5666, "WGS84GEO", "BESSELGEO")
+    assert 0.001 < abs(lon - 126.9784) < 0.01 and 0.001 < abs(lat - 37.5666) < 0.01
+
+
+def test_aliases():
+    assert normalize_coord_type("tm128") == "KATECH"
+    assert normalize_coord_type("EPSG:5179") == "UTMK"
+    with pytest.raises(ValueError):
+        normalize_coord_type("EPSG:2097")
+
+
+def test_convert_geocoding_returns_converted_copy():
+    result = {"coordinateInfo": {"coordType": "WGS84GEO", "coordinate": [
+        {"lat": "37.5666000", "lon": "126.9784000", "newLat": "", "newLon": ""}]}}
+    converted = convert_geocoding(result, "UTMK")
+    item = converted["coordinateInfo"]["coordinate"][0]
+    assert converted["coordinateInfo"]["coordType"] == "UTMK"
+    assert float(item["lon"]) > 900000 and item["newLon"] == ""
+    assert result["coordinateInfo"]["coordinate"][0]["lon"] == "126.9784000"
@@ -0,0 +1,74 @@
+import threading
+import time
+
+import pytest
+
+from tmap_api import DeadlineExceeded, TmapAPI, deadline
+from tmap_api.deadline import CANCELLED, DEADLINE_EXCEEDED, check, current_deadline, remaining
+from tmap_api.stub_server import StubTmapServer
+from tmap_api.trip import run_parallel
+
+
+def test_inner_deadline_cannot_extend_outer():
+    with deadline(0.5) as outer:
+        with deadline(10) as inner:
+            assert inner.remaining() <= 0.5
+        assert current_deadline() is outer
+    assert current_deadline() is None
+    assert remaining() is None
+
+
+def test_cancel_propagates_to_children():
+    with deadline() as outer:
+        with deadline(10) as inner:
+            outer.cancel()
+            assert inner.cancelled
+            assert inner.remaining() == 0.0
+            with pytest.raises(DeadlineExceeded) as info:
+                check()
+    assert info.value.code == CANCELLED
+
+
+def test_external_cancellation_check():
+    flag = threading.Event()
+    with deadline(is_cancelled=flag.is_set) as current:
+        assert not current.cancelled
+        flag.set()
+        assert current.cancelled
+
+
+def test_deadline_follows_parallel_calls():
+    with deadline(5):
+        results = run_parallel({"a": remaining, "b": remaining})
+    assert all(0 < left <= 5 for left in results.values())
+
+
+def test_expired_deadline_sends_no_request():
+    with StubTmapServer() as stub:
+        tmap = TmapAPI(app_key="stub", base_url=stub.base_url)
+        with deadline(0.01):
+            time.sleep(0.02)
+            result = tmap.search_poi_keyword("서울역")
+        assert stub.config.usage().get("stub", 0) == 0
+    assert result.code == DEADLINE_EXCEEDED
+    assert tmap.metrics.snapshot()["endpoints"]["search_poi_keyword"]["abandoned"] == 1
+
+
+def test_cancelled_call_returns_cancelled_error():
+    with StubTmapServer() as stub:
+        tmap = TmapAPI(app_key="stub", base_url=stub.base_url)
+        with deadline() as current:
+            current.cancel()
+            result = tmap.search_poi_keyword("서울역")
+    assert result.code == CANCELLED
+
+
+def test_remaining_time_bounds_request_timeout():
+    with StubTmapServer(latency=1.0) as stub:
+        tmap = TmapAPI(app_key="stub", base_url=stub.base_url)
+        started = time.monotonic()
+        with deadline(0.2):
+            result = tmap.search_poi_keyword("서울역")
+        elapsed = time.monotonic() - started
+    assert result.code == DEADLINE_EXCEEDED
+    assert elapsed < 0.8
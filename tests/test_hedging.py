@@ -0,0 +1,76 @@
+import threading
+import time
+
+import pytest
+
+from tmap_api import HedgePolicy
+
+
+class FakeResponse:
+    def __init__(self, name):
+        self.name = name
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def slow_then_fast(first_delay):
+    """첫 요청은 first_delay초, 그 뒤 요청은 바로 끝나는 send 함수"""
+    calls = []
+    lock = threading.Lock()
+
+    def send():
+        response = FakeResponse(len(calls) + 1)
+        with lock:
+            response.name = len(calls) + 1
+            calls.append(response)
+        if response.name == 1:
+            time.sleep(first_delay)
+        return response
+
+    return send, calls
+
+
+def test_delay_follows_recent_percentile():
+    policy = HedgePolicy(percentile=0.9, min_samples=10, initial_delay=0.5, min_delay=0.01)
+    assert policy.delay("geocoding") == 0.5
+    for i in range(100):
+        policy._observe("geocoding", i / 1000)
+    assert policy.delay("geocoding") == pytest.approx(0.09)
+    assert policy.applies("geocoding", "GET") and not policy.applies("geocoding", "POST")
+    assert not policy.applies("car_route", "GET")
+
+
+def test_slow_request_is_hedged_and_loser_closed():
+    policy = HedgePolicy(initial_delay=0.02, budget=1.0)
+    send, calls = slow_then_fast(0.3)
+    response = policy.run("geocoding", send)
+    assert response.name == 2 and len(calls) == 2
+    assert policy.snapshot()["hedges"] == 1
+    # 늦게 끝난 첫 요청의 응답은 연결을 반환하도록 닫힘
+    for _ in range(100):
+        if calls[0].closed:
+            break
+        time.sleep(0.01)
+    assert calls[0].closed and not response.closed
+    policy.shutdown()
+
+
+def test_hedges_stay_within_budget():
+    policy = HedgePolicy(initial_delay=0.01, budget=0.1)
+    for _ in range(20):
+        send, _ = slow_then_fast(0.03)
+        policy.run("geocoding", send)
+    snapshot = policy.snapshot()
+    assert snapshot["requests"] == 20
+    assert 1 <= snapshot["hedges"] <= 2
+    policy.shutdown()
+
+
+def test_fast_request_is_not_hedged():
+    policy = HedgePolicy(initial_delay=0.5, budget=1.0)
+    send, calls = slow_then_fast(0.0)
+    assert policy.run("geocoding", send).name == 1
+    assert len(calls) == 1 and policy.snapshot()["hedges"] == 0
+    policy.shutdown()
@@ -0,0 +1,43 @@
+import pytest
+
+from tmap_api import TmapAPI
+from tmap_api.stub_server import StubTmapServer
+
+
+def search_bytes(tmap):
+    result = tmap.search_poi_keyword("카페", count=45)
+    stats = tmap.metrics.snapshot()["endpoints"]["search_poi_keyword"]
+    return result, stats["bytes_received"], stats["bytes_wire"]
+
+
+def test_compressed_response_records_wire_bytes():
+    with StubTmapServer(gzip_min_size=1024) as stub:
+        tmap = TmapAPI(app_key="stub", base_url=stub.base_url)
+        result, received, wire = search_bytes(tmap)
+    assert len(result["searchPoiInfo"]["pois"]["poi"]) == 45
+    assert 0 < wire < received
+
+
+def test_uncompressed_response_wire_bytes_equal_received():
+    with StubTmapServer() as stub:
+        tmap = TmapAPI(app_key="stub", base_url=stub.base_url)
+        _, received, wire = search_bytes(tmap)
+    assert wire == received > 0
+
+
+def test_httpx_adapter_matches_requests():
+    pytest.importorskip("httpx")
+    from tmap_api import HttpxAdapter
+
+    with StubTmapServer(gzip_min_size=1024) as stub:
+        plain = TmapAPI(app_key="stub", base_url=stub.base_url)
+        expected, _, _ = search_bytes(plain)
+
+        tmap = TmapAPI(app_key="stub", base_url=stub.base_url)
+        # 스텁 서버는 평문 HTTP/1.1이므로 h2 없이 httpx 전송 경로만 확인
+        adapter = HttpxAdapter(http2=False)
+        tmap.session.mount("http://", adapter)
+        result, received, wire = search_bytes(tmap)
+        adapter.close()
+    assert result == expected
+    assert 0 < wire < received
@@ -0,0 +1,84 @@
+import csv
+
+from tmap_api import TmapAPI
+from tmap_api.jobs import Checkpoint, GeocodeTask, JobRunner
+from tmap_api.stub_server import StubTmapServer
+
+ROWS = 60
+
+
+def write_addresses(path, rows=ROWS):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=["id", "address"])
+        writer.writeheader()
+        for i in range(rows):
+            writer.writerow({"id": i, "address": f"서울특별시 중구 세종대로 {i + 1}"})
+
+
+def read_rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+class FakeTmap:
+    def __init__(self, results):
+        self.results = results
+
+    def full_text_geocoding(self, address, search_count=1):
+        result = self.results[address]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def test_geocode_task_without_coordinate_info_is_not_found():
+    result = GeocodeTask()(FakeTmap({"a": {"unexpected": True}}), {"address": "a"})
+    assert result.code == "NOT_FOUND"
+
+
+def test_row_that_raises_is_recorded_as_failed(tmp_path):
+    source, target = tmp_path / "in.csv", tmp_path / "out.csv"
+    with open(source, "w", newline="", encoding="utf-8") as f:
+        f.write("address\na\nb\n")
+    tmap = FakeTmap({"a": KeyError("coordinate"),
+                     "b": {"coordinateInfo": {"coordinate": [{"lat": "37.5", "lon": "127.0"}]}}})
+    summary = JobRunner(tmap, GeocodeTask(), str(source), str(target), retry_backoff=0).run()
+    assert summary["status"] == "completed"
+    assert (summary["succeeded"], summary["failed"]) == (1, 1)
+    rows = {row["address"]: row for row in read_rows(target)}
+    assert rows["a"]["error"].startswith("TASK_FAILED")
+    assert rows["b"]["lat"] == "37.5"
+
+
+def test_resume_after_quota_stop_writes_every_row_once(tmp_path):
+    source, target = tmp_path / "in.csv", tmp_path / "out.csv"
+    write_addresses(source)
+    with StubTmapServer(quota=25) as stub:
+        tmap = TmapAPI(app_key="stub", base_url=stub.base_url)
+        first = JobRunner(tmap, GeocodeTask(), str(source), str(target), workers=4, checkpoint_every=5).run()
+        assert first["status"] == "quota_exhausted"
+        assert 0 < first["processed"] < ROWS
+
+        # 쿼터가 풀린 뒤 같은 설정으로 다시 실행
+        stub.config.quota = None
+        tmap = TmapAPI(app_key="stub", base_url=stub.base_url)
+        second = JobRunner(tmap, GeocodeTask(), str(source), str(target), workers=4, checkpoint_every=5).run()
+    assert second["status"] == "completed"
+    assert second["skipped"] > 0
+    rows = read_rows(target)
+    assert sorted(int(row["row"]) for row in rows) == list(range(ROWS))
+    assert all(row["lat"] and not row["error"] for row in rows)
+
+
+def test_checkpoint_watermark_compacts_out_of_order_rows(tmp_path):
+    checkpoint = Checkpoint(str(tmp_path / "ckpt.json"), {"task": "geocode"})
+    for index in (2, 0, 3):
+        checkpoint.mark(index)
+    assert checkpoint.watermark == 0 and checkpoint.done == {2, 3}
+    checkpoint.mark(1)
+    assert checkpoint.watermark == 3 and checkpoint.done == set()
+    checkpoint.save(123)
+
+    loaded = Checkpoint(checkpoint.path, {"task": "geocode"})
+    assert loaded.load() and loaded.watermark == 3 and loaded.position == 123
+    assert loaded.is_done(2) and not loaded.is_done(4)
@@ -0,0 +1,39 @@
+from collections import Counter
+
+from tmap_api import KeyPool, TmapAPI
+from tmap_api.stub_server import StubTmapServer
+
+KEYS = ["aaaa-key-0001", "bbbb-key-0002", "cccc-key-0003"]
+
+
+def test_sequential_acquire_rotates_keys():
+    pool = KeyPool(KEYS)
+    used = Counter()
+    for _ in range(9):
+        key = pool.acquire()
+        pool.release(key, 200)
+        used[key] += 1
+    assert used == {key: 3 for key in KEYS}
+
+
+def test_prefers_key_with_most_remaining_quota():
+    pool = KeyPool(KEYS, quota=10)
+    pool.release(pool.acquire(), 200)
+    pool.release(pool.acquire(), 200)
+    assert pool.acquire() == KEYS[2]
+
+
+def test_cooled_down_key_is_skipped():
+    pool = KeyPool(KEYS)
+    key = pool.acquire()
+    assert pool.release(key, 429, "QUOTA_EXCEEDED")
+    picked = {pool.acquire() for _ in range(6)}
+    assert key not in picked
+
+
+def test_sequential_requests_spread_across_keys_against_stub():
+    with StubTmapServer(quota=1000) as stub:
+        tmap = TmapAPI(app_key=KEYS, base_url=stub.base_url)
+        for i in range(9):
+            assert tmap.reverse_geocoding(37.56 + i / 1000, 126.97)
+        assert stub.config.usage() == {key: 3 for key in KEYS}
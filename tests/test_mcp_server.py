@@ -0,0 +1,37 @@
+import importlib
+import os
+
+import pytest
+from mcp.server.fastmcp.utilities.types import Image
+from mcp.types import TextContent
+
+from tmap_api.stub_server import _PNG, StubTmapServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    with StubTmapServer() as stub:
+        os.environ.update({"TMAP_APP_KEY": "stub", "TMAP_BASE_URL": stub.base_url, "TMAP_RESPONSE_CACHE": "0"})
+        os.environ.pop("TMAP_CACHE_DB", None)
+        yield importlib.import_module("mcp_server")
+
+
+@pytest.mark.parametrize("result", [
+    {"pois": [{"name": "서울역"}]},
+    [TextContent(type="text", text="a"), TextContent(type="text", text="b")],
+    TextContent(type="text", text="a"),
+    None,
+])
+def test_http_conversion_matches_pymcp(server, result):
+    assert server._to_mcp_content(result) == server.tmap_server._convert_to_mcp_format(result)
+
+
+def test_image_converts_to_image_content(server):
+    [content] = server._to_mcp_content(Image(data=_PNG, format="png"))
+    assert content.type == "image" and content.mimeType == "image/png"
+
+
+def test_tool_result_converts_to_text(server):
+    result = server.tmap_server.functions["reverse_geocoding"](lat=37.5665, lon=126.978)
+    [content] = server._to_mcp_content(result)
+    assert content.type == "text" and "addressInfo" in content.text
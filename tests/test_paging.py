@@ -0,0 +1,74 @@
+from tmap_api import TmapAPI, TmapError
+from tmap_api.paging import PoiPager
+from tmap_api.stub_server import StubTmapServer
+
+
+class FakeTmap:
+    """페이지별 응답을 정해 둔 search_poi_keyword만 있는 가짜 TmapAPI"""
+
+    def __init__(self, pages, total):
+        self.pages = pages
+        self.total = total
+        self.requested = []
+
+    def search_poi_keyword(self, keyword, search_type, count, page=1):
+        self.requested.append(page)
+        page_result = self.pages.get(page)
+        if isinstance(page_result, TmapError):
+            return page_result
+        pois = [{"id": str(poi_id), "name": f"{keyword} {poi_id}"} for poi_id in page_result or []]
+        return {"searchPoiInfo": {"totalCount": str(self.total), "pois": {"poi": pois}}}
+
+
+def test_reads_all_pages_until_total_count():
+    with StubTmapServer() as stub:
+        tmap = TmapAPI(app_key="stub", base_url=stub.base_url)
+        pager = tmap.iter_poi_keyword("스타벅스", page_size=20)
+        names = [poi["name"] for poi in pager]
+    # 스텁 서버는 키워드마다 45개 결과를 줌
+    assert names == [f"스타벅스 {i}" for i in range(1, 46)]
+    assert pager.pages_fetched == 3
+    assert pager.total_count == 45
+    assert pager.error is None
+
+
+def test_limit_stops_without_requesting_unneeded_pages():
+    tmap = FakeTmap({1: range(1, 11), 2: range(11, 21), 3: range(21, 31)}, total=30)
+    pois = list(PoiPager(tmap, "카페", page_size=10, limit=15))
+    assert [poi["id"] for poi in pois] == [str(i) for i in range(1, 16)]
+    # 2페이지로 limit을 채울 수 있으므로 3페이지는 미리 요청하지 않음
+    assert tmap.requested == [1, 2]
+
+
+def test_duplicates_across_pages_are_skipped():
+    tmap = FakeTmap({1: [1, 2, 3], 2: [3, 4, 5]}, total=6)
+    pager = PoiPager(tmap, "카페", page_size=3, prefetch=False)
+    assert [poi["id"] for poi in pager] == ["1", "2", "3", "4", "5"]
+    assert pager.duplicates == 1
+
+
+def test_stop_when_and_max_pages():
+    tmap = FakeTmap({1: [1, 2, 3], 2: [4, 5, 6], 3: [7, 8, 9]}, total=9)
+    pois = list(PoiPager(tmap, "카페", page_size=3, stop_when=lambda poi: poi["id"] == "5", prefetch=False))
+    assert [poi["id"] for poi in pois] == ["1", "2", "3", "4", "5"]
+
+    tmap = FakeTmap({1: [1, 2, 3], 2: [4, 5, 6], 3: [7, 8, 9]}, total=9)
+    pois = list(PoiPager(tmap, "카페", page_size=3, max_pages=2))
+    assert len(pois) == 6
+    assert tmap.requested == [1, 2]
+
+
+def test_failed_page_stops_and_keeps_error():
+    error = TmapError("search_poi_keyword", "HTTP_ERROR", "서버 오류", status=500)
+    tmap = FakeTmap({1: [1, 2, 3], 2: error}, total=9)
+    pager = PoiPager(tmap, "카페", page_size=3)
+    assert [poi["id"] for poi in pager] == ["1", "2", "3"]
+    assert pager.error is error
+
+
+def test_no_content_ends_without_error():
+    tmap = FakeTmap({1: [1, 2, 3], 2: TmapError("search_poi_keyword", "NO_CONTENT", "결과 없음", status=204)},
+                    total=100)
+    pager = PoiPager(tmap, "카페", page_size=3)
+    assert len(list(pager)) == 3
+    assert pager.error is None
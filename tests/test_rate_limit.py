@@ -0,0 +1,108 @@
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from tmap_api import RateLimiter, SlotLimiter, TmapAPI, deadline, priority
+from tmap_api.rate_limit import BACKGROUND, DEFAULT_WEIGHTS, INTERACTIVE, LANES, NORMAL, _FairQueue, parse_weights
+from tmap_api.stub_server import StubTmapServer
+
+
+def drain(queue, count):
+    order = []
+    for _ in range(count):
+        ticket = queue.head({lane: True for lane in LANES})
+        queue.remove(ticket)
+        order.append(ticket.lane)
+    return order
+
+
+def test_fair_queue_shares_turns_by_weight():
+    queue = _FairQueue(DEFAULT_WEIGHTS)
+    for lane in LANES:
+        for _ in range(30):
+            queue.enqueue(lane)
+    assert Counter(drain(queue, 13)) == {INTERACTIVE: 8, NORMAL: 4, BACKGROUND: 1}
+
+
+def test_idle_lane_is_served_right_after_a_backlog():
+    queue = _FairQueue(DEFAULT_WEIGHTS)
+    for _ in range(100):
+        queue.enqueue(BACKGROUND)
+    drain(queue, 10)
+    queue.enqueue(INTERACTIVE)
+    assert drain(queue, 1) == [INTERACTIVE]
+
+
+def test_parse_weights():
+    assert parse_weights("interactive=10, background=2") == {INTERACTIVE: 10.0, NORMAL: 4.0, BACKGROUND: 2.0}
+    with pytest.raises(ValueError):
+        parse_weights("batch=1")
+
+
+def test_background_keeps_rate_limit_reserve_for_interactive():
+    limiter = RateLimiter(rate=0.01, burst=4, background_reserve=0.5)
+    with priority(BACKGROUND):
+        assert limiter.acquire(timeout=0) and limiter.acquire(timeout=0)
+        assert not limiter.acquire(timeout=0.01)
+    with priority(INTERACTIVE):
+        assert limiter.acquire(timeout=0) and limiter.acquire(timeout=0)
+
+
+def test_background_keeps_slot_reserve_for_interactive():
+    slots = SlotLimiter(4, background_reserve=0.25)
+    with priority(BACKGROUND):
+        assert all(slots.acquire(timeout=0) for _ in range(3))
+        assert not slots.acquire(timeout=0.01)
+    with priority(INTERACTIVE):
+        assert slots.acquire(timeout=0)
+    assert slots.snapshot()["in_flight"] == 4
+
+
+def test_slot_wait_gives_up_at_the_deadline():
+    slots = SlotLimiter(1)
+    assert slots.acquire()
+    start = time.monotonic()
+    with deadline(0.1):
+        assert not slots.acquire()
+    assert time.monotonic() - start < 1.0
+    slots.release()
+    assert slots.acquire(timeout=0)
+
+
+def test_waiting_interactive_request_jumps_queued_background_requests():
+    slots = SlotLimiter(1)
+    assert slots.acquire()
+    order = []
+
+    def wait_for_slot(lane):
+        with priority(lane):
+            slots.acquire()
+        order.append(lane)
+        slots.release()
+
+    threads = [threading.Thread(target=wait_for_slot, args=(BACKGROUND,)) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    while sum(slots.snapshot()["waiting"].values()) < 3:
+        time.sleep(0.01)
+    threads.append(threading.Thread(target=wait_for_slot, args=(INTERACTIVE,)))
+    threads[-1].start()
+    while sum(slots.snapshot()["waiting"].values()) < 4:
+        time.sleep(0.01)
+    slots.release()
+    for thread in threads:
+        thread.join(5)
+    assert order[0] == INTERACTIVE
+
+
+def test_streamed_static_map_releases_its_slot_when_done(tmp_path):
+    slots = SlotLimiter(1)
+    with StubTmapServer() as stub:
+        tmap = TmapAPI(app_key="stub", base_url=stub.base_url, slot_limiter=slots)
+        assert tmap.static_map(126.97, 37.55, 127.02, 37.49, file_path=str(tmp_path / "map.png"), stream=True)
+        assert slots.snapshot()["in_flight"] == 0
+        assert tmap.reverse_geocoding(37.5665, 126.978)
+    assert (tmp_path / "map.png").read_bytes().startswith(b"\x89PNG")
+    assert slots.snapshot()["in_flight"] == 0
@@ -0,0 +1,74 @@
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from tmap_api import TmapAPI  # noqa: E402
+from tmap_api.simplify import DOUGLAS_PEUCKER, METHODS, VISVALINGAM, simplify_line, simplify_route  # noqa: E402
+from tmap_api.stub_server import StubTmapServer  # noqa: E402
+
+# 위도 1도 ≈ 111km이므로 1e-5도 ≈ 1.1m
+STEP = 1e-5
+
+
+def wiggly_line(n=200, amplitude=0.2):
+    """동쪽으로 가면서 위도 방향으로 약 amplitude × 1.1m 흔들리는 선"""
+    return [[127.0 + i * STEP * 10, 37.5 + amplitude * STEP * math.sin(i)] for i in range(n)]
+
+
+def distance_to_polyline_m(point, line):
+    scale = np.array([math.cos(math.radians(37.5)), 1.0]) * 111195.0
+    p = np.asarray(point) * scale
+    best = float("inf")
+    for a, b in zip(line, line[1:]):
+        a, b = np.asarray(a) * scale, np.asarray(b) * scale
+        ab = b - a
+        t = 0.0 if not ab.any() else max(0.0, min(1.0, float((p - a) @ ab / (ab @ ab))))
+        best = min(best, float(np.hypot(*(p - (a + t * ab)))))
+    return best
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_straight_line_collapses_to_endpoints(method):
+    line = [[127.0 + i * STEP, 37.5] for i in range(50)]
+    assert simplify_line(line, 1.0, method) == [line[0], line[-1]]
+
+
+def test_douglas_peucker_stays_within_tolerance():
+    line = wiggly_line(amplitude=3.0)
+    reduced = simplify_line(line, 1.0, DOUGLAS_PEUCKER)
+    assert 2 < len(reduced) < len(line)
+    assert reduced[0] == line[0] and reduced[-1] == line[-1]
+    assert max(distance_to_polyline_m(point, reduced) for point in line) <= 1.0 + 1e-6
+
+
+def test_visvalingam_removes_small_wiggles_only():
+    line = wiggly_line(amplitude=0.2)
+    assert len(simplify_line(line, 5.0, VISVALINGAM)) < len(line) // 4
+    assert simplify_line(line, 0, VISVALINGAM) is line
+
+
+def test_simplify_route_copies_and_reports():
+    line = wiggly_line()
+    route = {"type": "FeatureCollection", "features": [
+        {"type": "Feature", "geometry": {"type": "LineString", "coordinates": line}, "properties": {}},
+        {"type": "Feature", "geometry": {"type": "Point", "coordinates": line[0]}, "properties": {}},
+    ]}
+    simplified = simplify_route(route, 1.0)
+    assert route["features"][0]["geometry"]["coordinates"] is line
+    assert simplified["features"][1] == route["features"][1]
+    info = simplified["_simplified"]
+    assert info["vertices"] + info["removed"] == len(line) and info["removed"] > 0
+
+
+def test_car_route_simplification_against_stub():
+    with StubTmapServer() as stub:
+        tmap = TmapAPI(app_key="stub", base_url=stub.base_url)
+        full = tmap.car_route(126.97, 37.55, 127.02, 37.49)
+        reduced = tmap.car_route(126.97, 37.55, 127.02, 37.49, simplify_tolerance=5)
+    count = lambda result: sum(len(f["geometry"]["coordinates"]) for f in result["features"]
+                               if f["geometry"]["type"] == "LineString")
+    assert "_simplified" not in full
+    assert count(reduced) < count(full)
+    assert reduced["_simplified"]["removed"] == count(full) - count(reduced)
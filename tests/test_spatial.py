@@ -0,0 +1,62 @@
+from tmap_api import TileCache, TmapAPI, Tracer
+from tmap_api.spatial import haversine, tile_bounds, tile_for, tiles_covering
+from tmap_api.stub_server import StubTmapServer
+
+CENTER = (37.5665, 126.978)
+
+
+class ListExporter:
+    def __init__(self):
+        self.spans = []
+
+    def export(self, span):
+        self.spans.append(span)
+
+
+def test_tile_cache_hit_is_recorded_on_method_span():
+    exporter = ListExporter()
+    with StubTmapServer() as stub:
+        tmap = TmapAPI(app_key="stub", base_url=stub.base_url, tracer=Tracer(exporter))
+        assert tmap.search_poi_nearby(37.5665, 126.978, "카페", radius_m=300)
+        first = len(exporter.spans)
+        assert tmap.search_poi_nearby(37.5665, 126.978, "카페", radius_m=300)
+    miss = next(span for span in exporter.spans[:first] if span.name.endswith("search_poi_nearby"))
+    hit_spans = exporter.spans[first:]
+    assert [span.name for span in hit_spans if span.kind == "client"] == []
+    hit = next(span for span in hit_spans if span.name.endswith("search_poi_nearby"))
+    assert miss.attributes["cache.hit"] is False
+    assert miss.attributes["cache.tiles_missed"] > 0
+    assert hit.attributes["cache.hit"] is True
+    assert hit.attributes["cache.tiles_missed"] == 0
+
+
+def test_tiles_covering_starts_with_center_tile_and_covers_the_circle():
+    tiles = tiles_covering(*CENTER, 500, 15)
+    assert tiles[0] == tile_for(*CENTER, 15)
+    south, west, north, east = tile_bounds(tiles[0])
+    assert south <= CENTER[0] < north and west <= CENTER[1] < east
+    # 원 위의 점은 모두 고른 타일 중 하나에 들어감
+    for lat, lon in ((37.5710, 126.978), (37.5620, 126.978), (37.5665, 126.9837), (37.5665, 126.9723)):
+        assert haversine(*CENTER, lat, lon) <= 510
+        assert tile_for(lat, lon, 15) in tiles
+
+
+def test_overlapping_searches_reuse_tiles():
+    with StubTmapServer() as stub:
+        tmap = TmapAPI(app_key="stub", base_url=stub.base_url, tile_cache=TileCache())
+        first = tmap.search_poi_nearby(*CENTER, "카페", radius_m=400, limit=None)
+        second = tmap.search_poi_nearby(CENTER[0] + 0.001, CENTER[1], "카페", radius_m=400, limit=None)
+    assert first["tiles"]["fetched"] == first["tiles"]["total"]
+    assert second["tiles"]["fetched"] < second["tiles"]["total"]
+    assert first["pois"]
+    distances = [poi["distance_m"] for poi in first["pois"]]
+    assert distances == sorted(distances) and max(distances) <= 400
+    assert first["count"] == len(first["pois"]) and not first["truncated"]
+
+
+def test_tile_cache_is_keyed_by_api_host():
+    cache = TileCache()
+    with StubTmapServer() as a, StubTmapServer() as b:
+        first = TmapAPI(app_key="stub", base_url=a.base_url, tile_cache=cache).search_poi_nearby(*CENTER, "카페")
+        second = TmapAPI(app_key="stub", base_url=b.base_url, tile_cache=cache).search_poi_nearby(*CENTER, "카페")
+    assert first["tiles"]["fetched"] == second["tiles"]["fetched"] > 0
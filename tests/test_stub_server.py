@@ -0,0 +1,69 @@
+import json
+import statistics
+from urllib.request import urlopen
+
+import pytest
+import requests
+
+from tmap_api.stub_server import LatencyModel, StubConfig, StubTmapServer
+
+
+@pytest.mark.parametrize("spec, median", [
+    ("fixed:0.05", 0.05),
+    ("uniform:0.01,0.03", 0.02),
+    ("lognormal:0.08,0.5", 0.08),
+    ("exponential:0.05", 0.05 * 0.693),
+    (0.02, 0.02),
+])
+def test_latency_models(spec, median):
+    model = LatencyModel.parse(spec, seed=1)
+    samples = [model.sample() for _ in range(4000)]
+    assert min(samples) >= 0
+    assert statistics.median(samples) == pytest.approx(median, rel=0.1)
+
+
+def test_unknown_latency_model_is_rejected():
+    with pytest.raises(ValueError):
+        LatencyModel.parse("pareto:1,2")
+
+
+def test_injected_error_rates_are_reproducible():
+    config = StubConfig(error_rates={503: 0.2, 429: 0.1}, seed=7)
+    errors = [config.injected_error("/tmap/pois") for _ in range(5000)]
+    assert errors.count(503) / 5000 == pytest.approx(0.2, abs=0.02)
+    assert errors.count(429) / 5000 == pytest.approx(0.1, abs=0.02)
+    again = StubConfig(error_rates={503: 0.2, 429: 0.1}, seed=7)
+    assert [again.injected_error("/tmap/pois") for _ in range(5000)] == errors
+
+
+def test_path_error_rates_override_the_default():
+    config = StubConfig(error_rates={503: 1.0}, path_error_rates={"/tmap/geo": {}})
+    assert config.injected_error("/tmap/pois") == 503
+    assert config.injected_error("/tmap/geo/reversegeocoding") is None
+
+
+def test_quota_rate_limit_and_invalid_keys():
+    with StubTmapServer(quota=3, rate=100, valid_keys=["good"]) as stub:
+        url = f"{stub.base_url}/tmap/geo/reversegeocoding?lat=37.5&lon=127.0"
+        assert [requests.get(url, headers={"appKey": "good"}).status_code for _ in range(4)] == [200, 200, 200, 429]
+        assert requests.get(url, headers={"appKey": "good"}).json()["error"]["code"] == "QUOTA_EXCEEDED"
+        assert requests.get(url, headers={"appKey": "bad"}).status_code == 401
+        with urlopen(f"{stub.base_url}/_stub/stats") as response:
+            stats = json.load(response)
+    assert stats["usage"] == {"good": 3}
+
+    with StubTmapServer(rate=2) as stub:
+        url = f"{stub.base_url}/tmap/geo/reversegeocoding?lat=37.5&lon=127.0"
+        codes = [requests.get(url, headers={"appKey": "k"}).status_code for _ in range(3)]
+    assert codes == [200, 200, 429]
+
+
+def test_gzip_is_opt_in():
+    with StubTmapServer() as stub:
+        plain = requests.get(f"{stub.base_url}/tmap/pois?searchKeyword=카페&count=45", headers={"appKey": "k"})
+    with StubTmapServer(gzip_min_size=1024) as stub:
+        compressed = requests.get(f"{stub.base_url}/tmap/pois?searchKeyword=카페&count=45", headers={"appKey": "k"})
+    assert plain.status_code == compressed.status_code == 200
+    assert "Content-Encoding" not in plain.headers
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert compressed.json() == plain.json()
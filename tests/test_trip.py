@@ -0,0 +1,34 @@
+from tmap_api import TmapAPI, is_error
+from tmap_api.stub_server import StubTmapServer
+from tmap_api.trip import parse_modes, plan_trip, summarize_transit
+
+
+def test_parse_modes():
+    assert parse_modes(None) == ["car", "pedestrian", "transit"]
+    assert parse_modes("transit, car,car") == ["transit", "car"]
+
+
+def test_summarize_transit_without_plan_is_no_route():
+    result = summarize_transit({"result": {"status": 11, "message": "출발지/도착지 간 거리가 가까워서 탐색된 결과 없음"}})
+    assert is_error(result)
+    assert result.code == "NO_ROUTE"
+    assert result["error"]["detail"]["status"] == 11
+
+
+def test_plan_trip_keeps_other_modes_when_transit_has_no_route():
+    with StubTmapServer() as stub:
+        tmap = TmapAPI(app_key="stub", base_url=stub.base_url)
+        trip = plan_trip(tmap, "서울역", "서울역")
+    assert trip["modes"]["transit"].code == "NO_ROUTE"
+    assert trip["modes"]["car"]["time_s"] is not None
+    assert trip["modes"]["pedestrian"]["time_s"] is not None
+    assert trip["fastest"] in ("car", "pedestrian")
+
+
+def test_plan_trip_compares_all_modes():
+    with StubTmapServer() as stub:
+        tmap = TmapAPI(app_key="stub", base_url=stub.base_url)
+        trip = plan_trip(tmap, "서울역", "강남역")
+    assert set(trip["modes"]) == {"car", "pedestrian", "transit"}
+    assert trip["modes"]["transit"]["options"]
+    assert trip["fastest"] is not None
@@ -0,0 +1,63 @@
+import os
+
+import pytest
+
+from tmap_api import CacheWarmer, ResponseCache, TmapAPI
+from tmap_api.cache import DEFAULT_POLICIES, OPTIONAL_POLICIES, CachePolicy, parse_policies
+from tmap_api.rate_limit import BACKGROUND, current_priority
+from tmap_api.stub_server import StubTmapServer
+from tmap_api.warmup import load_warmup_config, warmup_tasks
+
+EXAMPLE = os.path.join(os.path.dirname(os.path.dirname(__file__)), "warmup.example.json")
+
+
+def test_example_config_expands_to_tasks():
+    config = load_warmup_config(EXAMPLE)
+    tasks = list(warmup_tasks(object(), config))
+    endpoints = [endpoint for _, endpoint, _ in tasks]
+    assert endpoints.count("get_subway_congestion") == 4
+    assert {"get_poi_detail", "search_poi_keyword", "full_text_geocoding", "car_route",
+            "pedestrian_route_detail", "public_transit_route_summary"} <= set(endpoints)
+    assert len({name for name, _, _ in tasks}) == len(tasks)
+
+
+def test_warmer_fills_cache_in_background_lane_and_enables_route_policies():
+    config = load_warmup_config(EXAMPLE)
+    with StubTmapServer() as stub:
+        cache = ResponseCache()
+        tmap = TmapAPI(app_key="stub", base_url=stub.base_url, response_cache=cache)
+        lanes = set()
+        fetch = tmap._fetch
+
+        def recording_fetch(*args, **kwargs):
+            lanes.add(current_priority())
+            return fetch(*args, **kwargs)
+
+        tmap._fetch = recording_fetch
+        warmer = CacheWarmer(tmap, config).start()
+        assert warmer.wait(30)
+        assert "car_route" in warmer.snapshot()["enabled_policies"]
+        assert warmer.snapshot()["done"] == len(warmer.tasks) and not warmer.snapshot()["failed"]
+        assert lanes == {BACKGROUND}
+
+        route = tmap.car_route(126.9707, 37.5547, 127.0276, 37.4979)
+        keyword = tmap.search_poi_keyword("서울역")
+    assert route["_cache"]["stale"] is False
+    assert keyword["_cache"]["stale"] is False
+
+
+def test_routes_are_not_cached_by_default():
+    assert "car_route" not in DEFAULT_POLICIES and "car_route" in OPTIONAL_POLICIES
+    cache = ResponseCache()
+    assert not cache.applies("car_route")
+    assert cache.enable("car_route") and cache.applies("car_route")
+    assert not cache.enable("car_route")
+
+
+def test_parse_policies():
+    policies = parse_policies("car_route, get_poi_detail=10:20, realtime_place_congestion=0")
+    assert policies["car_route"] == OPTIONAL_POLICIES["car_route"]
+    assert policies["get_poi_detail"] == CachePolicy(10, 20)
+    assert "realtime_place_congestion" not in policies
+    with pytest.raises(ValueError):
+        parse_policies("unknown_endpoint")
@@ -1,3 +1,18 @@
 from .tmap_api import TmapAPI
+from .address import normalize_address, split_address
+from .cache import BudgetStore, CachePolicy, ResponseCache
+from .circuit_breaker import CircuitBreakers
+from .coords import convert as convert_coords
+from .deadline import DeadlineExceeded, deadline
+from .errors import TmapError, is_error
+from .hedging import HedgePolicy
+from .http2 import HttpxAdapter
+from .image_cache import StaticMapCache
+from .key_pool import KeyPool
+from .metrics import TmapMetrics
+from .rate_limit import RateLimiter, SlotLimiter, priority
+from .spatial import TileCache
+from .tracing import Tracer, create_tracer
+from .warmup import CacheWarmer
 
-__all__ = ['TmapAPI'] 
\ No newline at end of file
+__all__ = ['TmapAPI', 'TmapError', 'is_error', 'normalize_address', 'split_address', 'StaticMapCache', 'ResponseCache', 'CachePolicy', 'BudgetStore', 'convert_coords', 'KeyPool', 'CircuitBreakers', 'HedgePolicy', 'HttpxAdapter', 'TmapMetrics', 'Tracer', 'create_tracer', 'RateLimiter', 'SlotLimiter', 'TileCache', 'priority', 'deadline', 'DeadlineExceeded', 'CacheWarmer']
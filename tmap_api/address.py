@@ -0,0 +1,143 @@
+"""
+한국 주소 정규화
+
+같은 주소가 "서울시 중구 세종대로 110", "서울특별시 중구 세종대로110"처럼 여러 표기로 들어오면
+표기마다 업스트림 호출과 캐시 항목이 따로 생깁니다. normalize_address는 시도 약칭,
+띄어쓰기, 도로명/지번 표기를 하나의 표기로 맞추고, split_address는 자유 형식 주소를
+geocoding에 필요한 (시도, 시군구, 읍면동) 세 부분으로 나눕니다.
+"""
+
+import re
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+# 정식 시도 이름 -> 약칭 목록
+PROVINCES: Dict[str, Tuple[str, ...]] = {
+    "서울특별시": ("서울", "서울시"),
+    "부산광역시": ("부산", "부산시"),
+    "대구광역시": ("대구", "대구시"),
+    "인천광역시": ("인천", "인천시"),
+    "광주광역시": (),
+    "대전광역시": ("대전", "대전시"),
+    "울산광역시": ("울산", "울산시"),
+    "세종특별자치시": ("세종", "세종시"),
+    "경기도": ("경기",),
+    "강원특별자치도": ("강원", "강원도"),
+    "충청북도": ("충북",),
+    "충청남도": ("충남",),
+    "전북특별자치도": ("전북", "전라북도"),
+    "전라남도": ("전남",),
+    "경상북도": ("경북",),
+    "경상남도": ("경남",),
+    "제주특별자치도": ("제주", "제주도"),
+}
+
+# "광주", "광주시"는 경기도 광주시와 겹치므로 뒤에 자치구 이름이 올 때만 광주광역시로 봄
+_GWANGJU_DISTRICTS = ("동구", "서구", "남구", "북구", "광산구")
+
+_PROVINCE_ALIASES: Dict[str, str] = {name: name for name in PROVINCES}
+for _name, _aliases in PROVINCES.items():
+    for _alias in _aliases:
+        _PROVINCE_ALIASES[_alias] = _name
+
+_DASHES = re.compile(r"[‐-―−－]")
+_SPACES = re.compile(r"\s+")
+_PARENTHESES = re.compile(r"\s*\([^)]*\)")
+# "세종대로 23 길" / "성남대로 331 번길" -> "세종대로23길" / "성남대로331번길"
+_NUMBERED_ROAD = re.compile(r"(?<=[가-힣])(로|길)\s*(\d+)\s*(번길|길)")
+# "세종대로110" -> "세종대로 110" (도로명 뒤 건물번호 띄어쓰기)
+_BUILDING_NUMBER = re.compile(r"(?<=[가-힣\d])(로|길)(\d+(?:-\d+)?)(?![\d\-가길로번])")
+# "태평로 1가" -> "태평로1가"
+_GA_DONG = re.compile(r"(?<=[가-힣])\s+(\d+가)(?=\s|$)")
+# "31 번지", "12-3번지" -> "31", "12-3" / "산 12" -> "산12"
+_LOT_SUFFIX = re.compile(r"(\d+(?:-\d+)?)\s*번지")
+_MOUNTAIN_LOT = re.compile(r"(?<![가-힣])산\s+(\d)")
+_HYPHEN = re.compile(r"(\d)\s*-\s*(\d)")
+_LOT_NUMBER = re.compile(r"산?\d+(?:-\d+)?")
+
+
+def _canonical_province(tokens: List[str]) -> List[str]:
+    if not tokens:
+        return tokens
+    first = tokens[0]
+    if first in ("광주", "광주시"):
+        if len(tokens) > 1 and tokens[1] in _GWANGJU_DISTRICTS:
+            return ["광주광역시"] + tokens[1:]
+        return tokens
+    province = _PROVINCE_ALIASES.get(first)
+    if province is not None:
+        return [province] + tokens[1:]
+    return tokens
+
+
+def normalize_address(address: str) -> str:
+    """
+    주소 표기를 정규화
+
+    - 유니코드 NFKC 정규화 (전각 숫자, macOS의 자모 분리형 한글 등)
+    - 괄호 참고 항목, "대한민국" 접두어 제거, 연속 공백 정리
+    - 시도 약칭을 정식 명칭으로 ("서울시" -> "서울특별시", "경기" -> "경기도")
+    - 도로명과 건물번호 띄어쓰기 ("세종대로110" -> "세종대로 110")
+    - 번길/길 도로명 붙여쓰기 ("성남대로 331번길" -> "성남대로331번길")
+    - 지번 표기 ("31번지" -> "31", "산 12" -> "산12", "12 - 3" -> "12-3")
+
+    Args:
+        address: 자유 형식 주소
+
+    Returns:
+        정규화한 주소 (같은 주소의 여러 표기는 같은 문자열이 됨)
+    """
+    text = unicodedata.normalize("NFKC", address)
+    text = _DASHES.sub("-", text)
+    text = _PARENTHESES.sub(" ", text)
+    text = text.replace(",", " ")
+    text = _HYPHEN.sub(r"\1-\2", text)
+    text = _LOT_SUFFIX.sub(r"\1", text)
+    text = _MOUNTAIN_LOT.sub(r"산\1", text)
+    text = _NUMBERED_ROAD.sub(r"\1\2\3", text)
+    text = _BUILDING_NUMBER.sub(r"\1 \2", text)
+    text = _GA_DONG.sub(r"\1", text)
+    tokens = _SPACES.split(text.strip())
+    if tokens and tokens[0] == "대한민국":
+        tokens = tokens[1:]
+    return " ".join(_canonical_province(tokens))
+
+
+def normalize_province(city_do: str) -> str:
+    """시도 이름만 정식 명칭으로 정규화 (모르는 이름은 공백만 정리)"""
+    name = _SPACES.sub("", unicodedata.normalize("NFKC", city_do))
+    return _PROVINCE_ALIASES.get(name, name)
+
+
+def split_address(address: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    자유 형식 주소를 geocoding에 필요한 (시도, 시군구, 읍면동 또는 도로명)으로 분리
+
+    시군구는 "성남시 분당구"처럼 시와 구가 함께 있으면 둘 다 담습니다.
+
+    Args:
+        address: 자유 형식 주소
+
+    Returns:
+        (city_do, gu_gun, dong) 튜플 (찾지 못한 부분은 None)
+
+    사용 예:
+        split_address("서울시 중구 태평로1가 31")  # ("서울특별시", "중구", "태평로1가")
+    """
+    tokens = normalize_address(address).split(" ") if address.strip() else []
+    city_do = gu_gun = dong = None
+    index = 0
+    if tokens and tokens[0] in PROVINCES:
+        city_do = tokens[0]
+        index = 1
+
+    districts = []
+    while index < len(tokens) and tokens[index][-1] in "시군구" and len(tokens[index]) > 1:
+        districts.append(tokens[index])
+        index += 1
+    if districts:
+        gu_gun = " ".join(districts)
+
+    if index < len(tokens) and not _LOT_NUMBER.fullmatch(tokens[index]):
+        dong = tokens[index]
+    return city_do, gu_gun, dong
@@ -0,0 +1,469 @@
+import contextvars
+import hashlib
+import heapq
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+from .errors import TmapError
+from .log import logger
+from .metrics import TmapMetrics
+from .rate_limit import BACKGROUND, priority
+from .tracing import current_span
+
+_SECRET_KEYS = {"appKey", "appkey"}
+
+
+class CachePolicy(NamedTuple):
+    """
+    엔드포인트별 캐시 정책
+
+    ttl초까지는 그대로 응답하고, ttl + max_stale초까지는 오래된 값을 바로 응답하면서
+    백그라운드에서 한 번만 갱신합니다(stale-while-revalidate). 그 이후에는 새로 조회합니다.
+    """
+    ttl: float
+    max_stale: float = 0.0
+
+
+# 기본 캐시 정책 (초): 혼잡도는 짧게, POI/주소 정보는 길게
+DEFAULT_POLICIES: Dict[str, CachePolicy] = {
+    "realtime_place_congestion": CachePolicy(ttl=60, max_stale=600),
+    "get_poi_detail": CachePolicy(ttl=3600, max_stale=86400),
+    "search_poi_keyword": CachePolicy(ttl=600, max_stale=3600),
+    "geocoding": CachePolicy(ttl=86400, max_stale=7 * 86400),
+    "full_text_geocoding": CachePolicy(ttl=86400, max_stale=7 * 86400),
+    "reverse_geocoding": CachePolicy(ttl=86400, max_stale=7 * 86400),
+}
+
+# 기본으로는 캐시하지 않는 경로/지하철 통계 엔드포인트의 정책 (초)
+# 캐시 예열 대상이거나 TMAP_CACHE_POLICIES로 지정한 경우에만 켜며, car_route는 실시간 교통이 반영된
+# 결과라 캐시하면 최대 ttl + max_stale초 지난 소요 시간을 반환할 수 있음
+OPTIONAL_POLICIES: Dict[str, CachePolicy] = {
+    "car_route": CachePolicy(ttl=300, max_stale=600),
+    "pedestrian_route_detail": CachePolicy(ttl=86400, max_stale=7 * 86400),
+    "public_transit_route": CachePolicy(ttl=3600, max_stale=86400),
+    "public_transit_route_summary": CachePolicy(ttl=3600, max_stale=86400),
+    "get_subway_congestion": CachePolicy(ttl=86400, max_stale=7 * 86400),
+    "get_subway_car_congestion": CachePolicy(ttl=86400, max_stale=7 * 86400),
+    "get_subway_car_getoff_rate": CachePolicy(ttl=86400, max_stale=7 * 86400),
+}
+
+
+def parse_policies(text: Optional[str]) -> Dict[str, CachePolicy]:
+    """
+    "car_route,get_subway_congestion=3600:86400,search_poi_keyword=0" 형식의 캐시 정책
+
+    엔드포인트 이름만 쓰면 OPTIONAL_POLICIES(또는 DEFAULT_POLICIES)의 정책을, "=ttl" 또는
+    "=ttl:max_stale"을 붙이면 그 값을 사용하며, ttl이 0이면 그 엔드포인트는 캐시하지 않습니다.
+    반환값은 DEFAULT_POLICIES에 지정한 정책을 반영한 전체 정책입니다.
+    """
+    policies = dict(DEFAULT_POLICIES)
+    for item in (text or "").split(","):
+        if not item.strip():
+            continue
+        name, _, value = item.partition("=")
+        name = name.strip()
+        if not value.strip():
+            policy = OPTIONAL_POLICIES.get(name) or DEFAULT_POLICIES.get(name)
+            if policy is None:
+                raise ValueError(f"기본 캐시 정책이 없는 엔드포인트입니다. ttl을 지정해 주세요: {name}")
+        else:
+            ttl, _, max_stale = value.partition(":")
+            policy = CachePolicy(ttl=float(ttl), max_stale=float(max_stale or 0))
+        if policy.ttl <= 0:
+            policies.pop(name, None)
+        else:
+            policies[name] = policy
+    return policies
+
+
+class CacheEntry(NamedTuple):
+    """캐시에 저장하는 응답과 조회 시각(유닉스 시간)"""
+    value: Dict[str, Any]
+    fetched_at: float
+
+
+def estimate_size(value: Any) -> int:
+    """
+    JSON 값이 프로세스 메모리에서 차지하는 대략적인 바이트 수
+
+    딕셔너리, 리스트와 그 안의 키/값 객체 크기(sys.getsizeof)의 합이며, 같은 객체를 여러 번
+    참조하면 중복해서 셉니다.
+    """
+    size = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return size
+
+
+class _SizedEntry(NamedTuple):
+    entry: CacheEntry
+    endpoint: str
+    size: int
+    hits: int
+    priority: float
+
+
+class BudgetStore:
+    """
+    전체 크기를 바이트 예산(max_bytes) 안으로 유지하는 메모리 캐시 저장소
+
+    항목마다 대략적인 메모리 크기를 계산해 두고, 예산을 넘으면 GDSF(Greedy-Dual-Size-Frequency)
+    우선순위 ``L + 적중 횟수 / 크기``가 가장 낮은 항목부터 지웁니다. 크고 드물게 쓰는 경로
+    상세 응답이 작고 자주 쓰는 POI/주소 응답보다 먼저 밀려나며, 지운 항목의 우선순위로
+    L을 올려 오래전에 자주 쓰인 항목도 결국 밀려나게 합니다.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, max_entry_bytes: Optional[int] = None):
+        """
+        Args:
+            max_bytes: 전체 캐시 메모리 예산(바이트)
+            max_entry_bytes: 항목 하나의 최대 크기 (None이면 max_bytes의 1/4, 넘는 응답은 저장하지 않음)
+        """
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes if max_entry_bytes is not None else max_bytes // 4
+        self.evictions = 0
+        self.rejected = 0
+        self._entries: Dict[str, _SizedEntry] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._inflation = 0.0
+        self._bytes = 0
+        self._endpoints: Dict[str, List[int]] = {}
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def _push(self, key: str, priority: float) -> None:
+        # 갱신된 항목의 이전 힙 항목은 지우지 않고 꺼낼 때 우선순위를 비교해 건너뜀
+        self._seq += 1
+        heapq.heappush(self._heap, (priority, self._seq, key))
+        if len(self._heap) > 4 * len(self._entries) + 64:
+            self._heap = [(item.priority, 0, key) for key, item in self._entries.items()]
+            heapq.heapify(self._heap)
+
+    def _account(self, item: _SizedEntry, sign: int) -> None:
+        self._bytes += sign * item.size
+        usage = self._endpoints.setdefault(item.endpoint, [0, 0])
+        usage[0] += sign
+        usage[1] += sign * item.size
+        if usage[0] == 0:
+            del self._endpoints[item.endpoint]
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            hits = item.hits + 1
+            priority = self._inflation + hits / item.size
+            self._entries[key] = item._replace(hits=hits, priority=priority)
+            self._push(key, priority)
+            return item.entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        size = estimate_size(entry.value) + sys.getsizeof(key)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._account(old, -1)
+            if size > self.max_entry_bytes:
+                self.rejected += 1
+                return
+            hits = old.hits if old is not None else 1
+            item = _SizedEntry(entry, key.split(":", 1)[0], size, hits, self._inflation + hits / size)
+            self._entries[key] = item
+            self._account(item, 1)
+            self._push(key, item.priority)
+            self._evict()
+
+    def _evict(self) -> None:
+        # _lock을 잡은 상태에서 호출
+        while self._bytes > self.max_bytes and self._heap:
+            priority, _, key = heapq.heappop(self._heap)
+            item = self._entries.get(key)
+            if item is None or item.priority != priority:
+                continue
+            del self._entries[key]
+            self._account(item, -1)
+            self._inflation = priority
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            item = self._entries.pop(key, None)
+            if item is not None:
+                self._account(item, -1)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._heap.clear()
+            self._endpoints.clear()
+            self._bytes = 0
+            self._inflation = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """엔드포인트별 항목 수와 대략적인 메모리 크기(바이트)"""
+        with self._lock:
+            return {endpoint: {"entries": count, "bytes": size}
+                    for endpoint, (count, size) in sorted(self._endpoints.items())}
+
+    def usage(self) -> Dict[str, Any]:
+        """전체 사용량, 예산, 축출/저장 거부 횟수"""
+        with self._lock:
+            return {"bytes": self._bytes, "max_bytes": self.max_bytes, "entries": len(self._entries),
+                    "evictions": self.evictions, "rejected": self.rejected}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    value BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at);
+"""
+
+
+class SQLiteStore:
+    """
+    같은 호스트의 여러 프로세스가 함께 쓰는 SQLite(WAL 모드) 캐시 저장소
+
+    Cursor 창마다 따로 뜬 MCP 서버가 같은 파일을 가리키면, 한 서버가 조회한 응답을
+    다른 서버들도 바로 캐시 적중으로 사용합니다. WAL 모드라 읽기는 쓰기를 막지 않으며,
+    동시 쓰기는 busy_timeout 동안 기다립니다. 항목 수가 max_entries를 넘으면
+    마지막 사용 시각이 오래된 순으로 지웁니다. 값은 zlib으로 압축한 JSON입니다.
+    """
+
+    def __init__(self, path: str, max_entries: int = 100000, busy_timeout: float = 5.0,
+                 touch_interval: float = 60.0, evict_every: int = 256):
+        """
+        Args:
+            path: SQLite 파일 경로 (디렉토리가 없으면 생성)
+            max_entries: 보관할 최대 항목 수
+            busy_timeout: 다른 프로세스가 쓰는 중일 때 기다릴 최대 시간(초)
+            touch_interval: 조회 시 마지막 사용 시각을 갱신하는 최소 간격(초, 읽기마다 쓰지 않도록)
+            evict_every: 몇 번 저장할 때마다 항목 수를 확인할지
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self.touch_interval = touch_interval
+        self.evict_every = evict_every
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=busy_timeout, check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SQLITE_SCHEMA)
+        self._sets = 0
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at, accessed_at, value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            fetched_at, accessed_at, value = row
+            now = time.time()
+            if now - accessed_at >= self.touch_interval:
+                self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+        return CacheEntry(json.loads(zlib.decompress(value)), fetched_at)
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        value = zlib.compress(json.dumps(entry.value, ensure_ascii=False).encode("utf-8"), 6)
+        endpoint = key.split(":", 1)[0]
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, endpoint, fetched_at, accessed_at, size, value)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, endpoint, entry.fetched_at, time.time(), len(value), value))
+            self._sets += 1
+            if self._sets % self.evict_every == 0:
+                self._evict()
+
+    def _evict(self) -> None:
+        # _lock을 잡은 상태에서 호출
+        count = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        if count > self.max_entries:
+            self._conn.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY accessed_at LIMIT ?)",
+                (count - self.max_entries,))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    def stats(self) -> Dict[str, Any]:
+        """엔드포인트별 항목 수와 압축된 크기(바이트)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT endpoint, COUNT(*), SUM(size) FROM entries GROUP BY endpoint").fetchall()
+        return {endpoint: {"entries": count, "bytes": size} for endpoint, count, size in rows}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+def cache_key(endpoint: str, method: str, url: str, params: Optional[Dict[str, Any]] = None,
+              body: Optional[Dict[str, Any]] = None) -> str:
+    """
+    앱 키를 뺀 정규화된 요청(메서드, 호스트, 경로, 정렬된 파라미터와 본문)의 SHA-1 키
+
+    호스트를 포함하므로 스텁 서버나 다른 base_url로 받은 응답이 실제 API 응답과 같은 키를 갖지 않습니다.
+    """
+    query = sorted((k, str(v)) for k, v in (params or {}).items() if k not in _SECRET_KEYS)
+    payload = {k: v for k, v in (body or {}).items() if k not in _SECRET_KEYS}
+    parts = urlsplit(url)
+    normalized = json.dumps([method.upper(), parts.netloc, parts.path, query, payload],
+                            ensure_ascii=False, sort_keys=True)
+    return f"{endpoint}:{hashlib.sha1(normalized.encode('utf-8')).hexdigest()}"
+
+
+class ResponseCache:
+    """
+    stale-while-revalidate 방식의 JSON 응답 캐시
+
+    캐시에서 응답한 경우 응답 딕셔너리에 ``_cache: {"age": 초, "stale": bool}``를 덧붙여
+    데이터가 얼마나 오래되었는지 알려줍니다. 실패 응답(TmapError)은 캐시하지 않습니다.
+    """
+
+    def __init__(self, policies: Optional[Dict[str, CachePolicy]] = None, store: Optional[Any] = None,
+                 metrics: Optional[TmapMetrics] = None, refresh_workers: int = 2):
+        """
+        응답 캐시 초기화
+
+        Args:
+            policies: 엔드포인트별 캐시 정책 (None이면 DEFAULT_POLICIES, 정책이 없는 엔드포인트는 캐시하지 않음)
+            store: 캐시 저장소 (get/set/delete/clear 메서드 제공, None이면 256MB 예산의 BudgetStore)
+            metrics: 적중률을 기록할 계측 수집기 (선택적)
+            refresh_workers: 백그라운드 갱신 스레드 수
+        """
+        self.policies = dict(DEFAULT_POLICIES if policies is None else policies)
+        self.store = store if store is not None else BudgetStore()
+        self.metrics = metrics
+        self._refreshing: Set[str] = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix="tmap-cache-refresh")
+
+    def applies(self, endpoint: str) -> bool:
+        return endpoint in self.policies
+
+    def enable(self, endpoint: str) -> bool:
+        """
+        정책이 없는 엔드포인트에 OPTIONAL_POLICIES의 정책을 켬 (예열 대상 엔드포인트에 사용)
+
+        Returns:
+            새로 켰으면 True (이미 정책이 있거나 권장 정책이 없으면 False)
+        """
+        with self._lock:
+            if endpoint in self.policies or endpoint not in OPTIONAL_POLICIES:
+                return False
+            self.policies[endpoint] = OPTIONAL_POLICIES[endpoint]
+            return True
+
+    def get_or_fetch(self, endpoint: str, key: str,
+                     fetch: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        캐시된 응답을 반환하거나 fetch로 조회해 저장
+
+        Args:
+            endpoint: 엔드포인트 이름 (캐시 정책 조회에 사용)
+            key: cache_key로 만든 요청 키
+            fetch: 실제 API를 호출해 응답 또는 TmapError를 반환하는 함수
+
+        Returns:
+            응답 데이터 (캐시 적중 시 _cache 필드 포함) 또는 실패시 TmapError
+        """
+        policy = self.policies[endpoint]
+        entry = self.store.get(key)
+        if entry is not None:
+            age = time.time() - entry.fetched_at
+            if age <= policy.ttl:
+                self._record(endpoint, hit=True)
+                return self._with_age(entry.value, age, stale=False)
+            if age <= policy.ttl + policy.max_stale:
+                self._record(endpoint, hit=True, stale=True)
+                self._refresh(endpoint, key, fetch)
+                return self._with_age(entry.value, age, stale=True)
+
+        self._record(endpoint, hit=False)
+        return self._fetch_and_store(key, fetch)
+
+    def _fetch_and_store(self, key: str, fetch: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        value = fetch()
+        if isinstance(value, dict) and not isinstance(value, TmapError):
+            self.store.set(key, CacheEntry(value, time.time()))
+        return value
+
+    def _refresh(self, endpoint: str, key: str, fetch: Callable[[], Dict[str, Any]]) -> None:
+        """키당 하나의 백그라운드 갱신만 실행"""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run() -> None:
+            try:
+                self._fetch_and_store(key, fetch)
+            except Exception:
+                logger.exception("캐시 갱신 실패", extra={"endpoint": endpoint})
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        # 갱신 요청이 조회한 쪽의 span 아래에 남고, 대화형 호출과 경쟁하지 않도록 background 레인으로 보냄
+        with priority(BACKGROUND):
+            context = contextvars.copy_context()
+        self._executor.submit(context.run, run)
+
+    def _record(self, endpoint: str, hit: bool, stale: bool = False) -> None:
+        # HTTP 요청 span이 없는 이유를 트레이스에서 알 수 있도록 현재 span에 캐시 적중 여부를 남김
+        span = current_span()
+        span.set_attribute("cache.hit", hit)
+        span.set_attribute("cache.stale", stale)
+        if self.metrics is not None:
+            self.metrics.record_cache(f"response.{endpoint}", hit, stale=stale)
+
+    @staticmethod
+    def _with_age(value: Dict[str, Any], age: float, stale: bool) -> Dict[str, Any]:
+        return {**value, "_cache": {"age": round(age, 3), "stale": stale}}
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """키 하나 또는 전체 캐시 삭제"""
+        if key is None:
+            self.store.clear()
+        else:
+            self.store.delete(key)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,385 @@
+"""
+TmapAPI 트래픽 녹화/재생(cassette)
+
+녹화 모드에서는 실제 TMAP 응답을 요청과 함께 SQLite 아카이브에 저장하고,
+재생 모드에서는 네트워크 없이 아카이브의 응답을 원래 지연 시간(또는 배속)으로 돌려줍니다.
+requests 전송 어댑터로 동작하므로 TmapAPI의 계측, 트레이싱, 오류 처리 경로를 그대로 거칩니다.
+
+아카이브 구조:
+    - 요청은 정규화(메서드, 경로, appKey를 뺀 정렬된 쿼리, 정렬된 JSON 본문)한 뒤 SHA-1 키로 색인
+    - 응답 본문은 zlib으로 압축해 저장
+    - 같은 요청이 여러 번 녹화되었으면 재생 시 녹화 순서대로 돌아가며 사용
+"""
+
+import argparse
+import atexit
+import hashlib
+import io
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# 요청 정규화와 저장 시 제외할 인증 파라미터
+_SECRET_KEYS = {"appKey", "appkey"}
+# 본문을 풀어서 저장하므로 재생 응답에 남기지 않을 헤더
+_DROP_HEADERS = {"content-encoding", "transfer-encoding", "content-length", "connection"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS interactions (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL,
+    ts REAL NOT NULL,
+    elapsed REAL NOT NULL,
+    method TEXT NOT NULL,
+    url TEXT NOT NULL,
+    request_body BLOB,
+    status INTEGER NOT NULL,
+    reason TEXT,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS interactions_key ON interactions (key, seq);
+"""
+
+
+class CassetteMiss(requests.ConnectionError):
+    """재생 모드에서 녹화되지 않은 요청을 받은 경우"""
+
+
+class Interaction(NamedTuple):
+    """녹화된 요청/응답 한 쌍"""
+    seq: int
+    key: str
+    ts: float
+    elapsed: float
+    method: str
+    url: str
+    request_body: Optional[bytes]
+    status: int
+    reason: str
+    headers: Dict[str, str]
+    body: bytes
+
+
+def _strip_secrets_from_url(url: str) -> str:
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in _SECRET_KEYS]
+    return parts._replace(query=urlencode(query)).geturl()
+
+
+def _strip_secrets_from_body(body: Optional[bytes]) -> Optional[bytes]:
+    if not body:
+        return None
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return body
+    if isinstance(data, dict):
+        data = {k: v for k, v in data.items() if k not in _SECRET_KEYS}
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def normalize_request(method: str, url: str, body: Optional[bytes]) -> str:
+    """
+    요청을 정규화한 문자열
+
+    호스트와 인증 파라미터(appKey)는 제외하므로 다른 키나 다른 base_url로 녹화한
+    요청도 같은 키를 가집니다.
+    """
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in _SECRET_KEYS)
+    normalized_body = _strip_secrets_from_body(body) or b""
+    return f"{method.upper()} {parts.path}?{urlencode(query)}\n{normalized_body.decode('utf-8', errors='replace')}"
+
+
+def request_key(method: str, url: str, body: Optional[bytes]) -> str:
+    """정규화한 요청의 SHA-1 키"""
+    return hashlib.sha1(normalize_request(method, url, body).encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    """
+    녹화/재생 아카이브
+
+    Args:
+        path: SQLite 아카이브 파일 경로
+        mode: "record" (실제 호출 후 저장) 또는 "replay" (아카이브에서 응답)
+        speed: 재생 배속 (1.0: 원래 지연 시간, 10.0: 10배 빠르게, 0: 지연 없이 즉시)
+        allow_network: 재생 모드에서 녹화되지 않은 요청을 실제로 호출할지 여부
+            (False이면 CassetteMiss 오류)
+        memory_entries: 재생 시 압축을 푼 응답을 메모리에 보관할 최대 개수
+    """
+
+    def __init__(self, path: str, mode: str = "replay", speed: float = 1.0,
+                 allow_network: bool = False, memory_entries: int = 4096):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"지원하지 않는 모드입니다: {mode}")
+        self.path = path
+        self.mode = mode
+        self.speed = speed
+        self.allow_network = allow_network
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._pending = 0
+        # 재생 시 키별로 다음에 돌려줄 녹화 순번
+        self._cursor: Dict[str, int] = {}
+        self._memory: "OrderedDict[str, List[Interaction]]" = OrderedDict()
+        self._memory_entries = memory_entries
+        if mode == "record":
+            # 프로세스 종료 시 아직 커밋하지 않은 녹화분 저장
+            atexit.register(self.flush)
+
+    def record(self, method: str, url: str, request_body: Optional[bytes], response: requests.Response,
+               elapsed: float) -> None:
+        """응답을 아카이브에 저장 (100건마다 커밋)"""
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _DROP_HEADERS}
+        row = (
+            request_key(method, url, request_body), time.time(), elapsed, method.upper(),
+            _strip_secrets_from_url(url), _strip_secrets_from_body(request_body),
+            response.status_code, response.reason or "", json.dumps(headers),
+            zlib.compress(response.content, 6),
+        )
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO interactions (key, ts, elapsed, method, url, request_body, status, reason, headers, body)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+            self._pending += 1
+            if self._pending >= 100:
+                self._conn.commit()
+                self._pending = 0
+
+    def _row_to_interaction(self, row: Tuple) -> Interaction:
+        seq, key, ts, elapsed, method, url, request_body, status, reason, headers, body = row
+        return Interaction(seq, key, ts, elapsed, method, url, request_body, status, reason or "",
+                           json.loads(headers), zlib.decompress(body))
+
+    def find(self, key: str) -> Optional[Interaction]:
+        """
+        키에 해당하는 녹화 응답 (같은 키가 여러 번 녹화되었으면 순서대로 돌아가며 반환)
+        """
+        with self._lock:
+            interactions = self._memory.get(key)
+            if interactions is None:
+                rows = self._conn.execute(
+                    "SELECT * FROM interactions WHERE key = ? ORDER BY seq", (key,)).fetchall()
+                interactions = [self._row_to_interaction(row) for row in rows]
+                self._memory[key] = interactions
+                if len(self._memory) > self._memory_entries:
+                    self._memory.popitem(last=False)
+            else:
+                self._memory.move_to_end(key)
+            if not interactions:
+                return None
+            index = self._cursor.get(key, 0)
+            self._cursor[key] = index + 1
+            return interactions[index % len(interactions)]
+
+    def iter_interactions(self) -> Iterator[Interaction]:
+        """녹화 순서대로 모든 요청/응답을 순회"""
+        with self._lock:
+            self._conn.commit()
+        conn = sqlite3.connect(self.path)
+        try:
+            for row in conn.execute("SELECT * FROM interactions ORDER BY seq"):
+                yield self._row_to_interaction(row)
+        finally:
+            conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """경로별 녹화 건수, 고유 요청 수, 저장된(압축된) 응답 바이트 수"""
+        with self._lock:
+            self._conn.commit()
+            rows = self._conn.execute(
+                "SELECT method, url, COUNT(*), COUNT(DISTINCT key), SUM(LENGTH(body)) FROM interactions"
+                " GROUP BY method, url").fetchall()
+        paths: Dict[str, Dict[str, int]] = {}
+        for method, url, count, unique, stored in rows:
+            entry = paths.setdefault(f"{method} {urlsplit(url).path}",
+                                     {"requests": 0, "unique": 0, "stored_bytes": 0})
+            entry["requests"] += count
+            entry["unique"] += unique
+            entry["stored_bytes"] += stored or 0
+        return paths
+
+    def flush(self) -> None:
+        with self._lock:
+            try:
+                self._conn.commit()
+            except sqlite3.ProgrammingError:
+                # 이미 닫힌 연결
+                pass
+            self._pending = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+    def mount(self, session: requests.Session) -> None:
+        """세션의 모든 http/https 요청이 이 카세트를 거치도록 전송 어댑터 장착"""
+        adapter = CassetteAdapter(self)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+
+class CassetteAdapter(HTTPAdapter):
+    """Cassette를 사용하는 requests 전송 어댑터"""
+
+    def __init__(self, cassette: Cassette, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    def send(self, request: requests.PreparedRequest, stream: bool = False, timeout: Any = None,
+             verify: Any = True, cert: Any = None, proxies: Any = None) -> requests.Response:
+        body = request.body.encode("utf-8") if isinstance(request.body, str) else request.body
+        cassette = self.cassette
+
+        if cassette.mode == "replay":
+            interaction = cassette.find(request_key(request.method, request.url, body))
+            if interaction is not None:
+                if cassette.speed > 0:
+                    time.sleep(interaction.elapsed / cassette.speed)
+                return self._build_replay_response(request, interaction)
+            if not cassette.allow_network:
+                raise CassetteMiss(f"녹화되지 않은 요청입니다: {request.method} {urlsplit(request.url).path}",
+                                   request=request)
+
+        start = time.perf_counter()
+        response = super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        # 녹화를 위해 본문을 끝까지 읽음 (iter_content는 읽어 둔 본문을 그대로 사용)
+        response.content
+        cassette.record(request.method, request.url, body, response, time.perf_counter() - start)
+        return response
+
+    def _build_replay_response(self, request: requests.PreparedRequest,
+                               interaction: Interaction) -> requests.Response:
+        response = requests.Response()
+        response.status_code = interaction.status
+        response.reason = interaction.reason
+        response.headers = CaseInsensitiveDict(interaction.headers)
+        response.headers["Content-Length"] = str(len(interaction.body))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = interaction.body
+        response.raw = io.BytesIO(interaction.body)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.elapsed = timedelta(seconds=interaction.elapsed)
+        return response
+
+
+def replay_traffic(cassette: Cassette, send: Callable[[Interaction], Any], speed: float = 1.0,
+                   workers: int = 32) -> Dict[str, Any]:
+    """
+    녹화된 트래픽을 원래 시간 간격(배속 적용)대로 다시 발생시킴
+
+    부하 테스트나 캐시 정책 실험에서 실제 요청 패턴을 재현하는 용도입니다.
+
+    Args:
+        cassette: 녹화 아카이브
+        send: 요청 하나를 처리하는 함수 (예: 대상 서버로 HTTP 재전송)
+        speed: 배속 (0이면 간격 없이 최대한 빠르게)
+        workers: 동시에 처리할 최대 요청 수
+
+    Returns:
+        처리 건수, 소요 시간, 처리량, 지연 시간 분위수 요약
+    """
+    latencies: List[float] = []
+    lock = threading.Lock()
+    # 아카이브 전체를 대기열에 쌓지 않도록 처리 중인 요청 수를 제한
+    slots = threading.BoundedSemaphore(workers * 2)
+
+    def run(interaction: Interaction) -> None:
+        start = time.perf_counter()
+        try:
+            send(interaction)
+        finally:
+            with lock:
+                latencies.append(time.perf_counter() - start)
+            slots.release()
+
+    first_ts: Optional[float] = None
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for interaction in cassette.iter_interactions():
+            if first_ts is None:
+                first_ts = interaction.ts
+            if speed > 0:
+                delay = (interaction.ts - first_ts) / speed - (time.perf_counter() - started)
+                if delay > 0:
+                    time.sleep(delay)
+            slots.acquire()
+            pool.submit(run, interaction)
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+
+    def q(p: float) -> Optional[float]:
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] if latencies else None
+
+    return {"requests": len(latencies), "seconds": wall,
+            "throughput": len(latencies) / wall if wall > 0 else None,
+            "p50": q(0.5), "p95": q(0.95), "p99": q(0.99)}
+
+
+def _http_sender(target: str, app_key: str) -> Callable[[Interaction], Any]:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=256)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    base = target.rstrip("/")
+
+    def send(interaction: Interaction) -> int:
+        parts = urlsplit(interaction.url)
+        url = f"{base}{parts.path}" + (f"?{parts.query}" if parts.query else "")
+        response = session.request(interaction.method, url, data=interaction.request_body,
+                                   headers={"appKey": app_key, "content-type": "application/json",
+                                            "accept": "application/json"})
+        return response.status_code
+
+    return send
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="TmapAPI 녹화 아카이브 도구")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    stats_parser = sub.add_parser("stats", help="경로별 녹화 건수 출력")
+    stats_parser.add_argument("archive")
+
+    replay_parser = sub.add_parser("replay-traffic", help="녹화된 요청을 대상 서버로 다시 보냄")
+    replay_parser.add_argument("archive")
+    replay_parser.add_argument("--target", required=True, help="대상 서버 주소 (예: http://127.0.0.1:8080)")
+    replay_parser.add_argument("--app-key", default="replay", help="요청에 사용할 앱 키")
+    replay_parser.add_argument("--speed", type=float, default=0.0, help="배속 (0: 간격 없이 최대 속도)")
+    replay_parser.add_argument("--workers", type=int, default=32, help="동시 요청 수")
+
+    args = parser.parse_args()
+    cassette = Cassette(args.archive, mode="replay")
+    try:
+        if args.command == "stats":
+            result: Any = cassette.stats()
+        else:
+            result = replay_traffic(cassette, _http_sender(args.target, args.app_key),
+                                    speed=args.speed, workers=args.workers)
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    finally:
+        cassette.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """회로가 열려 있어 요청을 보내지 않고 바로 실패한 경우"""
+
+    code = "CIRCUIT_OPEN"
+
+    def __init__(self, family: str, retry_after: float):
+        super().__init__(f"{family} 엔드포인트 장애로 요청을 차단했습니다. {retry_after:.1f}초 후 다시 시도합니다.")
+        self.family = family
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    엔드포인트 계열 하나의 회로 차단기
+
+    연속 failure_threshold번 실패(5xx 또는 연결 오류)하면 열려서 recovery_timeout초 동안
+    요청을 바로 거부하고, 그 뒤 반열림(half-open) 상태에서 probe 요청 하나만 통과시켜
+    성공하면 닫고 실패하면 다시 엽니다.
+    """
+
+    def __init__(self, family: str, failure_threshold: int = 5, recovery_timeout: float = 30.0,
+                 on_change: Optional[Callable[[str, str], None]] = None):
+        self.family = family
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.on_change = on_change
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.opens = 0
+        self.rejections = 0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def _transition(self, state: str) -> None:
+        # _lock을 잡은 상태에서 호출
+        self.state = state
+        if state == OPEN:
+            self.opened_at = time.monotonic()
+            self.opens += 1
+        if self.on_change is not None:
+            self.on_change(self.family, state)
+
+    def before_call(self) -> None:
+        """요청 전 확인, 차단해야 하면 CircuitOpenError 발생"""
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            if self.state == OPEN:
+                elapsed = time.monotonic() - self.opened_at
+                if elapsed < self.recovery_timeout:
+                    self.rejections += 1
+                    raise CircuitOpenError(self.family, self.recovery_timeout - elapsed)
+                self._transition(HALF_OPEN)
+            if self._probing:
+                self.rejections += 1
+                raise CircuitOpenError(self.family, 0.0)
+            self._probing = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._probing = False
+            if self.state != CLOSED:
+                self._transition(CLOSED)
+
+    def release(self) -> None:
+        """결과 없이 끝난 요청(마감 시각 초과 등) 기록: 상태는 그대로 두고 probe 자격만 반환"""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.failure_threshold):
+                self._transition(OPEN)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "opens": self.opens,
+                "rejections": self.rejections,
+            }
+
+
+class CircuitBreakers:
+    """
+    URL 경로 앞 두 단계(예: /tmap/pois, /transit/routes)로 묶은 엔드포인트 계열별 회로 차단기 모음
+
+    한 상품이 장애일 때 그 계열만 빠르게 실패시키고, 정상인 다른 계열은 그대로 호출합니다.
+    failure_threshold가 0이면 차단하지 않습니다.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0,
+                 on_change: Optional[Callable[[str, str], None]] = None):
+        """
+        Args:
+            failure_threshold: 회로를 열 연속 실패 횟수 (0이면 사용하지 않음)
+            recovery_timeout: 열린 뒤 probe 요청을 보내기까지 기다릴 시간(초)
+            on_change: 상태가 바뀔 때 (계열, 상태)로 호출할 함수
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.on_change = on_change
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.failure_threshold > 0
+
+    @staticmethod
+    def family(url: str) -> str:
+        """요청 URL의 엔드포인트 계열 (예: https://.../transit/routes/sub → /transit/routes)"""
+        segments = [s for s in urlsplit(url).path.split("/") if s]
+        return "/" + "/".join(segments[:2])
+
+    def get(self, family: str) -> CircuitBreaker:
+        breaker = self._breakers.get(family)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(
+                    family, CircuitBreaker(family, self.failure_threshold, self.recovery_timeout, self.on_change))
+        return breaker
+
+    def snapshot(self) -> Dict[str, Any]:
+        """계열별 상태, 연속 실패 수, 열린 횟수, 거부한 요청 수"""
+        return {family: breaker.snapshot() for family, breaker in sorted(self._breakers.items())}
@@ -0,0 +1,286 @@
+"""
+TMAP 좌표계 간 로컬 변환
+
+TMAP API의 coordType/reqCoordType/resCoordType에 쓰는 좌표계 사이를 NumPy 배열 단위로
+변환합니다. 모든 변환은 WGS84 경위도를 거치며, 베셀 타원체(BESSELGEO, KATECH)는
+3변수 Helmert 변환으로 WGS84 측지계와 오가므로 수 m 이내의 오차가 있습니다.
+
+- WGS84GEO: WGS84 경위도
+- GRS80GEO: GRS80 경위도 (WGS84와 1mm 이내로 같아 그대로 사용)
+- EPSG3857: 구글/웹 메르카토르 (m)
+- UTMK: 국토지리정보원 UTM-K, EPSG:5179 (m)
+- BESSELGEO: 베셀 타원체 경위도 (Tokyo 측지계)
+- KATECH: KATEC/TM128 (m, 베셀 타원체 기반 TM)
+
+선택 의존성:
+    pip install numpy
+"""
+
+import copy
+from typing import Any, Dict, NamedTuple, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - 선택 의존성
+    np = None
+
+
+class Ellipsoid(NamedTuple):
+    a: float
+    f: float
+
+    @property
+    def e2(self) -> float:
+        return self.f * (2 - self.f)
+
+
+class TransverseMercator(NamedTuple):
+    ellipsoid: Ellipsoid
+    lat0: float
+    lon0: float
+    k0: float
+    false_easting: float
+    false_northing: float
+
+
+WGS84 = Ellipsoid(6378137.0, 1 / 298.257223563)
+GRS80 = Ellipsoid(6378137.0, 1 / 298.257222101)
+BESSEL = Ellipsoid(6377397.155, 1 / 299.1528128)
+
+# Tokyo 측지계(베셀) -> WGS84 지심 좌표 이동량(m)
+BESSEL_TO_WGS84 = (-146.43, 507.89, 681.46)
+
+UTMK = TransverseMercator(GRS80, 38.0, 127.5, 0.9996, 1000000.0, 2000000.0)
+KATECH = TransverseMercator(BESSEL, 38.0, 128.0, 0.9999, 400000.0, 600000.0)
+
+# 경위도 좌표계 (응답 좌표를 TMAP과 같은 소수점 7자리로 포맷)
+_GEOGRAPHIC = ("WGS84GEO", "GRS80GEO", "BESSELGEO")
+
+COORD_TYPES = ("WGS84GEO", "GRS80GEO", "EPSG3857", "UTMK", "BESSELGEO", "KATECH")
+_ALIASES = {"TM128": "KATECH", "KATEC": "KATECH", "EPSG5179": "UTMK", "EPSG4326": "WGS84GEO"}
+
+
+def available() -> bool:
+    """NumPy가 설치되어 있어 로컬 변환을 쓸 수 있는지 여부"""
+    return np is not None
+
+
+def normalize_coord_type(coord_type: str) -> str:
+    """
+    좌표계 이름을 TMAP 표기로 정규화 (대소문자, 별칭 TM128/EPSG5179 등 허용)
+
+    Raises:
+        ValueError: 지원하지 않는 좌표계
+    """
+    name = coord_type.strip().upper().replace(":", "")
+    name = _ALIASES.get(name, name)
+    if name not in COORD_TYPES:
+        raise ValueError(f"지원하지 않는 좌표계: {coord_type} (가능한 값: {', '.join(COORD_TYPES)})")
+    return name
+
+
+def supports(coord_type: str) -> bool:
+    """로컬 변환이 가능한 좌표계인지 여부"""
+    try:
+        normalize_coord_type(coord_type)
+    except ValueError:
+        return False
+    return available()
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("좌표계 변환에는 numpy가 필요합니다: pip install numpy")
+
+
+# --- 타원체 계산 ---------------------------------------------------------
+
+def _geodetic_to_ecef(lon: "np.ndarray", lat: "np.ndarray", ellipsoid: Ellipsoid):
+    lam, phi = np.radians(lon), np.radians(lat)
+    sin_phi = np.sin(phi)
+    n = ellipsoid.a / np.sqrt(1 - ellipsoid.e2 * sin_phi ** 2)
+    return (n * np.cos(phi) * np.cos(lam),
+            n * np.cos(phi) * np.sin(lam),
+            n * (1 - ellipsoid.e2) * sin_phi)
+
+
+def _ecef_to_geodetic(x: "np.ndarray", y: "np.ndarray", z: "np.ndarray", ellipsoid: Ellipsoid):
+    a, e2 = ellipsoid.a, ellipsoid.e2
+    p = np.hypot(x, y)
+    phi = np.arctan2(z, p * (1 - e2))
+    # 지표면 근처 좌표는 몇 번의 반복으로 0.1mm 이하까지 수렴
+    for _ in range(5):
+        sin_phi = np.sin(phi)
+        n = a / np.sqrt(1 - e2 * sin_phi ** 2)
+        phi = np.arctan2(z + e2 * n * sin_phi, p)
+    return np.degrees(np.arctan2(y, x)), np.degrees(phi)
+
+
+def _shift_datum(lon, lat, source: Ellipsoid, target: Ellipsoid, shift: Tuple[float, float, float]):
+    x, y, z = _geodetic_to_ecef(lon, lat, source)
+    return _ecef_to_geodetic(x + shift[0], y + shift[1], z + shift[2], target)
+
+
+def _meridian_arc(phi: "np.ndarray", ellipsoid: Ellipsoid) -> "np.ndarray":
+    a, e2 = ellipsoid.a, ellipsoid.e2
+    e4, e6 = e2 * e2, e2 * e2 * e2
+    return a * ((1 - e2 / 4 - 3 * e4 / 64 - 5 * e6 / 256) * phi
+                - (3 * e2 / 8 + 3 * e4 / 32 + 45 * e6 / 1024) * np.sin(2 * phi)
+                + (15 * e4 / 256 + 45 * e6 / 1024) * np.sin(4 * phi)
+                - (35 * e6 / 3072) * np.sin(6 * phi))
+
+
+def _tm_forward(lon, lat, tm: TransverseMercator):
+    """경위도 -> TM 평면 좌표 (Snyder, Map Projections 8-9 ~ 8-10)"""
+    ellipsoid = tm.ellipsoid
+    e2 = ellipsoid.e2
+    ep2 = e2 / (1 - e2)
+    phi, lam = np.radians(lat), np.radians(lon)
+    sin_phi, cos_phi = np.sin(phi), np.cos(phi)
+    n = ellipsoid.a / np.sqrt(1 - e2 * sin_phi ** 2)
+    t = np.tan(phi) ** 2
+    c = ep2 * cos_phi ** 2
+    a = (lam - np.radians(tm.lon0)) * cos_phi
+    m = _meridian_arc(phi, ellipsoid)
+    m0 = _meridian_arc(np.radians(tm.lat0), ellipsoid)
+    x = tm.false_easting + tm.k0 * n * (
+        a + (1 - t + c) * a ** 3 / 6 + (5 - 18 * t + t ** 2 + 72 * c - 58 * ep2) * a ** 5 / 120)
+    y = tm.false_northing + tm.k0 * (
+        m - m0 + n * np.tan(phi) * (
+            a ** 2 / 2 + (5 - t + 9 * c + 4 * c ** 2) * a ** 4 / 24
+            + (61 - 58 * t + t ** 2 + 600 * c - 330 * ep2) * a ** 6 / 720))
+    return x, y
+
+
+def _tm_inverse(x, y, tm: TransverseMercator):
+    """TM 평면 좌표 -> 경위도 (Snyder, Map Projections 8-12 ~ 8-25)"""
+    ellipsoid = tm.ellipsoid
+    a, e2 = ellipsoid.a, ellipsoid.e2
+    ep2 = e2 / (1 - e2)
+    e1 = (1 - np.sqrt(1 - e2)) / (1 + np.sqrt(1 - e2))
+    m = _meridian_arc(np.radians(tm.lat0), ellipsoid) + (y - tm.false_northing) / tm.k0
+    mu = m / (a * (1 - e2 / 4 - 3 * e2 ** 2 / 64 - 5 * e2 ** 3 / 256))
+    phi1 = (mu + (3 * e1 / 2 - 27 * e1 ** 3 / 32) * np.sin(2 * mu)
+            + (21 * e1 ** 2 / 16 - 55 * e1 ** 4 / 32) * np.sin(4 * mu)
+            + (151 * e1 ** 3 / 96) * np.sin(6 * mu)
+            + (1097 * e1 ** 4 / 512) * np.sin(8 * mu))
+    sin1, cos1, tan1 = np.sin(phi1), np.cos(phi1), np.tan(phi1)
+    c1 = ep2 * cos1 ** 2
+    t1 = tan1 ** 2
+    n1 = a / np.sqrt(1 - e2 * sin1 ** 2)
+    r1 = a * (1 - e2) / (1 - e2 * sin1 ** 2) ** 1.5
+    d = (x - tm.false_easting) / (n1 * tm.k0)
+    phi = phi1 - (n1 * tan1 / r1) * (
+        d ** 2 / 2 - (5 + 3 * t1 + 10 * c1 - 4 * c1 ** 2 - 9 * ep2) * d ** 4 / 24
+        + (61 + 90 * t1 + 298 * c1 + 45 * t1 ** 2 - 252 * ep2 - 3 * c1 ** 2) * d ** 6 / 720)
+    lam = np.radians(tm.lon0) + (
+        d - (1 + 2 * t1 + c1) * d ** 3 / 6
+        + (5 - 2 * c1 + 28 * t1 - 3 * c1 ** 2 + 8 * ep2 + 24 * t1 ** 2) * d ** 5 / 120) / cos1
+    return np.degrees(lam), np.degrees(phi)
+
+
+# --- 좌표계별 WGS84 변환 -------------------------------------------------
+
+def _mercator_forward(lon, lat):
+    x = WGS84.a * np.radians(lon)
+    y = WGS84.a * np.log(np.tan(np.pi / 4 + np.radians(lat) / 2))
+    return x, y
+
+
+def _mercator_inverse(x, y):
+    lon = np.degrees(x / WGS84.a)
+    lat = np.degrees(2 * np.arctan(np.exp(y / WGS84.a)) - np.pi / 2)
+    return lon, lat
+
+
+_TO_WGS84 = {
+    "WGS84GEO": lambda x, y: (x, y),
+    "GRS80GEO": lambda x, y: (x, y),
+    "EPSG3857": _mercator_inverse,
+    "UTMK": lambda x, y: _tm_inverse(x, y, UTMK),
+    "BESSELGEO": lambda x, y: _shift_datum(x, y, BESSEL, WGS84, BESSEL_TO_WGS84),
+    "KATECH": lambda x, y: _shift_datum(*_tm_inverse(x, y, KATECH), BESSEL, WGS84, BESSEL_TO_WGS84),
+}
+
+_FROM_WGS84 = {
+    "WGS84GEO": lambda lon, lat: (lon, lat),
+    "GRS80GEO": lambda lon, lat: (lon, lat),
+    "EPSG3857": _mercator_forward,
+    "UTMK": lambda lon, lat: _tm_forward(lon, lat, UTMK),
+    "BESSELGEO": lambda lon, lat: _shift_datum(lon, lat, WGS84, BESSEL, tuple(-v for v in BESSEL_TO_WGS84)),
+    "KATECH": lambda lon, lat: _tm_forward(
+        *_shift_datum(lon, lat, WGS84, BESSEL, tuple(-v for v in BESSEL_TO_WGS84)), KATECH),
+}
+
+
+def convert(x: Any, y: Any, source: str, target: str) -> Tuple[Any, Any]:
+    """
+    좌표 배열을 source 좌표계에서 target 좌표계로 변환
+
+    Args:
+        x: 경도 또는 동향(easting) 좌표 (스칼라, 리스트 또는 NumPy 배열)
+        y: 위도 또는 북향(northing) 좌표
+        source: 입력 좌표계 (WGS84GEO, EPSG3857, UTMK, BESSELGEO, KATECH 등)
+        target: 출력 좌표계
+
+    Returns:
+        (x, y) NumPy 배열 (입력이 스칼라면 float)
+
+    사용 예:
+        lon, lat = convert([309947.0], [552082.0], "KATECH", "WGS84GEO")
+    """
+    _require_numpy()
+    source, target = normalize_coord_type(source), normalize_coord_type(target)
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    if source != target:
+        x, y = _FROM_WGS84[target](*_TO_WGS84[source](x, y))
+    if x.ndim == 0:
+        return float(x), float(y)
+    return x, y
+
+
+def format_coordinate(value: float, coord_type: str) -> str:
+    """TMAP 응답과 같은 형식의 좌표 문자열 (경위도는 소수점 7자리, 평면 좌표는 2자리)"""
+    return f"{value:.7f}" if normalize_coord_type(coord_type) in _GEOGRAPHIC else f"{value:.2f}"
+
+
+# 지오코딩 응답 coordinateInfo에서 (x, y) 쌍으로 변환할 필드
+_GEOCODE_FIELDS = (("lon", "lat"), ("lonEntr", "latEntr"), ("newLon", "newLat"), ("newLonEntr", "newLatEntr"))
+
+
+def convert_geocoding(result: Dict[str, Any], coord_type: str,
+                      source: str = "WGS84GEO") -> Dict[str, Any]:
+    """
+    geocoding/full_text_geocoding 응답의 좌표를 다른 좌표계로 바꾼 사본
+
+    응답의 모든 좌표를 한 번에 배열로 변환하며, 원본(캐시에 있는 응답일 수 있음)은 바꾸지 않습니다.
+
+    Args:
+        result: source 좌표계로 받은 지오코딩 응답
+        coord_type: 바꿀 좌표계
+        source: 응답의 좌표계
+    """
+    if normalize_coord_type(coord_type) == normalize_coord_type(source):
+        return result
+    result = copy.deepcopy(result)
+    info = result.get("coordinateInfo") or {}
+    items = info.get("coordinate") if isinstance(info.get("coordinate"), list) else [info]
+
+    targets = []
+    xs, ys = [], []
+    for item in items:
+        for x_field, y_field in _GEOCODE_FIELDS:
+            x, y = item.get(x_field), item.get(y_field)
+            if x in (None, "") or y in (None, ""):
+                continue
+            targets.append((item, x_field, y_field))
+            xs.append(float(x))
+            ys.append(float(y))
+    if targets:
+        xs, ys = convert(xs, ys, source, coord_type)
+        for (item, x_field, y_field), x, y in zip(targets, xs.tolist(), ys.tolist()):
+            item[x_field] = format_coordinate(x, coord_type)
+            item[y_field] = format_coordinate(y, coord_type)
+    if "coordType" in info:
+        info["coordType"] = normalize_coord_type(coord_type)
+    return result
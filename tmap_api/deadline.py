@@ -0,0 +1,125 @@
+"""
+도구 호출의 마감 시각과 취소 전파
+
+MCP 핸들러가 deadline()으로 마감 시각을 정하면, 그 아래에서 보내는 모든 업스트림 요청이
+컨텍스트 변수로 마감 시각을 이어받습니다. 병렬 호출(plan_trip, 타일 채우기, 페이지 미리 요청,
+헤지 요청)은 작업마다 컨텍스트를 복사해서 실행하므로 워커 스레드도 같은 마감 시각을 따릅니다.
+
+마감 시각이 지나거나 호출이 취소되면 아직 보내지 않은 요청은 보내지 않고 DeadlineExceeded로
+끝나며, 속도 제한 토큰과 키 쿼터는 반환합니다. 이미 보낸 요청은 남은 시간을 타임아웃으로 받습니다.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+import requests
+
+# 토큰이나 연결 슬롯을 기다리는 동안 취소 여부를 확인하는 간격(초)
+POLL_INTERVAL = 0.25
+
+DEADLINE_EXCEEDED = "DEADLINE_EXCEEDED"
+CANCELLED = "CANCELLED"
+
+
+class DeadlineExceeded(requests.RequestException):
+    """마감 시각이 지났거나 취소되어 요청을 보내지 않거나 중단함"""
+
+    def __init__(self, code: str = DEADLINE_EXCEEDED):
+        message = "도구 호출이 취소되었습니다." if code == CANCELLED else "도구 호출 마감 시각이 지났습니다."
+        super().__init__(message)
+        self.code = code
+
+
+class Deadline:
+    """
+    마감 시각(time.monotonic 기준)과 취소 상태
+
+    부모 Deadline이 있으면 둘 중 이른 마감 시각을 쓰고, 부모가 취소되면 함께 취소됩니다.
+    """
+
+    def __init__(self, timeout: Optional[float] = None, parent: Optional["Deadline"] = None,
+                 is_cancelled: Optional[Callable[[], bool]] = None):
+        """
+        Args:
+            timeout: 지금부터 남은 시간(초, None이면 마감 시각 없음)
+            parent: 바깥 컨텍스트의 Deadline
+            is_cancelled: 외부 취소 여부를 확인하는 함수 (예: 다른 프로세스와 공유하는 취소 목록 조회)
+        """
+        expires_at = None if timeout is None else time.monotonic() + max(0.0, timeout)
+        if parent is not None and parent.expires_at is not None:
+            expires_at = parent.expires_at if expires_at is None else min(expires_at, parent.expires_at)
+        self.expires_at = expires_at
+        self.parent = parent
+        self._is_cancelled = is_cancelled
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """이 Deadline 아래의 남은 작업 취소"""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        if self._cancelled.is_set():
+            return True
+        if self._is_cancelled is not None and self._is_cancelled():
+            self._cancelled.set()
+            return True
+        return self.parent is not None and self.parent.cancelled
+
+    def remaining(self) -> Optional[float]:
+        """남은 시간(초, 마감 시각이 없으면 None, 지났거나 취소되었으면 0)"""
+        if self.cancelled:
+            return 0.0
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def check(self) -> None:
+        """마감 시각이 지났거나 취소되었으면 DeadlineExceeded 발생"""
+        if self.cancelled:
+            raise DeadlineExceeded(CANCELLED)
+        if self.expires_at is not None and time.monotonic() >= self.expires_at:
+            raise DeadlineExceeded()
+
+
+_deadline: ContextVar[Optional[Deadline]] = ContextVar("tmap_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """현재 컨텍스트의 Deadline (없으면 None)"""
+    return _deadline.get()
+
+
+def remaining() -> Optional[float]:
+    """현재 컨텍스트의 남은 시간(초, 마감 시각이 없으면 None)"""
+    current = _deadline.get()
+    return current.remaining() if current is not None else None
+
+
+def check() -> None:
+    """현재 컨텍스트의 마감 시각이 지났거나 취소되었으면 DeadlineExceeded 발생"""
+    current = _deadline.get()
+    if current is not None:
+        current.check()
+
+
+@contextmanager
+def deadline(timeout: Optional[float] = None,
+             is_cancelled: Optional[Callable[[], bool]] = None) -> Iterator[Deadline]:
+    """
+    with 블록 안에서 보내는 요청의 마감 시각 지정 (바깥 마감 시각보다 늦출 수는 없음)
+
+    사용 예:
+        with deadline(10) as current:
+            tmap.plan_trip("서울역", "강남역")
+        # 다른 스레드에서 current.cancel()로 남은 요청을 취소할 수 있음
+    """
+    current = Deadline(timeout, parent=_deadline.get(), is_cancelled=is_cancelled)
+    token = _deadline.set(current)
+    try:
+        yield current
+    finally:
+        _deadline.reset(token)
@@ -0,0 +1,47 @@
+from typing import Any, Dict, Optional
+
+
+class TmapError(dict):
+    """
+    TMAP API 호출 실패 결과
+
+    ``{"error": {"endpoint": ..., "status": ..., "code": ..., "message": ...}}`` 형태의
+    딕셔너리라 그대로 JSON으로 직렬화할 수 있으며, 기존의 ``if result:`` 검사가
+    그대로 동작하도록 bool 값은 항상 False입니다.
+    """
+
+    def __init__(self, endpoint: str, code: str, message: str,
+                 status: Optional[int] = None, detail: Optional[Any] = None):
+        error: Dict[str, Any] = {
+            "endpoint": endpoint,
+            "status": status,
+            "code": code,
+            "message": message,
+        }
+        if detail is not None:
+            error["detail"] = detail
+        super().__init__(error=error)
+
+    def __bool__(self) -> bool:
+        return False
+
+    @property
+    def endpoint(self) -> str:
+        return self["error"]["endpoint"]
+
+    @property
+    def status(self) -> Optional[int]:
+        return self["error"]["status"]
+
+    @property
+    def code(self) -> str:
+        return self["error"]["code"]
+
+    @property
+    def message(self) -> str:
+        return self["error"]["message"]
+
+
+def is_error(result: Any) -> bool:
+    """결과가 TmapError인지 여부"""
+    return isinstance(result, TmapError)
@@ -0,0 +1,151 @@
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Iterable, Optional
+
+import requests
+
+from .metrics import TmapMetrics
+
+# 지연 시간이 긴 업스트림 응답에 대비해 복제 요청을 보낼 수 있는 멱등 조회 엔드포인트
+DEFAULT_HEDGE_ENDPOINTS = ("search_poi_keyword", "geocoding", "get_poi_detail")
+
+
+class HedgePolicy:
+    """
+    멱등 조회 요청의 꼬리 지연을 줄이기 위한 헤지(hedged request) 정책
+
+    요청이 엔드포인트별 최근 지연 시간의 percentile 분위수만큼 지나도 끝나지 않으면
+    같은 요청을 하나 더 보내고 먼저 끝난 응답을 사용합니다. 복제 요청은 전체 요청 수의
+    budget 비율을 넘지 않도록 제한해 쿼터 소모를 막습니다.
+    """
+
+    def __init__(self, endpoints: Iterable[str] = DEFAULT_HEDGE_ENDPOINTS, percentile: float = 0.95,
+                 budget: float = 0.05, min_delay: float = 0.02, initial_delay: float = 0.5,
+                 window: int = 200, min_samples: int = 20, max_workers: int = 16,
+                 metrics: Optional[TmapMetrics] = None):
+        """
+        헤지 정책 초기화
+
+        Args:
+            endpoints: 헤지를 적용할 엔드포인트 이름
+            percentile: 복제 요청을 보낼 지연 분위수 (0.95면 최근 p95만큼 기다린 뒤 복제)
+            budget: 전체 요청 대비 복제 요청의 최대 비율
+            min_delay: 복제 요청 전 최소 대기 시간(초)
+            initial_delay: 지연 시간 표본이 min_samples개 모이기 전의 대기 시간(초)
+            window: 엔드포인트별로 유지할 최근 지연 시간 표본 수
+            min_samples: 분위수를 계산하기 위한 최소 표본 수
+            max_workers: 요청을 실행할 스레드 수
+            metrics: 헤지 횟수와 승률을 기록할 계측 수집기 (선택적)
+        """
+        self.endpoints = frozenset(endpoints)
+        self.percentile = percentile
+        self.budget = budget
+        self.min_delay = min_delay
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.metrics = metrics
+        self._window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._requests = 0
+        self._hedges = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tmap-hedge")
+
+    def applies(self, endpoint: str, method: str) -> bool:
+        """헤지 대상 요청인지 여부 (GET 조회만 대상)"""
+        return method == "GET" and endpoint in self.endpoints
+
+    def delay(self, endpoint: str) -> float:
+        """복제 요청을 보내기 전 기다릴 시간(초)"""
+        with self._lock:
+            samples = sorted(self._samples.get(endpoint, ()))
+        if len(samples) < self.min_samples:
+            return self.initial_delay
+        index = min(len(samples) - 1, int(self.percentile * len(samples)))
+        return max(self.min_delay, samples[index])
+
+    def _observe(self, endpoint: str, elapsed: float) -> None:
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self._window)
+            samples.append(elapsed)
+
+    def _take_budget(self) -> bool:
+        with self._lock:
+            if self._hedges + 1 > self.budget * self._requests:
+                return False
+            self._hedges += 1
+            return True
+
+    def _submit(self, endpoint: str, send: Callable[[], requests.Response]) -> Future:
+        # 트레이싱 span이 호출한 메서드 아래에 중첩되도록 컨텍스트를 복사해서 실행
+        context = contextvars.copy_context()
+
+        def attempt() -> requests.Response:
+            start = time.perf_counter()
+            response = send()
+            self._observe(endpoint, time.perf_counter() - start)
+            return response
+
+        return self._executor.submit(context.run, attempt)
+
+    def run(self, endpoint: str, send: Callable[[], requests.Response]) -> requests.Response:
+        """
+        요청을 보내고, 지연되면 복제 요청을 보내 먼저 성공한 응답을 반환
+
+        Args:
+            endpoint: 엔드포인트 이름
+            send: 요청 한 건을 보내고 응답을 반환하는 함수
+
+        Returns:
+            먼저 끝난 응답 (모두 실패하면 마지막 예외 발생)
+        """
+        with self._lock:
+            self._requests += 1
+        primary = self._submit(endpoint, send)
+        done, _ = wait([primary], timeout=self.delay(endpoint))
+        if done or not self._take_budget():
+            return primary.result()
+
+        hedge = self._submit(endpoint, send)
+        pending = {primary, hedge}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                    continue
+                for other in pending:
+                    other.add_done_callback(_close_response)
+                if self.metrics is not None:
+                    self.metrics.record_hedge(endpoint, won=future is hedge)
+                return future.result()
+        if self.metrics is not None:
+            self.metrics.record_hedge(endpoint, won=False)
+        raise error
+
+    def snapshot(self) -> Dict[str, Any]:
+        """전체 요청 수, 복제 요청 수, 엔드포인트별 현재 대기 시간"""
+        with self._lock:
+            requests_total, hedges = self._requests, self._hedges
+            endpoints = list(self._samples)
+        return {
+            "requests": requests_total,
+            "hedges": hedges,
+            "hedge_ratio": hedges / requests_total if requests_total else None,
+            "delays": {endpoint: self.delay(endpoint) for endpoint in sorted(endpoints)},
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+def _close_response(future: Future) -> None:
+    """먼저 끝난 응답을 사용한 뒤 늦게 도착한 응답의 연결 반환"""
+    if future.exception() is None:
+        future.result().close()
@@ -0,0 +1,146 @@
+"""
+httpx 기반 HTTP/2 전송 어댑터
+
+같은 호스트로 가는 동시 요청을 HTTP/2 연결 하나에 다중화하고, brotli가 설치되어 있으면
+gzip보다 압축률이 높은 br 인코딩을 요청합니다. requests 세션에 장착하는 전송 어댑터라
+TmapAPI의 나머지 코드(계측, 재시도, 캐시)는 그대로 동작합니다.
+
+선택 의존성:
+    pip install "httpx[http2,brotli]"
+"""
+
+from datetime import timedelta
+from typing import Any, Iterator, Optional
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - 선택 의존성
+    httpx = None
+
+
+def _brotli_available() -> bool:
+    for module in ("brotli", "brotlicffi"):
+        try:
+            __import__(module)
+            return True
+        except ImportError:
+            pass
+    return False
+
+
+class _HttpxRaw:
+    """requests.Response.raw 자리에 넣는 httpx 스트리밍 응답 래퍼 (압축 해제된 본문을 반환)"""
+
+    def __init__(self, response: "httpx.Response"):
+        self._response = response
+        self._iterator: Optional[Iterator[bytes]] = None
+        self._buffer = b""
+
+    def stream(self, chunk_size: int = 65536, decode_content: bool = True) -> Iterator[bytes]:
+        if self._buffer:
+            yield self._buffer
+            self._buffer = b""
+        for chunk in self._chunks(chunk_size):
+            yield chunk
+
+    def _chunks(self, chunk_size: Optional[int]) -> Iterator[bytes]:
+        if self._iterator is None:
+            self._iterator = self._response.iter_bytes(chunk_size)
+        return self._iterator
+
+    def read(self, amt: Optional[int] = None, decode_content: bool = True) -> bytes:
+        chunks = [self._buffer]
+        size = len(self._buffer)
+        for chunk in self._chunks(amt):
+            chunks.append(chunk)
+            size += len(chunk)
+            if amt is not None and size >= amt:
+                break
+        data = b"".join(chunks)
+        if amt is None:
+            self._buffer = b""
+            return data
+        self._buffer = data[amt:]
+        return data[:amt]
+
+    def tell(self) -> int:
+        """지금까지 네트워크에서 받은(압축된) 바이트 수"""
+        return self._response.num_bytes_downloaded
+
+    def close(self) -> None:
+        self._response.close()
+
+    def release_conn(self) -> None:
+        self._response.close()
+
+
+class HttpxAdapter(BaseAdapter):
+    """
+    httpx.Client로 요청을 보내는 requests 전송 어댑터
+
+    응답의 raw.tell()은 압축된 전송 바이트 수를 반환하므로, TmapAPI는 이를 이용해
+    엔드포인트별 전송 바이트와 압축 해제 후 바이트를 따로 기록합니다.
+    """
+
+    def __init__(self, http2: bool = True, max_connections: int = 100, keepalive_expiry: float = 30.0):
+        """
+        Args:
+            http2: HTTP/2 사용 여부 (https 연결에서 서버가 지원하면 사용, h2 패키지 필요)
+            max_connections: 최대 연결 수
+            keepalive_expiry: 유휴 연결 유지 시간(초)
+        """
+        super().__init__()
+        if httpx is None:
+            raise ImportError('HTTP/2 전송을 사용하려면 httpx가 필요합니다: pip install "httpx[http2,brotli]"')
+        encodings = ["br", "gzip", "deflate"] if _brotli_available() else ["gzip", "deflate"]
+        self.accept_encoding = ", ".join(encodings)
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections,
+                              keepalive_expiry=keepalive_expiry)
+        try:
+            self.client = httpx.Client(http2=http2, limits=limits)
+        except ImportError as e:
+            raise ImportError('HTTP/2 전송을 사용하려면 h2가 필요합니다: pip install "httpx[http2,brotli]"') from e
+
+    def send(self, request: requests.PreparedRequest, stream: bool = False, timeout: Any = None,
+             verify: Any = True, cert: Any = None, proxies: Any = None) -> requests.Response:
+        headers = dict(request.headers)
+        headers["Accept-Encoding"] = self.accept_encoding
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(None, connect=timeout[0], read=timeout[1])
+        try:
+            httpx_request = self.client.build_request(request.method, request.url, headers=headers,
+                                                      content=request.body, timeout=timeout)
+            httpx_response = self.client.send(httpx_request, stream=True)
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e), request=request) from e
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(str(e), request=request) from e
+
+        response = requests.Response()
+        response.status_code = httpx_response.status_code
+        response.reason = httpx_response.reason_phrase
+        response.headers = CaseInsensitiveDict(httpx_response.headers.items())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = _HttpxRaw(httpx_response)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.elapsed = timedelta(0)
+        response.http_version = httpx_response.http_version
+        if not stream:
+            try:
+                response.content
+            except httpx.TransportError as e:
+                raise requests.ConnectionError(str(e), request=request) from e
+            finally:
+                httpx_response.close()
+            response.elapsed = httpx_response.elapsed
+        return response
+
+    def close(self) -> None:
+        self.client.close()
@@ -0,0 +1,122 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from typing import Iterable, Optional, Tuple
+
+
+class StaticMapCache:
+    """
+    경로 정적 지도 이미지를 위한 내용 주소 기반(content-addressed) 디스크 캐시
+
+    이미지 본문은 SHA-256 해시를 파일명으로 하여 ``objects/`` 아래에 한 번만 저장되고,
+    출발지/도착지 좌표로 만든 키는 ``refs/`` 아래에서 해당 해시를 가리킵니다.
+    서로 다른 좌표가 같은 이미지를 돌려주더라도 디스크에는 한 벌만 남습니다.
+    """
+
+    def __init__(self, cache_dir: str, snap_digits: Optional[int] = None):
+        """
+        정적 지도 캐시 초기화
+
+        Args:
+            cache_dir: 캐시 디렉토리 경로 (없으면 생성)
+            snap_digits: 키 생성 시 좌표를 반올림할 소수점 자릿수
+                (예: 4 → 약 10m 단위로 같은 키 사용, None이면 반올림하지 않음)
+        """
+        self.cache_dir = cache_dir
+        self.snap_digits = snap_digits
+        self.objects_dir = os.path.join(cache_dir, "objects")
+        self.refs_dir = os.path.join(cache_dir, "refs")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.refs_dir, exist_ok=True)
+
+    def key(self, start_x: float, start_y: float, end_x: float, end_y: float) -> str:
+        """
+        출발지/도착지 좌표로 캐시 키 생성
+
+        Returns:
+            좌표 문자열의 SHA-1 해시
+        """
+        coords = [float(v) for v in (start_x, start_y, end_x, end_y)]
+        if self.snap_digits is not None:
+            coords = [round(v, self.snap_digits) for v in coords]
+        raw = ",".join(repr(v) for v in coords)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}.png")
+
+    def _ref_path(self, key: str) -> str:
+        return os.path.join(self.refs_dir, key)
+
+    def lookup(self, key: str) -> Optional[str]:
+        """
+        캐시 키에 해당하는 이미지 파일 경로 조회
+
+        Returns:
+            이미지 파일 경로 또는 캐시에 없으면 None
+        """
+        try:
+            with open(self._ref_path(key), "r", encoding="ascii") as f:
+                digest = f.read().strip()
+        except OSError:
+            return None
+        path = self._object_path(digest)
+        return path if os.path.exists(path) else None
+
+    def store(self, key: str, chunks: Iterable[bytes]) -> Tuple[str, str, int]:
+        """
+        이미지 데이터를 청크 단위로 디스크에 기록하고 키에 연결
+
+        전체 이미지를 메모리에 올리지 않고 임시 파일에 쓰면서 해시를 계산한 뒤,
+        같은 해시의 이미지가 이미 있으면 임시 파일을 버립니다.
+
+        Args:
+            key: ``key()``로 생성한 캐시 키
+            chunks: 이미지 바이트 청크 이터러블
+
+        Returns:
+            (이미지 파일 경로, SHA-256 해시, 바이트 수) 튜플
+        """
+        digest, size, tmp_path = write_chunks(self.objects_dir, chunks)
+        path = self._object_path(digest)
+        if os.path.exists(path):
+            os.remove(tmp_path)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp_path, path)
+
+        fd, ref_tmp = tempfile.mkstemp(dir=self.refs_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="ascii") as f:
+            f.write(digest)
+        os.replace(ref_tmp, self._ref_path(key))
+        return path, digest, size
+
+    @staticmethod
+    def copy_to(path: str, file_path: str) -> None:
+        """캐시된 이미지를 지정한 경로로 복사"""
+        shutil.copyfile(path, file_path)
+
+
+def write_chunks(directory: str, chunks: Iterable[bytes]) -> Tuple[str, int, str]:
+    """
+    청크를 지정한 디렉토리의 임시 파일에 기록
+
+    Returns:
+        (SHA-256 해시, 바이트 수, 임시 파일 경로) 튜플
+    """
+    hasher = hashlib.sha256()
+    size = 0
+    fd, tmp_path = tempfile.mkstemp(dir=directory or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                hasher.update(chunk)
+                size += len(chunk)
+                f.write(chunk)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return hasher.hexdigest(), size, tmp_path
@@ -0,0 +1,537 @@
+"""
+대용량 지오코딩/경로 일괄 작업 실행기
+
+CSV 또는 Parquet 파일의 행을 차례로 읽어 속도 제한기 아래에서 동시에 처리하고, 결과를 처리한
+순서대로 출력 파일에 이어 씁니다. 입력을 한꺼번에 읽지 않고 동시에 처리 중인 행도
+workers의 2배까지만 두므로, 입력 크기와 상관없이 메모리 사용량이 일정합니다.
+
+진행 상황은 체크포인트 파일(기본값 <출력 경로>.checkpoint.json)에 주기적으로 남깁니다.
+체크포인트에는 "이 행까지는 모두 끝남"을 뜻하는 watermark와 그 뒤에 먼저 끝난 행 번호,
+그리고 그 시점의 출력 파일 크기(Parquet은 파트 파일 수)가 들어 있습니다. 같은 명령을 다시
+실행하면 출력 파일을 체크포인트 시점으로 되돌린 뒤 남은 행만 처리하므로, 중간에 죽거나
+쿼터가 소진되어 멈춰도 행이 빠지거나 두 번 기록되지 않습니다.
+
+사용 예:
+    python -m tmap_api.jobs geocode addresses.csv geocoded.csv --address-column 주소 --rate 20
+    python -m tmap_api.jobs route od.parquet routes.parquet --mode car --workers 16
+
+선택 의존성 (Parquet 입출력):
+    pip install pyarrow
+"""
+
+import argparse
+import contextvars
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from .errors import TmapError
+from .log import configure_logging, logger
+from .rate_limit import BACKGROUND, LANES, RateLimiter, priority
+from .tmap_api import DEFAULT_BASE_URL, TmapAPI
+from .trip import summarize_car, summarize_pedestrian
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - 선택 의존성
+    pa = None
+    pq = None
+
+# 쿼터가 소진되어 멈춘 경우의 종료 코드 (쿼터가 풀린 뒤 같은 명령으로 이어서 실행)
+EXIT_QUOTA_EXHAUSTED = 3
+
+Row = Dict[str, Any]
+# 결과 열: (이름, 자료형) - 자료형은 Parquet 출력 스키마에 사용 ("float", "int", "str")
+Column = Tuple[str, str]
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("Parquet 입출력에는 pyarrow가 필요합니다: pip install pyarrow")
+
+
+def _is_parquet(path: str) -> bool:
+    return path.lower().endswith((".parquet", ".pq"))
+
+
+def _is_quota_exhausted(error: TmapError) -> bool:
+    return error.status == 429 and "QUOTA" in (error.code or "").upper()
+
+
+def _is_retryable(error: TmapError) -> bool:
+    """연결 오류, 회로 차단, 5xx, 초당 호출 제한(429)은 잠시 뒤 다시 시도"""
+    return error.status is None or error.status == 429 or error.status >= 500
+
+
+# ---------------------------------------------------------------------------
+# 작업 종류
+# ---------------------------------------------------------------------------
+
+class GeocodeTask:
+    """주소 열을 Full Text 지오코딩해 위도/경도를 붙이는 작업"""
+
+    name = "geocode"
+    columns: List[Column] = [("lat", "float"), ("lon", "float"), ("matched_address", "str"), ("match_flag", "str")]
+
+    def __init__(self, address_column: str = "address"):
+        self.address_column = address_column
+
+    def describe(self) -> Dict[str, Any]:
+        return {"task": self.name, "address_column": self.address_column}
+
+    def __call__(self, tmap: Any, row: Row) -> Union[Row, TmapError]:
+        address = str(row.get(self.address_column) or "").strip()
+        if not address:
+            return TmapError("full_text_geocoding", "EMPTY_ADDRESS", f"{self.address_column} 열이 비어 있습니다.")
+        result = tmap.full_text_geocoding(address, search_count=1)
+        if not result:
+            return result
+        coordinates = (result.get("coordinateInfo") or {}).get("coordinate") or []
+        if not coordinates:
+            return TmapError("full_text_geocoding", "NOT_FOUND", "주소를 찾지 못했습니다.", status=204)
+        coordinate = coordinates[0]
+        # 도로명 주소로 찾은 경우 newLat/newLon에, 지번 주소로 찾은 경우 lat/lon에 좌표가 있음
+        lat = coordinate.get("lat") or coordinate.get("newLat")
+        lon = coordinate.get("lon") or coordinate.get("newLon")
+        road = " ".join(filter(None, (coordinate.get("newRoadName"), coordinate.get("newBuildingIndex"))))
+        parts = (coordinate.get("city_do"), coordinate.get("gu_gun"), coordinate.get("eup_myun"),
+                 road or coordinate.get("legalDong"), None if road else coordinate.get("bunji"))
+        return {
+            "lat": float(lat) if lat else None,
+            "lon": float(lon) if lon else None,
+            "matched_address": " ".join(filter(None, parts)) or None,
+            "match_flag": coordinate.get("matchFlag"),
+        }
+
+
+class RouteTask:
+    """출발/도착 좌표 열로 자동차 또는 보행자 경로의 거리, 시간, 요금을 붙이는 작업"""
+
+    name = "route"
+    MODES = ("car", "pedestrian")
+
+    def __init__(self, mode: str = "car", start_lat: str = "start_lat", start_lon: str = "start_lon",
+                 end_lat: str = "end_lat", end_lon: str = "end_lon"):
+        if mode not in self.MODES:
+            raise ValueError(f"지원하지 않는 이동 수단: {mode} (가능한 값: {', '.join(self.MODES)})")
+        self.mode = mode
+        self.fields = (start_lat, start_lon, end_lat, end_lon)
+        self.columns: List[Column] = [("distance_m", "int"), ("time_s", "int")]
+        if mode == "car":
+            self.columns += [("toll_fare", "int"), ("taxi_fare", "int")]
+
+    def describe(self) -> Dict[str, Any]:
+        return {"task": self.name, "mode": self.mode, "fields": list(self.fields)}
+
+    def __call__(self, tmap: Any, row: Row) -> Union[Row, TmapError]:
+        try:
+            start_lat, start_lon, end_lat, end_lon = (float(row[field]) for field in self.fields)
+        except (KeyError, TypeError, ValueError):
+            return TmapError(f"{self.mode}_route", "INVALID_COORDINATE",
+                             f"좌표 열({', '.join(self.fields)})이 비어 있거나 숫자가 아닙니다.")
+        if self.mode == "car":
+            result = tmap.car_route(start_lon, start_lat, end_lon, end_lat)
+            return summarize_car(result) if result else result
+        result = tmap.pedestrian_route_summary(start_lon, start_lat, end_lon, end_lat, "출발지", "도착지")
+        return summarize_pedestrian(result) if result else result
+
+
+# ---------------------------------------------------------------------------
+# 입력
+# ---------------------------------------------------------------------------
+
+def open_input(path: str, batch_size: int = 1024) -> Tuple[List[str], Optional[Any], Iterator[Row]]:
+    """
+    입력 파일을 행 단위로 읽는 반복자
+
+    Returns:
+        (열 이름 목록, Parquet 스키마 또는 None, 행 딕셔너리 반복자)
+    """
+    if _is_parquet(path):
+        _require_pyarrow()
+        parquet = pq.ParquetFile(path)
+        schema = parquet.schema_arrow
+
+        def parquet_rows() -> Iterator[Row]:
+            for batch in parquet.iter_batches(batch_size=batch_size):
+                yield from batch.to_pylist()
+
+        return list(schema.names), schema, parquet_rows()
+
+    handle = open(path, newline="", encoding="utf-8-sig")
+    reader = csv.DictReader(handle)
+    fieldnames = list(reader.fieldnames or [])
+
+    def csv_rows() -> Iterator[Row]:
+        with handle:
+            yield from reader
+
+    return fieldnames, None, csv_rows()
+
+
+# ---------------------------------------------------------------------------
+# 출력
+# ---------------------------------------------------------------------------
+
+class CsvOutput:
+    """
+    결과 행을 CSV 파일에 이어 쓰는 출력
+
+    commit()은 버퍼를 디스크까지 내려쓰고 파일 크기를 반환하며, 이어서 실행할 때는 체크포인트에
+    남은 크기로 파일을 잘라 그 뒤에 쓴 (체크포인트에 반영되지 않은) 행을 지웁니다.
+    """
+
+    def __init__(self, path: str, fieldnames: List[str], position: Optional[int] = None):
+        exists = position is not None and os.path.exists(path)
+        self.handle = open(path, "r+" if exists else "w", newline="", encoding="utf-8")
+        if exists:
+            self.handle.seek(position)
+            self.handle.truncate()
+        self.writer = csv.DictWriter(self.handle, fieldnames=fieldnames, extrasaction="ignore")
+        if not exists:
+            self.writer.writeheader()
+
+    def write(self, row: Row) -> None:
+        self.writer.writerow(row)
+
+    def commit(self) -> int:
+        self.handle.flush()
+        os.fsync(self.handle.fileno())
+        return self.handle.tell()
+
+    def close(self) -> None:
+        self.handle.close()
+
+
+class ParquetOutput:
+    """
+    결과 행을 디렉터리 안의 Parquet 파트 파일(part-00000.parquet, ...)로 나눠 쓰는 출력
+
+    commit()마다 버퍼의 행을 파트 파일 하나로 쓰고 파트 수를 반환하며, 이어서 실행할 때는
+    체크포인트에 남은 수보다 뒤의 파트를 지웁니다.
+    """
+
+    _TYPES = {"float": "float64", "int": "int64", "str": "string"}
+
+    def __init__(self, path: str, input_schema: Optional[Any], fieldnames: List[str],
+                 columns: List[Column], position: Optional[int] = None):
+        _require_pyarrow()
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        types = {name: getattr(pa, self._TYPES[kind])() for name, kind in columns}
+        types.update({"row": pa.int64(), "error": pa.string()})
+        fields = []
+        for name in fieldnames:
+            if name in types:
+                fields.append(pa.field(name, types[name]))
+            elif input_schema is not None and name in input_schema.names:
+                fields.append(input_schema.field(name))
+            else:
+                fields.append(pa.field(name, pa.string()))
+        self.schema = pa.schema(fields)
+        self.parts = position or 0
+        for name in os.listdir(path):
+            if name.startswith("part-") and name.endswith(".parquet") and int(name[5:-8]) >= self.parts:
+                os.remove(os.path.join(path, name))
+        self._buffer: List[Row] = []
+
+    def write(self, row: Row) -> None:
+        self._buffer.append(row)
+
+    def commit(self) -> int:
+        if self._buffer:
+            table = pa.Table.from_pylist(self._buffer, schema=self.schema)
+            target = os.path.join(self.path, f"part-{self.parts:05d}.parquet")
+            pq.write_table(table, target + ".tmp")
+            os.replace(target + ".tmp", target)
+            self.parts += 1
+            self._buffer = []
+        return self.parts
+
+    def close(self) -> None:
+        self._buffer = []
+
+
+# ---------------------------------------------------------------------------
+# 체크포인트
+# ---------------------------------------------------------------------------
+
+class Checkpoint:
+    """
+    처리를 마친 행 번호 집합을 watermark + 그 뒤의 완료 행 번호로 압축해 보관
+
+    행은 동시에 처리되어 순서 없이 끝나지만, 앞쪽 행이 끝날 때마다 watermark를 올리므로
+    따로 보관하는 번호는 동시에 처리 중인 행 수 정도로만 남습니다.
+    """
+
+    def __init__(self, path: str, job: Dict[str, Any]):
+        self.path = path
+        self.job = job
+        self.watermark = -1
+        self.done: Set[int] = set()
+        self.position: Optional[int] = None
+        self.counts: Dict[str, int] = {"succeeded": 0, "failed": 0}
+        self.completed = False
+
+    def is_done(self, index: int) -> bool:
+        return index <= self.watermark or index in self.done
+
+    def mark(self, index: int) -> None:
+        self.done.add(index)
+        while self.watermark + 1 in self.done:
+            self.watermark += 1
+            self.done.discard(self.watermark)
+
+    def load(self) -> bool:
+        """저장된 체크포인트를 읽음 (없으면 False, 다른 작업의 체크포인트면 ValueError)"""
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("job") != self.job:
+            raise ValueError(f"체크포인트 {self.path}는 다른 작업의 것입니다: {state.get('job')}")
+        self.watermark = state["watermark"]
+        self.done = set(state["done"])
+        self.position = state["output_position"]
+        self.counts = state["counts"]
+        self.completed = state.get("completed", False)
+        return True
+
+    def save(self, position: int) -> None:
+        """임시 파일에 쓴 뒤 이름을 바꿔 원자적으로 저장"""
+        self.position = position
+        state = {"job": self.job, "watermark": self.watermark, "done": sorted(self.done),
+                 "output_position": position, "counts": self.counts, "completed": self.completed}
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+
+# ---------------------------------------------------------------------------
+# 실행기
+# ---------------------------------------------------------------------------
+
+class JobRunner:
+    """
+    입력 파일의 행마다 작업을 실행해 결과를 출력 파일에 쓰는 일괄 작업 실행기
+
+    사용 예:
+        runner = JobRunner(tmap, GeocodeTask("주소"), "addresses.csv", "geocoded.csv")
+        summary = runner.run()
+        if summary["status"] == "quota_exhausted":
+            ...  # 쿼터가 풀린 뒤 같은 설정으로 다시 run()
+    """
+
+    def __init__(self, tmap: Any, task: Any, input_path: str, output_path: str,
+                 checkpoint_path: Optional[str] = None, workers: int = 8, checkpoint_every: int = 1000,
+                 checkpoint_interval: float = 30.0, retries: int = 2, retry_backoff: float = 1.0,
+                 batch_size: int = 1024, lane: str = BACKGROUND):
+        """
+        Args:
+            tmap: TmapAPI 인스턴스 (속도 제한기를 달아 두면 모든 요청이 그 한도를 따름)
+            task: 행 하나를 처리하는 작업 (GeocodeTask, RouteTask)
+            input_path: 입력 CSV 또는 Parquet 파일
+            output_path: 출력 CSV 파일 또는 Parquet 파트 디렉터리(.parquet으로 끝나는 경로)
+            checkpoint_path: 체크포인트 파일 (None이면 <output_path>.checkpoint.json)
+            workers: 동시에 처리할 행 수
+            checkpoint_every: 체크포인트를 남기는 처리 행 수 간격 (Parquet은 파트 하나의 최대 행 수)
+            checkpoint_interval: 체크포인트를 남기는 최대 시간 간격(초)
+            retries: 일시적 오류(연결 오류, 5xx, 429)의 행별 재시도 횟수
+            retry_backoff: 첫 재시도 전 대기 시간(초, 재시도마다 2배)
+            batch_size: Parquet 입력을 읽는 배치 크기
+            lane: 요청 우선순위 레인 (같은 클라이언트를 쓰는 도구 호출을 방해하지 않도록 기본값 background)
+        """
+        self.tmap = tmap
+        self.task = task
+        self.input_path = input_path
+        self.output_path = output_path
+        self.checkpoint_path = checkpoint_path or f"{output_path.rstrip(os.sep)}.checkpoint.json"
+        self.workers = workers
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_interval = checkpoint_interval
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self.batch_size = batch_size
+        self.lane = lane
+
+    def _process(self, index: int, row: Row) -> Tuple[int, Row, Union[Row, TmapError]]:
+        for attempt in range(self.retries + 1):
+            try:
+                result = self.task(self.tmap, row)
+            except Exception as e:
+                # 응답 형식이 예상과 다른 행 하나 때문에 작업 전체가 멈추지 않도록 실패한 행으로 기록 (재시도하지 않음)
+                logger.exception("%d행 처리 실패", index, extra={"endpoint": self.task.name})
+                result = TmapError(self.task.name, "TASK_FAILED", f"{type(e).__name__}: {e}")
+                break
+            if not isinstance(result, TmapError) or _is_quota_exhausted(result) or not _is_retryable(result):
+                break
+            if attempt < self.retries:
+                time.sleep(self.retry_backoff * 2 ** attempt)
+        return index, row, result
+
+    def run(self, force: bool = False) -> Dict[str, Any]:
+        """
+        작업 실행 (체크포인트가 있으면 이어서 실행)
+
+        Args:
+            force: 체크포인트와 출력을 무시하고 처음부터 다시 실행
+
+        Returns:
+            {"status": "completed" 또는 "quota_exhausted", "processed", "skipped", "succeeded",
+             "failed", "watermark", "seconds"} 요약
+        """
+        job = {**self.task.describe(), "input": os.path.abspath(self.input_path)}
+        checkpoint = Checkpoint(self.checkpoint_path, job)
+        if force and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+        resumed = checkpoint.load()
+        if not resumed and os.path.exists(self.output_path) and not force:
+            raise FileExistsError(f"출력 {self.output_path}이 이미 있고 체크포인트가 없습니다. "
+                                  "처음부터 다시 실행하려면 force(--force)를 지정하세요.")
+
+        fieldnames, schema, rows = open_input(self.input_path, self.batch_size)
+        names = ["row"] + fieldnames + [name for name, _ in self.task.columns] + ["error"]
+        fieldnames = list(dict.fromkeys(names))
+        if _is_parquet(self.output_path):
+            output: Any = ParquetOutput(self.output_path, schema, fieldnames, self.task.columns, checkpoint.position)
+        else:
+            output = CsvOutput(self.output_path, fieldnames, checkpoint.position)
+        if resumed:
+            logger.info("체크포인트에서 이어서 실행: %d행까지 완료", checkpoint.watermark + 1,
+                        extra={"endpoint": self.task.name})
+
+        summary = {"processed": 0, "skipped": 0}
+        state = {"stop": None, "since": 0, "saved_at": time.monotonic()}
+        start = time.monotonic()
+
+        def collect(futures: Set[Future]) -> None:
+            for future in futures:
+                index, row, result = future.result()
+                if isinstance(result, TmapError) and _is_quota_exhausted(result):
+                    # 체크포인트에 남기지 않으므로 이어서 실행할 때 다시 처리
+                    state["stop"] = result
+                    continue
+                record = {**row, "row": index}
+                if isinstance(result, TmapError):
+                    record["error"] = f"{result.code}: {result.message}"
+                    checkpoint.counts["failed"] += 1
+                else:
+                    record.update(result)
+                    checkpoint.counts["succeeded"] += 1
+                output.write(record)
+                checkpoint.mark(index)
+                summary["processed"] += 1
+                state["since"] += 1
+            if (state["since"] >= self.checkpoint_every
+                    or time.monotonic() - state["saved_at"] >= self.checkpoint_interval):
+                save()
+
+        def save() -> None:
+            checkpoint.save(output.commit())
+            state["since"] = 0
+            state["saved_at"] = time.monotonic()
+            logger.info("체크포인트 저장: 처리 %d행, watermark %d", summary["processed"], checkpoint.watermark,
+                        extra={"endpoint": self.task.name})
+
+        # 트레이싱 span과 마감 시각은 호출한 쪽을 따르고, 요청은 지정한 우선순위 레인으로 보냄
+        with priority(self.lane):
+            context = contextvars.copy_context()
+        pending: Set[Future] = set()
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="tmap-job") as pool:
+                for index, row in enumerate(rows):
+                    if checkpoint.is_done(index):
+                        summary["skipped"] += 1
+                        continue
+                    while len(pending) >= 2 * self.workers:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        collect(done)
+                    if state["stop"] is not None:
+                        break
+                    pending.add(pool.submit(context.copy().run, self._process, index, row))
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+            checkpoint.completed = state["stop"] is None
+            save()
+        finally:
+            output.close()
+
+        status = "completed"
+        if state["stop"] is not None:
+            status = "quota_exhausted"
+            logger.warning("쿼터가 소진되어 작업을 멈춥니다. 같은 명령으로 이어서 실행할 수 있습니다: %s",
+                           state["stop"].message, extra={"endpoint": self.task.name, "code": state["stop"].code})
+        return {"status": status, **summary, **checkpoint.counts, "watermark": checkpoint.watermark,
+                "seconds": round(time.monotonic() - start, 3)}
+
+
+# ---------------------------------------------------------------------------
+# 명령줄
+# ---------------------------------------------------------------------------
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="TMAP 대용량 지오코딩/경로 일괄 작업")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    geocode_parser = sub.add_parser("geocode", help="주소 열을 위도/경도로 변환")
+    geocode_parser.add_argument("--address-column", default="address", help="주소 열 이름")
+
+    route_parser = sub.add_parser("route", help="출발/도착 좌표 열로 경로 거리, 시간, 요금 계산")
+    route_parser.add_argument("--mode", choices=RouteTask.MODES, default="car", help="이동 수단")
+    for name in ("start_lat", "start_lon", "end_lat", "end_lon"):
+        route_parser.add_argument(f"--{name.replace('_', '-')}-column", default=name, help=f"{name} 열 이름")
+
+    for command in (geocode_parser, route_parser):
+        command.add_argument("input", help="입력 CSV 또는 Parquet 파일")
+        command.add_argument("output", help="출력 CSV 파일 또는 Parquet 디렉터리(.parquet)")
+        command.add_argument("--checkpoint", help="체크포인트 파일 (기본값 <output>.checkpoint.json)")
+        command.add_argument("--workers", type=int, default=8, help="동시에 처리할 행 수")
+        command.add_argument("--rate", type=float, default=float(os.environ.get("TMAP_RATE_LIMIT") or 0),
+                             help="초당 요청 수 제한 (기본값 TMAP_RATE_LIMIT, 0이면 제한 없음)")
+        command.add_argument("--checkpoint-every", type=int, default=1000, help="체크포인트 간격(행)")
+        command.add_argument("--retries", type=int, default=2, help="일시적 오류의 행별 재시도 횟수")
+        command.add_argument("--priority", choices=LANES, default=BACKGROUND, help="요청 우선순위 레인")
+        command.add_argument("--base-url", default=os.environ.get("TMAP_BASE_URL"), help="API 서버 주소")
+        command.add_argument("--force", action="store_true", help="체크포인트를 무시하고 처음부터 다시 실행")
+
+    args = parser.parse_args()
+    configure_logging(level=os.environ.get("TMAP_LOG_LEVEL", "INFO"), log_file=os.environ.get("TMAP_LOG_FILE"),
+                      json_format=False)
+
+    # mcp_server와 같은 환경 변수로 키를 지정 (TMAP_APP_KEYS에 쉼표로 여러 키)
+    keys = [k.strip() for k in os.environ.get("TMAP_APP_KEYS", "").split(",") if k.strip()]
+    if os.environ.get("TMAP_APP_KEY") and os.environ["TMAP_APP_KEY"] not in keys:
+        keys.insert(0, os.environ["TMAP_APP_KEY"])
+    if not keys:
+        parser.error("TMAP_APP_KEY 환경 변수가 설정되지 않았습니다.")
+
+    tmap = TmapAPI(keys, base_url=args.base_url or DEFAULT_BASE_URL,
+                   rate_limiter=RateLimiter(args.rate, background_reserve=0.0) if args.rate else None)
+    if args.command == "geocode":
+        task: Any = GeocodeTask(args.address_column)
+    else:
+        task = RouteTask(args.mode, args.start_lat_column, args.start_lon_column,
+                         args.end_lat_column, args.end_lon_column)
+    runner = JobRunner(tmap, task, args.input, args.output, checkpoint_path=args.checkpoint,
+                       workers=args.workers, checkpoint_every=args.checkpoint_every,
+                       retries=args.retries, lane=args.priority)
+    try:
+        summary = runner.run(force=args.force)
+    except (FileExistsError, ValueError) as e:
+        parser.error(str(e))
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+    if summary["status"] == "quota_exhausted":
+        sys.exit(EXIT_QUOTA_EXHAUSTED)
+
+
+if __name__ == "__main__":
+    main()
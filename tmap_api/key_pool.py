@@ -0,0 +1,163 @@
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, Optional, Set
+
+# 키를 잠시 제외하는 상태 코드: 429(호출 제한/쿼터 초과), 401/403(인증 실패)
+RATE_LIMIT_STATUS = 429
+AUTH_STATUSES = (401, 403)
+
+
+def mask_key(key: str) -> str:
+    """로그나 통계에 남길 수 있도록 앱 키 가운데를 가림"""
+    if len(key) <= 8:
+        return "***"
+    return f"{key[:4]}...{key[-4:]}"
+
+
+class _KeyState:
+    """앱 키 하나의 사용량과 제외 상태"""
+
+    def __init__(self, quota: Optional[int]):
+        self.quota = quota
+        self.used = 0
+        self.in_flight = 0
+        self.cooldown_until = 0.0
+        self.cooldowns = 0
+        self.last_used = 0
+        self.status_codes: Counter = Counter()
+
+    def remaining(self) -> float:
+        if self.quota is None:
+            return float("inf")
+        return self.quota - self.used
+
+
+class KeyPool:
+    """
+    여러 TMAP 앱 키에 요청을 분산하는 키 풀
+
+    남은 쿼터가 가장 많은 키를 고르고(같으면 처리 중인 요청이 적은 키, 그것도 같으면 가장
+    오래전에 사용한 키), 429나 401/403을 받은 키는 일정 시간 순환에서 제외합니다. 모든 키가 제외된 상태라면 가장 먼저 복귀할 키를
+    그대로 사용해 판단을 서버에 맡깁니다.
+    """
+
+    def __init__(self, keys: Iterable[str], quota: Optional[int] = None,
+                 quota_period: float = 86400.0, rate_limit_cooldown: float = 1.0,
+                 quota_cooldown: float = 3600.0, auth_cooldown: float = 600.0):
+        """
+        키 풀 초기화
+
+        Args:
+            keys: 앱 키 목록 (중복은 제거)
+            quota: 키별 quota_period 동안의 호출 한도 (선택적, None이면 한도를 모르는 것으로 보고 균등 분산)
+            quota_period: 사용량을 초기화할 주기(초, 기본값 하루)
+            rate_limit_cooldown: 429 RATE_LIMIT_EXCEEDED 등 일시적 호출 제한 시 제외 시간(초)
+            quota_cooldown: 429 QUOTA_EXCEEDED 시 제외 시간(초)
+            auth_cooldown: 401/403 시 제외 시간(초)
+        """
+        self.keys = list(dict.fromkeys(k for k in keys if k))
+        if not self.keys:
+            raise ValueError("앱 키가 하나 이상 필요합니다.")
+        self.quota_period = quota_period
+        self.rate_limit_cooldown = rate_limit_cooldown
+        self.quota_cooldown = quota_cooldown
+        self.auth_cooldown = auth_cooldown
+        self._lock = threading.Lock()
+        self._states = {key: _KeyState(quota) for key in self.keys}
+        self._period_start = time.monotonic()
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _roll_period(self, now: float) -> None:
+        if now - self._period_start >= self.quota_period:
+            self._period_start = now
+            for state in self._states.values():
+                state.used = 0
+
+    def acquire(self, exclude: Optional[Set[str]] = None) -> Optional[str]:
+        """
+        요청에 사용할 키를 골라 처리 중으로 표시
+
+        Args:
+            exclude: 이번 요청에서 이미 실패한 키 (재시도 시 다른 키를 고르기 위해 사용)
+
+        Returns:
+            사용할 앱 키, exclude를 빼고 남은 키가 없으면 None
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._roll_period(now)
+            candidates = [k for k in self.keys if not exclude or k not in exclude]
+            if not candidates:
+                return None
+            available = [k for k in candidates if self._states[k].cooldown_until <= now]
+            if available:
+                # 쿼터를 모르거나 요청이 하나씩 오는 경우에도 돌아가며 쓰도록 가장 오래전에 쓴 키를 우선
+                key = max(available, key=lambda k: (self._states[k].remaining(), -self._states[k].in_flight,
+                                                    -self._states[k].last_used))
+            elif exclude:
+                # 재시도인데 다른 키가 모두 제외 상태면 더 시도하지 않음
+                return None
+            else:
+                key = min(candidates, key=lambda k: self._states[k].cooldown_until)
+            state = self._states[key]
+            self._sequence += 1
+            state.in_flight += 1
+            state.used += 1
+            state.last_used = self._sequence
+            return key
+
+    def release(self, key: str, status: Any, code: Optional[str] = None) -> bool:
+        """
+        요청 결과를 기록하고 필요하면 키를 순환에서 제외
+
+        Args:
+            key: acquire로 받은 앱 키
+            status: HTTP 상태 코드 또는 예외 발생 시 "exception"
+            code: TMAP 오류 코드 (예: "QUOTA_EXCEEDED")
+
+        Returns:
+            키가 제외되었으면 True (다른 키로 재시도할 수 있는 실패)
+        """
+        cooldown = 0.0
+        if status == RATE_LIMIT_STATUS:
+            cooldown = self.quota_cooldown if code and "QUOTA" in code.upper() else self.rate_limit_cooldown
+        elif status in AUTH_STATUSES:
+            cooldown = self.auth_cooldown
+        with self._lock:
+            state = self._states[key]
+            state.in_flight = max(0, state.in_flight - 1)
+            state.status_codes[str(status)] += 1
+            if cooldown:
+                state.cooldowns += 1
+                state.cooldown_until = max(state.cooldown_until, time.monotonic() + cooldown)
+        return bool(cooldown)
+
+    def cancel(self, key: str) -> None:
+        """acquire로 받은 키를 요청을 보내지 않고 반환 (쿼터 사용량도 되돌림)"""
+        with self._lock:
+            state = self._states[key]
+            state.in_flight = max(0, state.in_flight - 1)
+            state.used = max(0, state.used - 1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """키별 사용량, 남은 쿼터, 제외 상태 (키는 가린 형태)"""
+        now = time.monotonic()
+        with self._lock:
+            result = {}
+            for key in self.keys:
+                state = self._states[key]
+                remaining = state.remaining()
+                result[mask_key(key)] = {
+                    "used": state.used,
+                    "remaining": None if remaining == float("inf") else remaining,
+                    "in_flight": state.in_flight,
+                    "cooling_down": state.cooldown_until > now,
+                    "cooldown_remaining": round(max(0.0, state.cooldown_until - now), 3),
+                    "cooldowns": state.cooldowns,
+                    "status_codes": dict(state.status_codes),
+                }
+            return result
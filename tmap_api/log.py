@@ -0,0 +1,126 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger("tmap_api")
+logger.addHandler(logging.NullHandler())
+
+# 로그 레코드에 구조화된 필드로 남길 extra 키
+STRUCTURED_FIELDS = ("endpoint", "status", "code", "elapsed", "body", "suppressed")
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드를 한 줄짜리 JSON으로 변환하는 포매터"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class ErrorRateLimitFilter(logging.Filter):
+    """
+    같은 엔드포인트/상태 코드의 반복 오류 로그를 제한하는 필터
+
+    (endpoint, status) 조합마다 window초 동안 burst건까지만 통과시키고,
+    나머지는 버린 뒤 다음에 통과하는 레코드의 suppressed 필드로 버린 개수를 알려줍니다.
+    WARNING 미만 레코드와 endpoint가 없는 레코드는 그대로 통과합니다.
+    """
+
+    def __init__(self, burst: int = 5, window: float = 60.0):
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        self._lock = threading.Lock()
+        # key -> [window 시작 시각, 통과 건수, 버린 건수]
+        self._state: Dict[Tuple[str, str], list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        endpoint = getattr(record, "endpoint", None)
+        if endpoint is None or record.levelno < logging.WARNING:
+            return True
+        key = (endpoint, str(getattr(record, "status", None)))
+        now = time.monotonic()
+        with self._lock:
+            state = self._state.get(key)
+            if state is None or now - state[0] >= self.window:
+                suppressed = state[2] if state else 0
+                self._state[key] = [now, 1, 0]
+                if suppressed:
+                    record.suppressed = suppressed
+                return True
+            if state[1] < self.burst:
+                state[1] += 1
+                return True
+            state[2] += 1
+            return False
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def configure_logging(level: str = "WARNING", log_file: Optional[str] = None,
+                      json_format: bool = True, burst: int = 5, window: float = 60.0) -> None:
+    """
+    tmap_api 로거 설정
+
+    로그는 큐에 넣기만 하고 별도 스레드에서 stderr 또는 파일로 기록하므로
+    요청 처리 경로에서 I/O를 기다리지 않습니다. stdout은 MCP stdio 전송에서
+    JSON-RPC 스트림으로 쓰이므로 절대 사용하지 않습니다.
+
+    Args:
+        level: 로그 레벨 (DEBUG, INFO, WARNING, ERROR)
+        log_file: 로그 파일 경로 (None이면 stderr)
+        json_format: JSON 한 줄 형식 사용 여부 (False이면 사람이 읽는 텍스트 형식)
+        burst: 반복 오류 제한 - window 동안 통과시킬 최대 건수
+        window: 반복 오류 제한 - 집계 구간(초)
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+
+    if log_file:
+        target: logging.Handler = logging.FileHandler(log_file, encoding="utf-8")
+    else:
+        target = logging.StreamHandler(sys.stderr)
+    if json_format:
+        target.setFormatter(JsonFormatter())
+    else:
+        target.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, target)
+
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    for log_filter in list(logger.filters):
+        logger.removeFilter(log_filter)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.addFilter(ErrorRateLimitFilter(burst=burst, window=window))
+    logger.setLevel(level.upper())
+    logger.propagate = False
+    _listener.start()
+
+
+def _stop_listener() -> None:
+    if _listener is not None:
+        _listener.stop()
+
+
+atexit.register(_stop_listener)
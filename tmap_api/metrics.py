@@ -0,0 +1,330 @@
+import os
+import tempfile
+import threading
+from collections import Counter
+from typing import Any, Dict, Optional, Sequence, Union
+
+# 지연 시간 히스토그램 버킷 상한값(초)
+DEFAULT_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _EndpointStats:
+    """엔드포인트 하나에 대한 누적 통계"""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.abandoned = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.bytes_received = 0
+        self.bytes_wire = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.status_codes: Counter = Counter()
+        # 마지막 칸은 +Inf 버킷
+        self.bucket_counts = [0] * (len(buckets) + 1)
+
+
+class TmapMetrics:
+    """
+    TmapAPI 호출 계측 정보 수집기
+
+    엔드포인트별 지연 시간 히스토그램, 상태 코드 카운터, 수신 바이트 수,
+    재시도/헤지 횟수, 캐시별 적중률과 회로 차단기 상태를 스레드 안전하게 누적합니다.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        계측 수집기 초기화
+
+        Args:
+            buckets: 지연 시간 히스토그램 버킷 상한값 목록(초, 오름차순)
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, _EndpointStats] = {}
+        self._caches: Dict[str, Counter] = {}
+        # 엔드포인트 계열 -> {"state", "opens", "rejections"}
+        self._circuits: Dict[str, Dict[str, Any]] = {}
+        self._exporter: Optional[threading.Thread] = None
+        self._exporter_stop = threading.Event()
+
+    def _stats(self, endpoint: str) -> _EndpointStats:
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = self._endpoints[endpoint] = _EndpointStats(self.buckets)
+        return stats
+
+    def observe_request(self, endpoint: str, status: Union[int, str], elapsed: float,
+                        bytes_received: int = 0, bytes_wire: Optional[int] = None) -> None:
+        """
+        HTTP 요청 한 건의 결과 기록
+
+        Args:
+            endpoint: 엔드포인트 이름 (예: "search_poi_keyword")
+            status: HTTP 상태 코드 또는 예외 발생 시 "exception"
+            elapsed: 소요 시간(초)
+            bytes_received: 수신한 응답 본문 바이트 수 (압축 해제 후)
+            bytes_wire: 네트워크로 받은 응답 본문 바이트 수 (압축된 크기, None이면 bytes_received와 같음)
+        """
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if elapsed <= bound:
+                index = i
+                break
+        with self._lock:
+            stats = self._stats(endpoint)
+            stats.count += 1
+            stats.status_codes[str(status)] += 1
+            if not isinstance(status, int) or status >= 400:
+                stats.errors += 1
+            stats.bytes_received += bytes_received
+            stats.bytes_wire += bytes_received if bytes_wire is None else bytes_wire
+            stats.latency_sum += elapsed
+            stats.latency_max = max(stats.latency_max, elapsed)
+            stats.bucket_counts[index] += 1
+
+    def record_retry(self, endpoint: str) -> None:
+        """엔드포인트 재시도 1회 기록"""
+        with self._lock:
+            self._stats(endpoint).retries += 1
+
+    def record_abandoned(self, endpoint: str) -> None:
+        """마감 시각이 지나거나 취소되어 포기한 요청 1회 기록"""
+        with self._lock:
+            self._stats(endpoint).abandoned += 1
+
+    def record_hedge(self, endpoint: str, won: bool) -> None:
+        """
+        헤지(복제) 요청 1회 기록
+
+        Args:
+            endpoint: 엔드포인트 이름
+            won: 복제 요청의 응답이 원래 요청보다 먼저 도착했는지 여부
+        """
+        with self._lock:
+            stats = self._stats(endpoint)
+            stats.hedges += 1
+            if won:
+                stats.hedge_wins += 1
+
+    def record_cache(self, name: str, hit: bool, stale: bool = False) -> None:
+        """
+        캐시 조회 결과 기록
+
+        Args:
+            name: 캐시 이름 (예: "static_map")
+            hit: 캐시 적중 여부
+            stale: 만료된 값을 응답하고 백그라운드에서 갱신했는지 여부 (적중에 포함)
+        """
+        with self._lock:
+            counter = self._caches.setdefault(name, Counter())
+            counter["hits" if hit else "misses"] += 1
+            if stale:
+                counter["stale"] += 1
+
+    def record_circuit(self, family: str, state: str) -> None:
+        """
+        회로 차단기 상태 변경 기록
+
+        Args:
+            family: 엔드포인트 계열 (예: "/transit/routes")
+            state: 바뀐 상태 (closed, open, half_open)
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(family, {"state": "closed", "opens": 0, "rejections": 0})
+            circuit["state"] = state
+            if state == "open":
+                circuit["opens"] += 1
+
+    def record_circuit_rejection(self, family: str) -> None:
+        """회로가 열려 있어 바로 실패시킨 요청 1건 기록"""
+        with self._lock:
+            circuit = self._circuits.setdefault(family, {"state": "open", "opens": 0, "rejections": 0})
+            circuit["rejections"] += 1
+
+    def _quantile(self, stats: _EndpointStats, q: float) -> Optional[float]:
+        """히스토그램 버킷 상한값으로 근사한 분위수"""
+        if stats.count == 0:
+            return None
+        rank = q * stats.count
+        seen = 0
+        for i, n in enumerate(stats.bucket_counts):
+            seen += n
+            if seen >= rank:
+                return self.buckets[i] if i < len(self.buckets) else stats.latency_max
+        return stats.latency_max
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        현재까지의 계측 정보를 JSON 직렬화 가능한 딕셔너리로 반환
+
+        Returns:
+            {"endpoints": {...}, "caches": {...}, "circuits": {...}} 형식의 통계
+        """
+        with self._lock:
+            endpoints = {}
+            for name, stats in sorted(self._endpoints.items()):
+                endpoints[name] = {
+                    "count": stats.count,
+                    "errors": stats.errors,
+                    "retries": stats.retries,
+                    "abandoned": stats.abandoned,
+                    "hedges": stats.hedges,
+                    "hedge_wins": stats.hedge_wins,
+                    "bytes_received": stats.bytes_received,
+                    "bytes_wire": stats.bytes_wire,
+                    "status_codes": dict(stats.status_codes),
+                    "latency": {
+                        "avg": stats.latency_sum / stats.count if stats.count else None,
+                        "max": stats.latency_max,
+                        "p50": self._quantile(stats, 0.5),
+                        "p95": self._quantile(stats, 0.95),
+                        "p99": self._quantile(stats, 0.99),
+                        "buckets": {
+                            **{str(b): n for b, n in zip(self.buckets, stats.bucket_counts)},
+                            "+Inf": stats.bucket_counts[-1],
+                        },
+                    },
+                }
+            caches = {}
+            for name, counter in sorted(self._caches.items()):
+                total = counter["hits"] + counter["misses"]
+                caches[name] = {
+                    "hits": counter["hits"],
+                    "misses": counter["misses"],
+                    "stale": counter["stale"],
+                    "hit_ratio": counter["hits"] / total if total else None,
+                }
+            circuits = {name: dict(circuit) for name, circuit in sorted(self._circuits.items())}
+        return {"endpoints": endpoints, "caches": caches, "circuits": circuits}
+
+    def reset(self) -> None:
+        """누적된 계측 정보 초기화 (회로 차단기의 현재 상태는 유지)"""
+        with self._lock:
+            self._endpoints.clear()
+            self._caches.clear()
+            for circuit in self._circuits.values():
+                circuit["opens"] = circuit["rejections"] = 0
+
+    def to_prometheus(self) -> str:
+        """
+        계측 정보를 Prometheus 텍스트 노출 형식으로 변환
+
+        Returns:
+            Prometheus text format 문자열
+        """
+        lines = [
+            "# HELP tmap_request_duration_seconds TMAP API request latency",
+            "# TYPE tmap_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            caches = sorted((name, Counter(c)) for name, c in self._caches.items())
+            circuits = sorted((name, dict(c)) for name, c in self._circuits.items())
+            for name, stats in endpoints:
+                cumulative = 0
+                for bound, n in zip(self.buckets, stats.bucket_counts):
+                    cumulative += n
+                    lines.append(f'tmap_request_duration_seconds_bucket{{endpoint="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'tmap_request_duration_seconds_bucket{{endpoint="{name}",le="+Inf"}} {stats.count}')
+                lines.append(f'tmap_request_duration_seconds_sum{{endpoint="{name}"}} {stats.latency_sum}')
+                lines.append(f'tmap_request_duration_seconds_count{{endpoint="{name}"}} {stats.count}')
+
+            lines.append("# HELP tmap_responses_total TMAP API responses by status code")
+            lines.append("# TYPE tmap_responses_total counter")
+            for name, stats in endpoints:
+                for status, n in sorted(stats.status_codes.items()):
+                    lines.append(f'tmap_responses_total{{endpoint="{name}",status="{status}"}} {n}')
+
+            lines.append("# HELP tmap_response_bytes_total Response body bytes received")
+            lines.append("# TYPE tmap_response_bytes_total counter")
+            for name, stats in endpoints:
+                lines.append(f'tmap_response_bytes_total{{endpoint="{name}"}} {stats.bytes_received}')
+
+            lines.append("# HELP tmap_response_wire_bytes_total Response body bytes on the wire (before decompression)")
+            lines.append("# TYPE tmap_response_wire_bytes_total counter")
+            for name, stats in endpoints:
+                lines.append(f'tmap_response_wire_bytes_total{{endpoint="{name}"}} {stats.bytes_wire}')
+
+            lines.append("# HELP tmap_retries_total Request retries")
+            lines.append("# TYPE tmap_retries_total counter")
+            for name, stats in endpoints:
+                lines.append(f'tmap_retries_total{{endpoint="{name}"}} {stats.retries}')
+
+            lines.append("# HELP tmap_abandoned_total Requests abandoned after the caller's deadline or cancellation")
+            lines.append("# TYPE tmap_abandoned_total counter")
+            for name, stats in endpoints:
+                lines.append(f'tmap_abandoned_total{{endpoint="{name}"}} {stats.abandoned}')
+
+            lines.append("# HELP tmap_hedges_total Hedged duplicate requests sent")
+            lines.append("# TYPE tmap_hedges_total counter")
+            for name, stats in endpoints:
+                lines.append(f'tmap_hedges_total{{endpoint="{name}"}} {stats.hedges}')
+            lines.append("# HELP tmap_hedge_wins_total Hedged requests that answered first")
+            lines.append("# TYPE tmap_hedge_wins_total counter")
+            for name, stats in endpoints:
+                lines.append(f'tmap_hedge_wins_total{{endpoint="{name}"}} {stats.hedge_wins}')
+
+        lines.append("# HELP tmap_cache_requests_total Cache lookups by result")
+        lines.append("# TYPE tmap_cache_requests_total counter")
+        for name, counter in caches:
+            lines.append(f'tmap_cache_requests_total{{cache="{name}",result="hit"}} {counter["hits"]}')
+            lines.append(f'tmap_cache_requests_total{{cache="{name}",result="miss"}} {counter["misses"]}')
+            lines.append(f'tmap_cache_requests_total{{cache="{name}",result="stale"}} {counter["stale"]}')
+
+        lines.append("# HELP tmap_circuit_state Circuit breaker state per endpoint family (1 for the current state)")
+        lines.append("# TYPE tmap_circuit_state gauge")
+        for name, circuit in circuits:
+            for state in ("closed", "open", "half_open"):
+                lines.append(f'tmap_circuit_state{{family="{name}",state="{state}"}} {int(circuit["state"] == state)}')
+        lines.append("# HELP tmap_circuit_opens_total Times the circuit opened")
+        lines.append("# TYPE tmap_circuit_opens_total counter")
+        for name, circuit in circuits:
+            lines.append(f'tmap_circuit_opens_total{{family="{name}"}} {circuit["opens"]}')
+        lines.append("# HELP tmap_circuit_rejections_total Requests failed fast while the circuit was open")
+        lines.append("# TYPE tmap_circuit_rejections_total counter")
+        for name, circuit in circuits:
+            lines.append(f'tmap_circuit_rejections_total{{family="{name}"}} {circuit["rejections"]}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        """
+        Prometheus 텍스트 형식 파일 기록 (node_exporter textfile collector 용)
+
+        수집기가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체합니다.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, path)
+
+    def start_file_exporter(self, path: str, interval: float = 15.0) -> None:
+        """
+        백그라운드 스레드에서 주기적으로 Prometheus 파일 기록
+
+        Args:
+            path: 기록할 파일 경로
+            interval: 기록 주기(초)
+        """
+        if self._exporter is not None:
+            return
+        self._exporter_stop.clear()
+
+        def run():
+            while not self._exporter_stop.wait(interval):
+                try:
+                    self.write_prometheus(path)
+                except OSError:
+                    pass
+
+        self._exporter = threading.Thread(target=run, name="tmap-metrics-exporter", daemon=True)
+        self._exporter.start()
+
+    def stop_file_exporter(self) -> None:
+        """주기적 파일 기록 중지"""
+        self._exporter_stop.set()
+        self._exporter = None
@@ -0,0 +1,116 @@
+"""
+POI 키워드 검색 결과 페이지를 이어서 읽는 반복자
+
+호출한 쪽이 현재 페이지를 처리하는 동안 다음 페이지를 미리 요청하므로, 여러 페이지를 읽어도
+페이지마다 응답을 기다리는 시간이 겹칩니다.
+"""
+
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, Optional, Set
+
+from .errors import TmapError
+
+Poi = Dict[str, Any]
+
+
+def _poi_key(poi: Poi) -> Any:
+    """페이지 사이 중복 판별용 키 (id가 없으면 이름과 좌표)"""
+    return poi.get("id") or (poi.get("name"), poi.get("frontLat"), poi.get("frontLon"))
+
+
+class PoiPager:
+    """
+    search_poi_keyword 결과를 페이지 단위로 이어서 읽어 POI를 하나씩 내주는 반복자
+
+    사용 예:
+        pager = tmap.iter_poi_keyword("스타벅스", limit=100)
+        for poi in pager:
+            print(poi["name"])
+        if pager.error:
+            print(pager.error.message)
+
+    페이지 요청이 실패하면 반복을 멈추고 error에 TmapError를 남깁니다.
+    """
+
+    def __init__(self, tmap: Any, keyword: str, search_type: str = "all", page_size: int = 20,
+                 limit: Optional[int] = None, stop_when: Optional[Callable[[Poi], bool]] = None,
+                 max_pages: Optional[int] = None, prefetch: bool = True):
+        """
+        Args:
+            tmap: TmapAPI 인스턴스
+            keyword: 검색할 키워드
+            search_type: 검색 유형 (all, name, telno)
+            page_size: 페이지당 결과 수
+            limit: 내줄 최대 POI 수 (None이면 제한 없음)
+            stop_when: POI를 받아 True를 반환하면 그 POI까지 내주고 멈추는 함수
+            max_pages: 요청할 최대 페이지 수
+            prefetch: 현재 페이지를 내주는 동안 다음 페이지를 미리 요청할지 여부
+        """
+        self.tmap = tmap
+        self.keyword = keyword
+        self.search_type = search_type
+        self.page_size = page_size
+        self.limit = limit
+        self.stop_when = stop_when
+        self.max_pages = max_pages
+        self.prefetch = prefetch
+        self.total_count: Optional[int] = None
+        self.pages_fetched = 0
+        self.duplicates = 0
+        self.error: Optional[TmapError] = None
+
+    def _fetch(self, page: int) -> Any:
+        return self.tmap.search_poi_keyword(self.keyword, self.search_type, self.page_size, page=page)
+
+    def _has_page(self, page: int) -> bool:
+        if self.max_pages is not None and page > self.max_pages:
+            return False
+        if self.total_count is not None and (page - 1) * self.page_size >= self.total_count:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[Poi]:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tmap-poi-page") if self.prefetch else None
+        seen: Set[Any] = set()
+        yielded = 0
+        page = 1
+        pending: Optional[Future] = None
+        try:
+            while self._has_page(page):
+                result = pending.result() if pending is not None else self._fetch(page)
+                pending = None
+                if not result:
+                    # 204(결과 없음)는 마지막 페이지를 지난 것이므로 오류로 남기지 않음
+                    if isinstance(result, TmapError) and result.status != 204:
+                        self.error = result
+                    return
+                self.pages_fetched += 1
+                info = result["searchPoiInfo"]
+                self.total_count = int(info.get("totalCount") or 0)
+                pois = info["pois"]["poi"]
+
+                page += 1
+                needed = self.limit is None or yielded + len(pois) < self.limit
+                if executor is not None and needed and len(pois) >= self.page_size and self._has_page(page):
+                    # 트레이싱 span과 요청 우선순위가 호출한 쪽을 따르도록 컨텍스트를 복사해서 실행
+                    pending = executor.submit(contextvars.copy_context().run, self._fetch, page)
+
+                for poi in pois:
+                    key = _poi_key(poi)
+                    if key in seen:
+                        self.duplicates += 1
+                        continue
+                    seen.add(key)
+                    yield poi
+                    yielded += 1
+                    if self.limit is not None and yielded >= self.limit:
+                        return
+                    if self.stop_when is not None and self.stop_when(poi):
+                        return
+                if len(pois) < self.page_size:
+                    return
+        finally:
+            if executor is not None:
+                # 미리 요청한 페이지는 기다리지 않음 (응답 캐시가 있으면 다음 검색에서 재사용)
+                executor.shutdown(wait=False)
@@ -0,0 +1,420 @@
+import multiprocessing
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple
+
+from .deadline import POLL_INTERVAL, current_deadline
+
+# 요청 우선순위 (우선순위 레인)
+# - interactive: 에이전트가 기다리는 MCP 도구 호출
+# - normal: 우선순위를 지정하지 않은 라이브러리 호출
+# - background: 캐시 예열, 일괄 작업 등 사람이 기다리지 않는 요청
+INTERACTIVE = "interactive"
+NORMAL = "normal"
+BACKGROUND = "background"
+LANES = (INTERACTIVE, NORMAL, BACKGROUND)
+
+# 레인이 모두 밀려 있을 때 토큰/연결 슬롯을 나눠 받는 비율
+DEFAULT_WEIGHTS: Dict[str, float] = {INTERACTIVE: 8.0, NORMAL: 4.0, BACKGROUND: 1.0}
+
+_priority: ContextVar[str] = ContextVar("tmap_priority", default=NORMAL)
+
+
+def current_priority() -> str:
+    """현재 컨텍스트의 요청 우선순위"""
+    return _priority.get()
+
+
+@contextmanager
+def priority(name: str) -> Iterator[None]:
+    """
+    with 블록 안에서 보내는 요청의 우선순위 지정
+
+    사용 예:
+        with priority(BACKGROUND):
+            tmap.get_poi_detail(poi_id)
+    """
+    if name not in LANES:
+        raise ValueError(f"알 수 없는 우선순위: {name} (가능한 값: {', '.join(LANES)})")
+    token = _priority.set(name)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def parse_weights(text: Optional[str]) -> Dict[str, float]:
+    """"interactive=8,normal=4,background=1" 형식의 레인 가중치 (빠진 레인은 기본값)"""
+    weights = dict(DEFAULT_WEIGHTS)
+    for item in (text or "").split(","):
+        if not item.strip():
+            continue
+        name, _, value = item.partition("=")
+        name = name.strip()
+        if name not in LANES:
+            raise ValueError(f"알 수 없는 우선순위: {name} (가능한 값: {', '.join(LANES)})")
+        weights[name] = float(value)
+        if weights[name] <= 0:
+            raise ValueError(f"우선순위 가중치는 0보다 커야 합니다: {item.strip()}")
+    return weights
+
+
+class _Ticket:
+    """대기 중인 요청 하나 (tag가 작을수록 먼저 차례가 옴)"""
+
+    __slots__ = ("lane", "tag")
+
+    def __init__(self, lane: str, tag: float):
+        self.lane = lane
+        self.tag = tag
+
+
+class _FairQueue:
+    """
+    레인별 가중치로 차례를 정하는 대기열 (start-time fair queuing)
+
+    요청마다 ``max(가상 시각, 같은 레인의 직전 tag) + 1 / 가중치`` tag를 붙이고, 레인 맨 앞 요청 중
+    tag가 가장 작은 요청에 차례를 줍니다. 여러 레인이 밀려 있으면 가중치 비율로 나눠 받고,
+    대기열이 비어 있던 레인의 새 요청은 현재 가상 시각 바로 뒤 tag를 받으므로 다른 레인에
+    수천 건이 밀려 있어도 곧바로 차례가 옵니다.
+
+    호출하는 쪽이 잠금을 잡은 상태에서 사용합니다.
+    """
+
+    def __init__(self, weights: Dict[str, float]):
+        self.weights = {lane: float(weights.get(lane, DEFAULT_WEIGHTS[lane])) for lane in LANES}
+        self._queues: Dict[str, Deque[_Ticket]] = {lane: deque() for lane in LANES}
+        self._last_tag: Dict[str, float] = {lane: 0.0 for lane in LANES}
+        self._vtime = 0.0
+
+    def enqueue(self, lane: str) -> _Ticket:
+        tag = max(self._vtime, self._last_tag[lane]) + 1.0 / self.weights[lane]
+        self._last_tag[lane] = tag
+        ticket = _Ticket(lane, tag)
+        self._queues[lane].append(ticket)
+        return ticket
+
+    def remove(self, ticket: _Ticket) -> None:
+        """차례를 받았거나 기다리다 포기한 요청 제거"""
+        queue = self._queues[ticket.lane]
+        if queue and queue[0] is ticket:
+            queue.popleft()
+            self._vtime = max(self._vtime, ticket.tag)
+        else:
+            queue.remove(ticket)
+
+    def head(self, eligible: Dict[str, bool]) -> Optional[_Ticket]:
+        """eligible이 True인 레인의 맨 앞 요청 중 차례가 된 요청"""
+        best = None
+        for lane, queue in self._queues.items():
+            if queue and eligible[lane] and (best is None or queue[0].tag < best.tag):
+                best = queue[0]
+        return best
+
+    def waiting(self) -> Dict[str, int]:
+        return {lane: len(queue) for lane, queue in self._queues.items()}
+
+
+def _lane() -> str:
+    name = current_priority()
+    return name if name in LANES else NORMAL
+
+
+class RateLimiter:
+    """
+    초당 호출 수를 제한하는 토큰 버킷
+
+    토큰을 기다리는 요청은 우선순위 레인별 가중치로 차례를 받습니다(interactive:normal:background
+    기본 8:4:1). 또한 백그라운드 요청은 버킷에 background_reserve 비율 이상의 토큰이 남아 있을 때만
+    토큰을 가져가므로, 일괄 작업이 돌아가는 동안에도 도구 호출은 거의 기다리지 않습니다.
+
+    현재 컨텍스트에 마감 시각(deadline)이 있으면 그때까지만 기다리고, 기다리는 동안 취소 여부를
+    확인합니다.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None, background_reserve: float = 0.5,
+                 weights: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            rate: 초당 허용 요청 수
+            burst: 버킷 크기 (None이면 rate와 같음, 최소 1)
+            background_reserve: 백그라운드가 아닌 요청을 위해 남겨 둘 토큰 비율 (0~1)
+            weights: 우선순위 레인별 가중치 (None이면 DEFAULT_WEIGHTS)
+        """
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self.background_reserve = background_reserve
+        self.weights = dict(DEFAULT_WEIGHTS if weights is None else weights)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._cond = threading.Condition()
+        self._queue = _FairQueue(self.weights)
+        self._granted: Counter = Counter()
+        self._waited: Dict[str, float] = {}
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _floor(self, name: str) -> float:
+        """이 우선순위가 토큰을 가져간 뒤 남아 있어야 하는 최소 토큰 수"""
+        if name == BACKGROUND:
+            return min(self.burst * self.background_reserve, self.burst - 1)
+        return 0.0
+
+    def _available(self, now: float) -> float:
+        """현재 토큰 수 (_cond를 잡은 상태에서 호출)"""
+        self._refill(now)
+        return self._tokens
+
+    def _take(self, floor: float, now: float) -> Tuple[bool, float]:
+        """floor를 남기고 토큰 하나를 가져감: (성공 여부, 가져가기 전 토큰 수) (_cond를 잡은 상태에서 호출)"""
+        self._refill(now)
+        tokens = self._tokens
+        if tokens - 1 >= floor:
+            self._tokens = tokens - 1
+            return True, tokens
+        return False, tokens
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        현재 컨텍스트의 우선순위로 토큰 하나를 가져감 (없으면 차례가 올 때까지 대기)
+
+        Args:
+            timeout: 최대 대기 시간(초, None이면 무제한, 마감 시각이 있으면 둘 중 이른 쪽)
+
+        Returns:
+            토큰을 얻었으면 True, 시간 내에 얻지 못했거나 취소되었으면 False
+        """
+        lane = _lane()
+        floor = self._floor(lane)
+        current = current_deadline()
+        start = time.monotonic()
+        limit = None if timeout is None else start + timeout
+        with self._cond:
+            ticket = self._queue.enqueue(lane)
+            try:
+                while True:
+                    now = time.monotonic()
+                    tokens = self._available(now)
+                    eligible = {name: tokens - 1 >= self._floor(name) for name in LANES}
+                    wait: Optional[float] = None
+                    if self._queue.head(eligible) is ticket:
+                        granted, tokens = self._take(floor, now)
+                        if granted:
+                            self._queue.remove(ticket)
+                            ticket = None
+                            self._granted[lane] += 1
+                            self._waited[lane] = self._waited.get(lane, 0.0) + now - start
+                            self._cond.notify_all()
+                            return True
+                    if tokens - 1 < floor:
+                        wait = (1 + floor - tokens) / self.rate
+                    # 다른 레인에 차례를 넘긴 경우에는 토큰이 생기거나 차례가 바뀔 때(notify) 다시 확인
+                    left = current.remaining() if current is not None else None
+                    if limit is not None:
+                        left = limit - now if left is None else min(left, limit - now)
+                    if left is not None:
+                        if left <= 0:
+                            return False
+                        wait = left if wait is None else min(wait, left)
+                    if current is not None:
+                        wait = POLL_INTERVAL if wait is None else min(wait, POLL_INTERVAL)
+                    self._wait(wait)
+            finally:
+                if ticket is not None:
+                    # 포기한 요청이 맨 앞이었으면 다음 요청이 바로 차례를 확인하도록 깨움
+                    self._queue.remove(ticket)
+                    self._cond.notify_all()
+
+    def _wait(self, wait: Optional[float]) -> None:
+        self._cond.wait(wait)
+
+    def release(self, tokens: float = 1.0) -> None:
+        """쓰지 않은 토큰 반환 (요청을 보내지 않고 포기한 경우)"""
+        with self._cond:
+            self._refill(time.monotonic())
+            self._tokens = min(self.burst, self._tokens + tokens)
+            self._cond.notify_all()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 토큰 수, 레인별 허용 건수, 누적 대기 시간(초), 대기 중인 요청 수"""
+        with self._cond:
+            tokens = self._available(time.monotonic())
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "tokens": round(tokens, 3),
+                "weights": dict(self.weights),
+                "granted": dict(self._granted),
+                "waited": {name: round(value, 3) for name, value in self._waited.items()},
+                "waiting": self._queue.waiting(),
+            }
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    여러 프로세스가 함께 쓰는 토큰 버킷
+
+    토큰 수와 마지막 충전 시각을 공유 메모리(multiprocessing.Value)에 두므로, 워커 프로세스를
+    만들 때 인자로 넘기면 모든 워커가 하나의 초당 요청 한도를 나눠 씁니다. 레인별 차례는
+    프로세스 안에서 정하고, 백그라운드 예비 토큰(background_reserve)은 모든 프로세스에 적용됩니다.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None, background_reserve: float = 0.5,
+                 context: Optional[Any] = None, weights: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            rate: 초당 허용 요청 수 (전체 프로세스 합계)
+            burst: 버킷 크기 (None이면 rate와 같음, 최소 1)
+            background_reserve: 백그라운드가 아닌 요청을 위해 남겨 둘 토큰 비율 (0~1)
+            context: multiprocessing 컨텍스트 (None이면 기본 컨텍스트)
+            weights: 우선순위 레인별 가중치 (None이면 DEFAULT_WEIGHTS)
+        """
+        super().__init__(rate, burst, background_reserve, weights)
+        context = context or multiprocessing
+        self._shared_tokens = context.Value("d", self.burst, lock=False)
+        self._shared_updated = context.Value("d", time.monotonic(), lock=False)
+        self._shared_lock = context.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        for name in ("_cond", "_queue", "_granted", "_waited"):
+            state.pop(name)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._cond = threading.Condition()
+        self._queue = _FairQueue(self.weights)
+        self._granted = Counter()
+        self._waited = {}
+
+    def _refill_shared(self, now: float) -> float:
+        # _shared_lock을 잡은 상태에서 호출
+        tokens = min(self.burst, self._shared_tokens.value + (now - self._shared_updated.value) * self.rate)
+        self._shared_tokens.value = tokens
+        self._shared_updated.value = now
+        return tokens
+
+    def _available(self, now: float) -> float:
+        with self._shared_lock:
+            return self._refill_shared(now)
+
+    def _take(self, floor: float, now: float) -> Tuple[bool, float]:
+        with self._shared_lock:
+            tokens = self._refill_shared(now)
+            if tokens - 1 >= floor:
+                self._shared_tokens.value = tokens - 1
+                return True, tokens
+            return False, tokens
+
+    def _wait(self, wait: Optional[float]) -> None:
+        # 다른 프로세스가 토큰을 돌려줘도 이 프로세스에는 알림이 오지 않으므로 주기적으로 다시 확인
+        self._cond.wait(POLL_INTERVAL if wait is None else min(wait, POLL_INTERVAL))
+
+    def release(self, tokens: float = 1.0) -> None:
+        with self._shared_lock:
+            current = self._refill_shared(time.monotonic())
+            self._shared_tokens.value = min(self.burst, current + tokens)
+        with self._cond:
+            self._cond.notify_all()
+
+
+class SlotLimiter:
+    """
+    동시에 보내는 업스트림 요청 수(연결 슬롯)를 max_in_flight개로 제한
+
+    슬롯을 기다리는 요청은 RateLimiter와 같은 레인별 가중치로 차례를 받고, 백그라운드 요청은
+    background_reserve 비율의 슬롯을 남겨 두므로 일괄 작업이 연결을 모두 차지해도 도구 호출은
+    응답 하나를 기다리지 않고 바로 보낼 수 있습니다.
+    """
+
+    def __init__(self, max_in_flight: int, background_reserve: float = 0.25,
+                 weights: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            max_in_flight: 동시에 보낼 최대 요청 수
+            background_reserve: 백그라운드가 아닌 요청을 위해 남겨 둘 슬롯 비율 (0~1)
+            weights: 우선순위 레인별 가중치 (None이면 DEFAULT_WEIGHTS)
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight는 1 이상이어야 합니다.")
+        self.max_in_flight = max_in_flight
+        self.background_reserve = background_reserve
+        self.weights = dict(DEFAULT_WEIGHTS if weights is None else weights)
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        self._queue = _FairQueue(self.weights)
+        self._granted: Counter = Counter()
+        self._waited: Dict[str, float] = {}
+
+    def _limit(self, name: str) -> int:
+        """이 우선순위가 쓸 수 있는 최대 슬롯 수"""
+        if name == BACKGROUND:
+            return max(1, self.max_in_flight - int(self.max_in_flight * self.background_reserve))
+        return self.max_in_flight
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        현재 컨텍스트의 우선순위로 슬롯 하나를 가져감 (없으면 차례가 올 때까지 대기)
+
+        Args:
+            timeout: 최대 대기 시간(초, None이면 무제한, 마감 시각이 있으면 둘 중 이른 쪽)
+
+        Returns:
+            슬롯을 얻었으면 True, 시간 내에 얻지 못했거나 취소되었으면 False
+        """
+        lane = _lane()
+        current = current_deadline()
+        start = time.monotonic()
+        limit = None if timeout is None else start + timeout
+        with self._cond:
+            ticket = self._queue.enqueue(lane)
+            try:
+                while True:
+                    eligible = {name: self._in_flight < self._limit(name) for name in LANES}
+                    if self._queue.head(eligible) is ticket:
+                        self._queue.remove(ticket)
+                        ticket = None
+                        self._in_flight += 1
+                        self._granted[lane] += 1
+                        self._waited[lane] = self._waited.get(lane, 0.0) + time.monotonic() - start
+                        self._cond.notify_all()
+                        return True
+                    wait: Optional[float] = None
+                    left = current.remaining() if current is not None else None
+                    if limit is not None:
+                        left = limit - time.monotonic() if left is None else min(left, limit - time.monotonic())
+                    if left is not None:
+                        if left <= 0:
+                            return False
+                        wait = left
+                    if current is not None:
+                        wait = POLL_INTERVAL if wait is None else min(wait, POLL_INTERVAL)
+                    self._cond.wait(wait)
+            finally:
+                if ticket is not None:
+                    self._queue.remove(ticket)
+                    self._cond.notify_all()
+
+    def release(self) -> None:
+        """요청이 끝난 슬롯 반환"""
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._cond.notify_all()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """사용 중인 슬롯 수, 레인별 허용 건수, 누적 대기 시간(초), 대기 중인 요청 수"""
+        with self._cond:
+            return {
+                "max_in_flight": self.max_in_flight,
+                "in_flight": self._in_flight,
+                "weights": dict(self.weights),
+                "granted": dict(self._granted),
+                "waited": {name: round(value, 3) for name, value in self._waited.items()},
+                "waiting": self._queue.waiting(),
+            }
@@ -19,4 +19,10 @@ setup(
     install_requires=[
         "requests>=2.25.0",
     ],
+    extras_require={
+        "geometry": ["numpy>=1.24"],
+        "http2": ["httpx[http2,brotli]>=0.27"],
+        "parquet": ["pyarrow>=14.0"],
+        "all": ["numpy>=1.24", "httpx[http2,brotli]>=0.27", "pyarrow>=14.0"],
+    },
 ) 
\ No newline at end of file
@@ -0,0 +1,158 @@
+"""
+경로 GeoJSON의 선형 좌표 단순화
+
+pedestrian_route_detail, car_route 응답의 LineString 꼭짓점 중 허용 오차(m) 안에서 모양에
+영향이 없는 점을 지웁니다. 경로를 그리거나 거리를 재는 용도에는 충분하면서 메모리, 직렬화
+시간, MCP 응답 크기를 줄입니다. LineString의 시작점과 끝점은 항상 남기므로 구간 사이의
+연결과 안내 지점(Point)은 그대로입니다.
+
+선택 의존성:
+    pip install numpy
+"""
+
+import heapq
+import math
+from typing import Any, Dict, List
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - 선택 의존성
+    np = None
+
+DOUGLAS_PEUCKER = "douglas_peucker"
+VISVALINGAM = "visvalingam"
+METHODS = (DOUGLAS_PEUCKER, VISVALINGAM)
+
+_METERS_PER_DEGREE = math.pi / 180 * 6371008.8
+
+
+def available() -> bool:
+    """NumPy가 설치되어 있어 단순화를 쓸 수 있는지 여부"""
+    return np is not None
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("경로 단순화에는 numpy가 필요합니다: pip install numpy")
+
+
+def _project(coordinates: "np.ndarray") -> "np.ndarray":
+    """[경도, 위도] 배열을 첫 점 기준 로컬 평면 좌표(m)로 변환 (경로 길이 수준에서는 충분히 정확)"""
+    origin = coordinates[0]
+    scale = np.array([math.cos(math.radians(coordinates[:, 1].mean())), 1.0]) * _METERS_PER_DEGREE
+    return (coordinates - origin) * scale
+
+
+def _douglas_peucker(points: "np.ndarray", tolerance: float) -> "np.ndarray":
+    """남길 꼭짓점 마스크 (구간마다 안쪽 점들의 선분 거리를 한 번에 계산)"""
+    keep = np.zeros(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        segment = points[last] - points[first]
+        offsets = points[first + 1:last] - points[first]
+        length2 = float(segment @ segment)
+        if length2 == 0.0:
+            distances = np.hypot(offsets[:, 0], offsets[:, 1])
+        else:
+            t = np.clip(offsets @ segment / length2, 0.0, 1.0)
+            nearest = offsets - t[:, None] * segment
+            distances = np.hypot(nearest[:, 0], nearest[:, 1])
+        index = int(distances.argmax())
+        if distances[index] > tolerance:
+            split = first + 1 + index
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return keep
+
+
+def _triangle_areas(points: "np.ndarray", prev: "np.ndarray", curr: "np.ndarray", nxt: "np.ndarray") -> "np.ndarray":
+    a, b, c = points[prev], points[curr], points[nxt]
+    return np.abs((b[..., 0] - a[..., 0]) * (c[..., 1] - a[..., 1])
+                  - (c[..., 0] - a[..., 0]) * (b[..., 1] - a[..., 1])) / 2
+
+
+def _visvalingam(points: "np.ndarray", tolerance: float) -> "np.ndarray":
+    """남길 꼭짓점 마스크 (유효 면적이 tolerance² 미만인 점을 작은 것부터 제거)"""
+    n = len(points)
+    keep = np.ones(n, dtype=bool)
+    if n < 3:
+        return keep
+    threshold = tolerance * tolerance
+    prev = list(range(-1, n - 1))
+    nxt = list(range(1, n + 1))
+    inner = np.arange(1, n - 1)
+    areas = _triangle_areas(points, inner - 1, inner, inner + 1)
+    heap = [(float(area), int(i)) for area, i in zip(areas, inner)]
+    heapq.heapify(heap)
+    current = {int(i): float(area) for area, i in zip(areas, inner)}
+    while heap:
+        area, i = heapq.heappop(heap)
+        if not keep[i] or current.get(i) != area:
+            continue  # 이미 지웠거나 면적이 갱신된 항목
+        if area >= threshold:
+            break
+        keep[i] = False
+        p, q = prev[i], nxt[i]
+        nxt[p], prev[q] = q, p
+        for j in (p, q):
+            if 0 < j < n - 1:
+                # 이웃 점의 면적이 지운 점보다 작아지지 않도록 유지 (Visvalingam-Whyatt)
+                updated = max(area, float(_triangle_areas(points, prev[j], j, nxt[j])))
+                current[j] = updated
+                heapq.heappush(heap, (updated, j))
+    return keep
+
+
+def simplify_line(coordinates: List[List[float]], tolerance_m: float,
+                  method: str = DOUGLAS_PEUCKER) -> List[List[float]]:
+    """
+    [경도, 위도] 좌표 목록 단순화
+
+    Args:
+        coordinates: LineString 좌표
+        tolerance_m: 허용 오차(m). Douglas-Peucker는 원래 선과의 최대 거리,
+            Visvalingam은 tolerance_m² 미만의 유효 면적을 갖는 점을 제거
+        method: douglas_peucker 또는 visvalingam
+
+    Returns:
+        남은 좌표 목록 (시작점과 끝점은 항상 포함)
+    """
+    _require_numpy()
+    if method not in METHODS:
+        raise ValueError(f"지원하지 않는 단순화 방식: {method} (가능한 값: {', '.join(METHODS)})")
+    if len(coordinates) < 3 or tolerance_m <= 0:
+        return coordinates
+    points = _project(np.asarray(coordinates, dtype=float))
+    keep = (_douglas_peucker if method == DOUGLAS_PEUCKER else _visvalingam)(points, tolerance_m)
+    return [coordinates[i] for i in np.flatnonzero(keep)]
+
+
+def simplify_route(result: Dict[str, Any], tolerance_m: float,
+                   method: str = DOUGLAS_PEUCKER) -> Dict[str, Any]:
+    """
+    경로 GeoJSON(FeatureCollection)의 모든 LineString을 단순화한 사본
+
+    원본(캐시에 있는 응답일 수 있음)은 바꾸지 않으며, 결과에
+    ``_simplified: {"method", "tolerance_m", "vertices", "removed"}``를 덧붙입니다.
+    """
+    simplified = dict(result)
+    features = []
+    before = after = 0
+    for feature in result.get("features", []):
+        geometry = feature.get("geometry") or {}
+        if geometry.get("type") == "LineString":
+            coordinates = geometry.get("coordinates") or []
+            reduced = simplify_line(coordinates, tolerance_m, method)
+            before += len(coordinates)
+            after += len(reduced)
+            feature = {**feature, "geometry": {**geometry, "coordinates": reduced}}
+        features.append(feature)
+    simplified["features"] = features
+    simplified["_simplified"] = {"method": method, "tolerance_m": tolerance_m,
+                                 "vertices": after, "removed": before - after}
+    return simplified
@@ -0,0 +1,245 @@
+"""
+지도 타일 단위로 주변 POI 검색 결과를 캐시하는 공간 캐시
+
+주변 검색(/tmap/pois/search/around)을 요청 중심점마다 새로 보내는 대신, 검색 반경이 걸치는
+웹 메르카토르 타일(기본 zoom 15, 서울 기준 한 변 약 970m)별로 카테고리 POI를 저장합니다.
+근처에서 겹치는 검색은 이미 받은 타일을 재사용하고 빠진 타일만 요청합니다.
+"""
+
+import contextvars
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from .cache import BudgetStore, CacheEntry
+from .errors import TmapError
+from .metrics import TmapMetrics
+from .tracing import current_span
+
+EARTH_RADIUS = 6371008.8
+
+Tile = Tuple[int, int, int]
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """두 WGS84 좌표 사이의 대원 거리(m)"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi, dlam = phi2 - phi1, math.radians(lon2 - lon1)
+    h = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlam / 2) ** 2
+    return 2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(h)))
+
+
+def tile_for(lat: float, lon: float, zoom: int) -> Tile:
+    """좌표가 속한 웹 메르카토르 타일 (zoom, x, y)"""
+    n = 2 ** zoom
+    x = int((lon + 180.0) / 360.0 * n)
+    y = int((1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0 * n)
+    return zoom, min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def tile_bounds(tile: Tile) -> Tuple[float, float, float, float]:
+    """타일 경계 (south, west, north, east)"""
+    zoom, x, y = tile
+    n = 2 ** zoom
+
+    def lat(row: int) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * row / n))))
+
+    return lat(y + 1), x / n * 360.0 - 180.0, lat(y), (x + 1) / n * 360.0 - 180.0
+
+
+def tiles_covering(lat: float, lon: float, radius_m: float, zoom: int) -> List[Tile]:
+    """중심 (lat, lon), 반경 radius_m인 원과 겹치는 타일 목록 (중심에서 가까운 순)"""
+    dlat = math.degrees(radius_m / EARTH_RADIUS)
+    dlon = dlat / max(math.cos(math.radians(lat)), 1e-6)
+    _, x0, y0 = tile_for(lat + dlat, lon - dlon, zoom)
+    _, x1, y1 = tile_for(lat - dlat, lon + dlon, zoom)
+    tiles = []
+    for x in range(x0, x1 + 1):
+        for y in range(y0, y1 + 1):
+            south, west, north, east = tile_bounds((zoom, x, y))
+            # 타일 안에서 중심과 가장 가까운 점까지의 거리로 겹침 판정
+            nearest = haversine(lat, lon, min(max(lat, south), north), min(max(lon, west), east))
+            if nearest <= radius_m:
+                tiles.append((nearest, (zoom, x, y)))
+    return [tile for _, tile in sorted(tiles)]
+
+
+def poi_position(poi: Dict[str, Any]) -> Tuple[float, float]:
+    """POI의 (위도, 경도) (중심 좌표 noorLat/noorLon, 없으면 입구 좌표)"""
+    lat = poi.get("noorLat") or poi.get("frontLat")
+    lon = poi.get("noorLon") or poi.get("frontLon")
+    return float(lat), float(lon)
+
+
+def parse_categories(categories: Union[str, Iterable[str]]) -> List[str]:
+    """"카페;편의점" 또는 "카페,편의점" 형식을 중복 없는 카테고리 목록으로 변환"""
+    if isinstance(categories, str):
+        categories = categories.replace(",", ";").split(";")
+    result: List[str] = []
+    for category in categories:
+        category = category.strip()
+        if category and category not in result:
+            result.append(category)
+    return result
+
+
+class TileCache:
+    """
+    (카테고리, 타일)별 주변 검색 결과 캐시
+
+    타일 하나를 채울 때는 타일 중심에서 타일 전체를 덮는 반경으로 주변 검색을 보내고,
+    타일 안에 있는 POI만 저장합니다. 그래서 인접 타일 사이에 POI가 중복 저장되지 않고,
+    어떤 중심점/반경의 검색이든 겹치는 타일을 모아 거리로 거르기만 하면 됩니다.
+    """
+
+    def __init__(self, store: Optional[Any] = None, zoom: int = 15, ttl: float = 86400.0,
+                 page_size: int = 200, max_pages: int = 2, max_tiles: int = 64, workers: int = 8,
+                 metrics: Optional[TmapMetrics] = None):
+        """
+        Args:
+            store: 캐시 저장소 (ResponseCache와 같은 get/set 인터페이스, None이면 BudgetStore)
+            zoom: 타일 zoom 레벨
+            ttl: 타일 유효 시간(초)
+            page_size: 타일을 채울 때 페이지당 요청할 POI 수 (TMAP 최대 200)
+            max_pages: 타일 하나를 채울 때 요청할 최대 페이지 수
+            max_tiles: 검색 한 번이 걸칠 수 있는 최대 타일 수 (넘으면 오류)
+            workers: 빠진 타일을 동시에 채울 요청 수
+            metrics: 타일 적중률을 기록할 계측 수집기 (선택적)
+        """
+        self.store = store if store is not None else BudgetStore()
+        self.zoom = zoom
+        self.ttl = ttl
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.max_tiles = max_tiles
+        self.metrics = metrics
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tmap-tile")
+
+    @staticmethod
+    def key(host: str, category: str, tile: Tile) -> str:
+        """타일 캐시 키 (스텁 서버 등 다른 호스트의 결과와 섞이지 않도록 API 호스트 포함)"""
+        zoom, x, y = tile
+        return f"around_tile:{host}:{category}:{zoom}/{x}/{y}"
+
+    @staticmethod
+    def _host(tmap: Any) -> str:
+        return urlsplit(tmap.base_url).netloc
+
+    def _cached(self, host: str, category: str, tile: Tile) -> Optional[Dict[str, Any]]:
+        entry = self.store.get(self.key(host, category, tile))
+        if entry is None or time.time() - entry.fetched_at > self.ttl:
+            return None
+        return entry.value
+
+    def _fill(self, tmap: Any, category: str, tile: Tile) -> Union[Dict[str, Any], TmapError]:
+        """타일 중심에서 주변 검색을 보내 타일 안의 POI를 저장"""
+        south, west, north, east = tile_bounds(tile)
+        center_lat, center_lon = (south + north) / 2, (west + east) / 2
+        # TMAP 주변 검색 반경은 km 단위 정수
+        radius_km = max(1, math.ceil(haversine(center_lat, center_lon, north, east) / 1000))
+        pois: List[Dict[str, Any]] = []
+        complete = False
+        for page in range(1, self.max_pages + 1):
+            result = tmap.search_poi_around(center_lat, center_lon, category, radius_km,
+                                            count=self.page_size, page=page)
+            if not result:
+                if isinstance(result, TmapError) and result.status != 204:
+                    return result
+                complete = True  # 204: 더 이상 결과 없음
+                break
+            info = result["searchPoiInfo"]
+            page_pois = info["pois"]["poi"]
+            for poi in page_pois:
+                lat, lon = poi_position(poi)
+                # 경계에 걸친 POI가 두 타일에 모두 들어가지 않도록 남/서쪽 경계만 포함
+                if south <= lat < north and west <= lon < east:
+                    pois.append(poi)
+            if len(page_pois) < self.page_size or page * self.page_size >= int(info.get("totalCount") or 0):
+                complete = True
+                break
+        value = {"pois": pois, "complete": complete}
+        self.store.set(self.key(self._host(tmap), category, tile), CacheEntry(value, time.time()))
+        return value
+
+    def search(self, tmap: Any, lat: float, lon: float, categories: Union[str, Iterable[str]],
+               radius_m: float = 500, limit: Optional[int] = 30) -> Union[Dict[str, Any], TmapError]:
+        """
+        중심점 반경 안의 카테고리 POI를 가까운 순으로 반환
+
+        Args:
+            tmap: TmapAPI 인스턴스
+            lat: 중심 위도
+            lon: 중심 경도
+            categories: 카테고리 ("카페;편의점" 형식 문자열 또는 목록)
+            radius_m: 검색 반경(m)
+            limit: 최대 POI 수 (None이면 전부)
+
+        Returns:
+            {"pois": [... "distance_m" 포함], "count", "truncated", "tiles": {...}} 또는 실패시 TmapError
+        """
+        categories = parse_categories(categories)
+        if not categories:
+            return TmapError("search_poi_nearby", "INVALID_CATEGORY", "카테고리를 하나 이상 지정해야 합니다.")
+        tiles = tiles_covering(lat, lon, radius_m, self.zoom)
+        if len(tiles) * len(categories) > self.max_tiles:
+            return TmapError("search_poi_nearby", "RADIUS_TOO_LARGE",
+                             f"검색 범위가 타일 {len(tiles) * len(categories)}개에 걸칩니다 "
+                             f"(최대 {self.max_tiles}개). 반경이나 카테고리 수를 줄여 주세요.")
+
+        host = self._host(tmap)
+        values: Dict[Tuple[str, Tile], Any] = {}
+        missing = []
+        for category in categories:
+            for tile in tiles:
+                value = self._cached(host, category, tile)
+                if self.metrics is not None:
+                    self.metrics.record_cache("around_tile", value is not None)
+                if value is None:
+                    missing.append((category, tile))
+                else:
+                    values[(category, tile)] = value
+        # 모든 타일이 캐시에 있으면 HTTP 요청 span이 없으므로 현재 span에 캐시 적중 여부를 남김
+        span = current_span()
+        span.set_attribute("cache.hit", not missing)
+        span.set_attribute("cache.stale", False)
+        span.set_attribute("cache.tiles_hit", len(values))
+        span.set_attribute("cache.tiles_missed", len(missing))
+
+        # 트레이싱 span과 요청 우선순위가 호출한 쪽을 따르도록 타일마다 컨텍스트를 복사해서 실행
+        futures = [(item, self._executor.submit(contextvars.copy_context().run, self._fill, tmap, *item))
+                   for item in missing]
+        errors = []
+        for item, future in futures:
+            value = future.result()
+            if value:
+                values[item] = value
+            else:
+                errors.append(value)
+        if errors and not values:
+            return errors[0]
+
+        found: Dict[Any, Dict[str, Any]] = {}
+        for value in values.values():
+            for poi in value["pois"]:
+                poi_lat, poi_lon = poi_position(poi)
+                distance = haversine(lat, lon, poi_lat, poi_lon)
+                if distance <= radius_m:
+                    found[poi.get("id") or (poi.get("name"), poi_lat, poi_lon)] = {**poi, "distance_m": round(distance, 1)}
+        pois = sorted(found.values(), key=lambda poi: poi["distance_m"])
+        result: Dict[str, Any] = {
+            "pois": pois[:limit] if limit is not None else pois,
+            "count": len(pois),
+            # 타일 중 일부가 max_pages 안에 다 채워지지 않았거나 요청에 실패했으면 빠진 POI가 있을 수 있음
+            "truncated": bool(errors) or not all(value["complete"] for value in values.values()),
+            "tiles": {"total": len(tiles) * len(categories), "fetched": len(missing) - len(errors),
+                      "failed": len(errors)},
+        }
+        if errors:
+            result["errors"] = [error["error"] for error in errors]
+        return result
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
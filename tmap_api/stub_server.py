@@ -0,0 +1,621 @@
+"""
+TmapAPI가 사용하는 TMAP 엔드포인트를 흉내 내는 로컬 스텁 서버
+
+실제 앱 키나 네트워크 없이 벤치마크, 테스트, 부하 테스트를 돌리기 위한 용도이며,
+응답 본문은 요청 파라미터로부터 결정적으로 생성한 합성 데이터입니다.
+지연 시간 분포, 429/5xx 오류 주입, 앱 키별 쿼터/초당 호출 제한을 흉내 낼 수 있습니다.
+
+단독 실행:
+    python -m tmap_api.stub_server --port 8080 --latency lognormal:0.08,0.5 \
+        --error-rate 503=0.01 --error-rate 429=0.005 --quota 10000 --rate 20
+
+클라이언트 연결:
+    TmapAPI(app_key="stub", base_url="http://127.0.0.1:8080")
+    (MCP 서버는 TMAP_BASE_URL=http://127.0.0.1:8080)
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, unquote, urlsplit
+
+# 1x1 투명 PNG
+_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000001e221bc330000000049454e44ae426082"
+)
+
+
+def _seed(*parts: Any) -> int:
+    raw = "|".join(str(p) for p in parts).encode("utf-8")
+    return int.from_bytes(hashlib.md5(raw).digest()[:4], "big")
+
+
+def _coord(seed: int) -> Tuple[float, float]:
+    """서울 근방의 결정적 좌표 (위도, 경도)"""
+    return 37.45 + (seed % 2000) / 10000, 126.85 + (seed // 2000 % 3000) / 10000
+
+
+def _line(start: Tuple[float, float], end: Tuple[float, float], n: int) -> List[List[float]]:
+    """출발지와 도착지 사이를 n개 점으로 잇는 [경도, 위도] 좌표 목록"""
+    n = max(n, 2)
+    return [[start[0] + (end[0] - start[0]) * i / (n - 1),
+             start[1] + (end[1] - start[1]) * i / (n - 1)] for i in range(n)]
+
+
+def poi_search(params: Dict[str, str]) -> Dict[str, Any]:
+    keyword = params.get("searchKeyword", "")
+    count = int(params.get("count", 20))
+    page = int(params.get("page", 1))
+    total = 45
+    start = (page - 1) * count
+    pois = []
+    for i in range(start, min(start + count, total)):
+        lat, lon = _coord(_seed(keyword, i))
+        pois.append({
+            "id": str(1000000 + _seed(keyword, i) % 9000000),
+            "name": f"{keyword} {i + 1}",
+            "frontLat": f"{lat:.7f}", "frontLon": f"{lon:.7f}",
+            "noorLat": f"{lat:.7f}", "noorLon": f"{lon:.7f}",
+            "upperAddrName": "서울", "middleAddrName": "중구", "lowerAddrName": "태평로1가",
+        })
+    return {"searchPoiInfo": {
+        "totalCount": str(total), "count": str(len(pois)), "page": str(page),
+        "pois": {"poi": pois},
+    }}
+
+
+def poi_around(params: Dict[str, str]) -> Dict[str, Any]:
+    """
+    중심 좌표 반경 안의 카테고리 POI (약 220m 간격 격자 칸마다 0~2개를 결정적으로 배치)
+
+    같은 위치의 POI는 어느 중심점에서 검색해도 같은 id와 좌표를 가지므로, 겹치는 검색 결과를 비교할 수 있습니다.
+    """
+    center_lat, center_lon = float(params.get("centerLat", 37.5665)), float(params.get("centerLon", 126.978))
+    radius = float(params.get("radius", 1)) * 1000
+    count, page = int(params.get("count", 20)), int(params.get("page", 1))
+    step = 0.002
+    dlat = radius / 111320
+    dlon = dlat / math.cos(math.radians(center_lat))
+    found = []
+    for category in unquote(params.get("categories", "")).split(";"):
+        for row in range(math.floor((center_lat - dlat) / step), math.floor((center_lat + dlat) / step) + 1):
+            for col in range(math.floor((center_lon - dlon) / step), math.floor((center_lon + dlon) / step) + 1):
+                seed = _seed(category, row, col)
+                for i in range(seed % 3):
+                    lat = (row + ((seed >> (8 + 4 * i)) % 16) / 16) * step
+                    lon = (col + ((seed >> (16 + 4 * i)) % 16) / 16) * step
+                    distance = math.hypot((lat - center_lat) * 111320, (lon - center_lon) * 111320 * math.cos(math.radians(lat)))
+                    if distance <= radius:
+                        found.append((distance, {
+                            "id": str(_seed(category, row, col, i) % 90000000 + 10000000),
+                            "name": f"{category} {row}-{col}-{i}",
+                            "frontLat": f"{lat:.7f}", "frontLon": f"{lon:.7f}",
+                            "noorLat": f"{lat:.7f}", "noorLon": f"{lon:.7f}",
+                            "radius": f"{distance / 1000:.3f}", "upperBizName": category,
+                        }))
+    found.sort(key=lambda item: item[0])
+    pois = [poi for _, poi in found[(page - 1) * count:page * count]]
+    return {"searchPoiInfo": {
+        "totalCount": str(len(found)), "count": str(len(pois)), "page": str(page),
+        "pois": {"poi": pois},
+    }}
+
+
+def poi_detail(poi_id: str) -> Dict[str, Any]:
+    lat, lon = _coord(_seed(poi_id))
+    return {"poiDetailInfo": {
+        "id": poi_id, "name": f"장소 {poi_id}", "address": "서울 중구 세종대로 110",
+        "lat": f"{lat:.7f}", "lon": f"{lon:.7f}", "tel": "02-120",
+        "desc": "스텁 서버가 생성한 장소 정보입니다. " * 8,
+    }}
+
+
+def geocoding(params: Dict[str, str]) -> Dict[str, Any]:
+    lat, lon = _coord(_seed(params.get("city_do"), params.get("gu_gun"), params.get("dong")))
+    return {"coordinateInfo": {
+        "city_do": unquote(params.get("city_do", "")), "gu_gun": unquote(params.get("gu_gun", "")),
+        "legalDong": unquote(params.get("dong", "")),
+        "lat": f"{lat:.7f}", "lon": f"{lon:.7f}", "latEntr": f"{lat:.7f}", "lonEntr": f"{lon:.7f}",
+    }}
+
+
+def full_address_geocoding(params: Dict[str, str]) -> Dict[str, Any]:
+    address = unquote(params.get("fullAddr", ""))
+    count = int(params.get("searchCount", 10))
+    coordinates = []
+    for i in range(min(count, 3)):
+        lat, lon = _coord(_seed(address, i))
+        coordinates.append({
+            "matchFlag": "M11", "lat": f"{lat:.7f}", "lon": f"{lon:.7f}",
+            "newLat": f"{lat:.7f}", "newLon": f"{lon:.7f}",
+            "city_do": "서울특별시", "gu_gun": "중구", "legalDong": "태평로1가",
+            "newRoadName": "세종대로", "newBuildingIndex": "110",
+        })
+    return {"coordinateInfo": {"coordType": params.get("coordType", "WGS84GEO"),
+                               "addressFlag": "F00", "page": "1", "count": str(len(coordinates)),
+                               "totalCount": str(len(coordinates)), "coordinate": coordinates}}
+
+
+def reverse_geocoding(params: Dict[str, str]) -> Dict[str, Any]:
+    return {"addressInfo": {
+        "fullAddress": "서울특별시 중구 태평로1가 31,서울특별시 중구 명동,서울특별시 중구 세종대로 110",
+        "addressType": params.get("addressType", "A10"),
+        "city_do": "서울특별시", "gu_gun": "중구", "legalDong": "태평로1가", "adminDong": "명동",
+        "roadName": "세종대로", "buildingIndex": "110",
+    }}
+
+
+def route(body: Dict[str, Any], vertices: int = 200) -> Dict[str, Any]:
+    start = (float(body.get("startX", 126.97)), float(body.get("startY", 37.56)))
+    end = (float(body.get("endX", 127.02)), float(body.get("endY", 37.49)))
+    distance = int(((start[0] - end[0]) ** 2 + (start[1] - end[1]) ** 2) ** 0.5 * 111000)
+    coordinates = _line(start, end, vertices)
+    return {"type": "FeatureCollection", "features": [
+        {"type": "Feature", "geometry": {"type": "Point", "coordinates": list(start)},
+         "properties": {"totalDistance": distance, "totalTime": distance // 8, "totalFare": 0,
+                        "taxiFare": 3800 + distance, "index": 0, "pointType": "S"}},
+        {"type": "Feature", "geometry": {"type": "LineString", "coordinates": coordinates},
+         "properties": {"index": 1, "lineIndex": 0, "name": "세종대로", "distance": distance,
+                        "time": distance // 8}},
+        {"type": "Feature", "geometry": {"type": "Point", "coordinates": list(end)},
+         "properties": {"index": 2, "pointType": "E", "description": "도착"}},
+    ]}
+
+
+def transit_route(body: Dict[str, Any], summary: bool = False) -> Dict[str, Any]:
+    start = (float(body.get("startX", 0)), float(body.get("startY", 0)))
+    end = (float(body.get("endX", 0)), float(body.get("endY", 0)))
+    if abs(start[0] - end[0]) < 0.001 and abs(start[1] - end[1]) < 0.001:
+        # 실제 API처럼 경로가 없으면 200 응답에 result.status를 담아 보냄
+        return {"result": {"status": 11, "message": "출발지/도착지 간 거리가 가까워서 탐색된 결과 없음"}}
+    count = int(body.get("count", 10))
+    itineraries = []
+    for i in range(min(count, 3)):
+        itinerary: Dict[str, Any] = {
+            "fare": {"regular": {"totalFare": 1400 + 100 * i,
+                                 "currency": {"symbol": "￦", "currency": "원", "currencyCode": "KRW"}}},
+            "totalTime": 1200 + 120 * i, "totalWalkTime": 200, "transferCount": i,
+            "totalDistance": 8400 + 300 * i, "totalWalkDistance": 217, "pathType": 1 + i % 3,
+        }
+        if not summary:
+            itinerary["legs"] = [{
+                "mode": mode, "sectionTime": 400, "distance": 2800,
+                "start": {"name": "출발지", "lon": float(body.get("startX", 0)), "lat": float(body.get("startY", 0))},
+                "end": {"name": "도착지", "lon": float(body.get("endX", 0)), "lat": float(body.get("endY", 0))},
+                "steps": [{"streetName": "", "distance": 48, "description": "48m 이동",
+                           "linestring": " ".join(f"{126.9 + k / 1000:.6f},{37.5 + k / 1000:.6f}" for k in range(20))}],
+            } for mode in ("WALK", "SUBWAY", "WALK")]
+        itineraries.append(itinerary)
+    return {"metaData": {
+        "requestParameters": {"startX": body.get("startX"), "startY": body.get("startY"),
+                              "endX": body.get("endX"), "endY": body.get("endY"),
+                              "reqDttm": time.strftime("%Y%m%d%H%M%S")},
+        "plan": {"itineraries": itineraries},
+    }}
+
+
+def place_congestion(poi_id: str) -> Dict[str, Any]:
+    seed = _seed(poi_id, int(time.time() // 600))
+    return {"status": {"code": "00", "message": "success", "totalCount": 1},
+            "contents": {"poiId": poi_id, "poiName": f"장소 {poi_id}",
+                         "rltm": [{"type": 1, "congestion": (seed % 1000) / 10000,
+                                   "congestionLevel": 1 + seed % 4,
+                                   "datetime": time.strftime("%Y%m%d%H%M00")}]}}
+
+
+def subway_stat(params: Dict[str, str], kind: str) -> Dict[str, Any]:
+    route_nm, station_nm = params.get("routeNm", ""), params.get("stationNm", "")
+    dow, hh = params.get("dow", "MON"), params.get("hh", "08")
+    data = []
+    for mm in ("00", "10", "20", "30", "40", "50"):
+        seed = _seed(route_nm, station_nm, dow, hh, mm)
+        item: Dict[str, Any] = {"dow": dow, "hh": hh, "mm": mm}
+        if kind == "train":
+            item["congestionTrain"] = seed % 150
+        elif kind == "car":
+            item["congestionCar"] = [(seed >> i) % 150 for i in range(10)]
+        else:
+            item["getOffCarRate"] = [10] * 10
+        data.append(item)
+    return {"status": {"code": "00", "message": "success", "totalCount": 1},
+            "contents": {"subwayLine": route_nm, "stationName": station_nm, "stationCode": "133",
+                         "stat": [{"startStationName": "소요산", "endStationName": "구로",
+                                   "updnLine": 1, "directAt": 0, "data": data}],
+                         "statStartDate": "20220515", "statEndDate": "20220814"}}
+
+
+Route = Tuple[str, "re.Pattern[str]", Callable[..., Any]]
+
+# (메서드, 경로 패턴, 핸들러(query, body, match)) 목록. 앞에서부터 먼저 일치하는 것을 사용
+ROUTES: List[Route] = [
+    ("GET", re.compile(r"^/tmap/pois$"), lambda q, b, m: poi_search(q)),
+    ("GET", re.compile(r"^/tmap/pois/search/around$"), lambda q, b, m: poi_around(q)),
+    ("GET", re.compile(r"^/tmap/pois/([^/]+)$"), lambda q, b, m: poi_detail(m.group(1))),
+    ("GET", re.compile(r"^/tmap/geo/geocoding$"), lambda q, b, m: geocoding(q)),
+    ("GET", re.compile(r"^/tmap/geo/fullAddrGeo$"), lambda q, b, m: full_address_geocoding(q)),
+    ("GET", re.compile(r"^/tmap/geo/reversegeocoding$"), lambda q, b, m: reverse_geocoding(q)),
+    ("POST", re.compile(r"^/tmap/routes/pedestrian$"), lambda q, b, m: route(b, vertices=400)),
+    ("POST", re.compile(r"^/tmap/routes/prediction$"), lambda q, b, m: route(b)),
+    ("POST", re.compile(r"^/tmap/routes$"), lambda q, b, m: route(b)),
+    ("GET", re.compile(r"^/tmap/routeStaticMap$"), lambda q, b, m: _PNG),
+    ("GET", re.compile(r"^/tmap/puzzle/pois/([^/]+)$"), lambda q, b, m: place_congestion(m.group(1))),
+    ("POST", re.compile(r"^/transit/routes/sub$"), lambda q, b, m: transit_route(b, summary=True)),
+    ("POST", re.compile(r"^/transit/routes$"), lambda q, b, m: transit_route(b)),
+    ("GET", re.compile(r"^/transit/puzzle/subway/congestion/stat/train$"), lambda q, b, m: subway_stat(q, "train")),
+    ("GET", re.compile(r"^/transit/puzzle/subway/congestion/stat/car$"), lambda q, b, m: subway_stat(q, "car")),
+    ("GET", re.compile(r"^/transit/puzzle/subway/congestion/stat/get-off$"), lambda q, b, m: subway_stat(q, "get-off")),
+]
+
+
+class LatencyModel:
+    """
+    응답 지연 시간 분포
+
+    명세 문자열 형식 (단위: 초):
+        fixed:0.05              - 항상 50ms
+        uniform:0.01,0.2        - 10~200ms 균등 분포
+        normal:0.1,0.02         - 평균 100ms, 표준편차 20ms (0 미만은 0)
+        lognormal:0.08,0.5      - 중앙값 80ms, 로그 표준편차 0.5 (긴 꼬리)
+        exponential:0.05        - 평균 50ms 지수 분포
+    """
+
+    KINDS = ("fixed", "uniform", "normal", "lognormal", "exponential")
+
+    def __init__(self, kind: str = "fixed", *params: float, seed: Optional[int] = None):
+        if kind not in self.KINDS:
+            raise ValueError(f"지원하지 않는 지연 분포입니다: {kind}")
+        self.kind = kind
+        self.params = params or (0.0,)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def parse(cls, spec: Union[str, float, "LatencyModel"], seed: Optional[int] = None) -> "LatencyModel":
+        """명세 문자열 또는 고정 지연 값(초)으로 지연 분포 생성"""
+        if isinstance(spec, LatencyModel):
+            return spec
+        if isinstance(spec, (int, float)):
+            return cls("fixed", float(spec), seed=seed)
+        kind, _, args = spec.partition(":")
+        if not args:
+            return cls("fixed", float(kind), seed=seed)
+        return cls(kind, *(float(a) for a in args.split(",")), seed=seed)
+
+    def sample(self) -> float:
+        """지연 시간 하나를 뽑음(초)"""
+        p = self.params
+        with self._lock:
+            if self.kind == "fixed":
+                value = p[0]
+            elif self.kind == "uniform":
+                value = self._random.uniform(p[0], p[1])
+            elif self.kind == "normal":
+                value = self._random.gauss(p[0], p[1])
+            elif self.kind == "lognormal":
+                value = self._random.lognormvariate(math.log(p[0]), p[1]) if p[0] > 0 else 0.0
+            else:
+                value = self._random.expovariate(1.0 / p[0]) if p[0] > 0 else 0.0
+        return max(0.0, value)
+
+
+# 오류 주입 시 상태 코드별 TMAP 스타일 오류 코드
+_ERROR_CODES = {
+    400: ("INVALID_PARAMETER", "Invalid parameter"),
+    401: ("INVALID_API_KEY", "Invalid API Key"),
+    403: ("INVALID_API_KEY", "Forbidden"),
+    429: ("RATE_LIMIT_EXCEEDED", "Too Many Requests"),
+    500: ("SYSTEM_ERROR", "Internal Server Error"),
+    502: ("BAD_GATEWAY", "Bad Gateway"),
+    503: ("SERVICE_UNAVAILABLE", "Service Unavailable"),
+    504: ("GATEWAY_TIMEOUT", "Gateway Timeout"),
+}
+
+
+def _error_body(status: int, code: Optional[str] = None, message: Optional[str] = None) -> bytes:
+    default_code, default_message = _ERROR_CODES.get(status, (f"HTTP_{status}", "Error"))
+    return json.dumps({"error": {"id": str(status), "category": "gw",
+                                 "code": code or default_code,
+                                 "message": message or default_message}}).encode("utf-8")
+
+
+class _KeyState:
+    """앱 키 하나의 쿼터/호출 제한 상태"""
+
+    def __init__(self) -> None:
+        self.period_start = time.monotonic()
+        self.used = 0
+        self.recent: Deque[float] = deque()
+
+
+class StubConfig:
+    """
+    스텁 서버 동작 설정
+
+    Args:
+        latency: 기본 지연 분포 (LatencyModel, 명세 문자열 또는 초 단위 고정값)
+        path_latency: 경로 접두사별 지연 분포 (예: {"/transit": "lognormal:0.3,0.4"})
+        error_rates: 상태 코드별 오류 주입 확률 (예: {503: 0.01, 429: 0.005})
+        path_error_rates: 경로 접두사별 오류 주입 확률 (error_rates 대신 사용)
+        quota: 앱 키별 quota_period 동안 허용할 최대 호출 수 (None이면 무제한)
+        quota_period: 쿼터 집계 구간(초, 기본값 하루)
+        rate: 앱 키별 초당 최대 호출 수 (None이면 무제한)
+        valid_keys: 허용할 앱 키 목록 (None이면 모든 키 허용, 그 외 키는 401)
+        gzip_min_size: 클라이언트가 gzip을 허용할 때 압축해서 보낼 최소 JSON 본문 크기 (None이면 압축하지 않음)
+        seed: 난수 시드 (재현 가능한 지연/오류 패턴)
+    """
+
+    def __init__(self, latency: Union[str, float, LatencyModel] = 0.0,
+                 path_latency: Optional[Dict[str, Union[str, float, LatencyModel]]] = None,
+                 error_rates: Optional[Dict[int, float]] = None,
+                 path_error_rates: Optional[Dict[str, Dict[int, float]]] = None,
+                 quota: Optional[int] = None, quota_period: float = 86400.0,
+                 rate: Optional[float] = None, valid_keys: Optional[List[str]] = None,
+                 gzip_min_size: Optional[int] = None, seed: Optional[int] = None):
+        self.latency = LatencyModel.parse(latency, seed=seed)
+        self.path_latency = {prefix: LatencyModel.parse(spec, seed=seed)
+                             for prefix, spec in (path_latency or {}).items()}
+        self.error_rates = dict(error_rates or {})
+        self.path_error_rates = dict(path_error_rates or {})
+        self.quota = quota
+        self.quota_period = quota_period
+        self.rate = rate
+        self.valid_keys = set(valid_keys) if valid_keys is not None else None
+        self.gzip_min_size = gzip_min_size
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._keys: Dict[str, _KeyState] = {}
+        self.stats: Counter = Counter()
+
+    def _match_prefix(self, table: Dict[str, Any], path: str) -> Optional[Any]:
+        best = None
+        for prefix, value in table.items():
+            if path.startswith(prefix) and (best is None or len(prefix) > len(best[0])):
+                best = (prefix, value)
+        return best[1] if best else None
+
+    def latency_for(self, path: str) -> float:
+        model = self._match_prefix(self.path_latency, path) or self.latency
+        return model.sample()
+
+    def injected_error(self, path: str) -> Optional[int]:
+        """주입할 오류 상태 코드 (없으면 None)"""
+        rates = self._match_prefix(self.path_error_rates, path)
+        if rates is None:
+            rates = self.error_rates
+        if not rates:
+            return None
+        with self._lock:
+            roll = self._random.random()
+        for status, rate in rates.items():
+            if roll < rate:
+                return int(status)
+            roll -= rate
+        return None
+
+    def check_key(self, app_key: Optional[str]) -> Optional[Tuple[int, str, str]]:
+        """
+        앱 키 인증, 쿼터, 초당 호출 제한 확인
+
+        Returns:
+            거부할 경우 (상태 코드, 오류 코드, 메시지), 허용하면 None
+        """
+        if self.valid_keys is not None and app_key not in self.valid_keys:
+            return 401, "INVALID_API_KEY", "Invalid API Key"
+        if self.quota is None and self.rate is None:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            state = self._keys.setdefault(app_key or "", _KeyState())
+            if now - state.period_start >= self.quota_period:
+                state.period_start, state.used = now, 0
+            if self.quota is not None and state.used >= self.quota:
+                return 429, "QUOTA_EXCEEDED", "API quota exceeded"
+            if self.rate is not None:
+                while state.recent and now - state.recent[0] >= 1.0:
+                    state.recent.popleft()
+                if len(state.recent) >= self.rate:
+                    return 429, "RATE_LIMIT_EXCEEDED", "Too Many Requests"
+                state.recent.append(now)
+            state.used += 1
+        return None
+
+    def usage(self) -> Dict[str, int]:
+        """앱 키별 현재 쿼터 사용량"""
+        with self._lock:
+            return {key: state.used for key, state in self._keys.items()}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server: "_StubHTTPServer"
+    protocol_version = "HTTP/1.1"
+    # 헤더와 본문이 따로 전송될 때 Nagle + delayed ACK로 40ms씩 지연되는 것을 방지
+    disable_nagle_algorithm = True
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
+
+    def _send(self, status: int, body: bytes, content_type: str = "application/json;charset=UTF-8") -> None:
+        self.server.config.stats[str(status)] += 1
+        min_size = self.server.config.gzip_min_size
+        compress = (min_size is not None and len(body) >= min_size and content_type.startswith("application/json")
+                    and "gzip" in self.headers.get("Accept-Encoding", ""))
+        if compress:
+            body = gzip.compress(body, 6)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        if compress:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, method: str) -> None:
+        config = self.server.config
+        parts = urlsplit(self.path)
+        query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        length = int(self.headers.get("Content-Length", 0))
+        raw = self.rfile.read(length) if length else b""
+        try:
+            body = json.loads(raw) if raw else {}
+        except ValueError:
+            body = {}
+
+        if parts.path == "/_stub/stats":
+            stats = {"responses": dict(config.stats), "usage": config.usage()}
+            self._send(200, json.dumps(stats).encode("utf-8"))
+            return
+
+        delay = config.latency_for(parts.path)
+        if delay > 0:
+            time.sleep(delay)
+
+        app_key = self.headers.get("appKey") or query.get("appKey")
+        if not isinstance(body, dict):
+            body = {}
+        rejected = config.check_key(app_key or body.get("appKey"))
+        if rejected:
+            status, code, message = rejected
+            self._send(status, _error_body(status, code, message))
+            return
+        injected = config.injected_error(parts.path)
+        if injected:
+            self._send(injected, _error_body(injected))
+            return
+
+        for route_method, pattern, handler in ROUTES:
+            match = pattern.match(parts.path)
+            if route_method == method and match:
+                result = handler(query, body, match)
+                if isinstance(result, bytes):
+                    self._send(200, result, "image/png")
+                else:
+                    self._send(200, json.dumps(result, ensure_ascii=False).encode("utf-8"))
+                return
+        self._send(404, _error_body(404, "NOT_FOUND", "Not Found"))
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+    config: StubConfig
+
+
+class StubTmapServer:
+    """
+    백그라운드 스레드에서 동작하는 로컬 TMAP 스텁 서버
+
+    사용 예:
+        with StubTmapServer(latency="lognormal:0.05,0.4", error_rates={503: 0.01}) as stub:
+            tmap = TmapAPI(app_key="stub", base_url=stub.base_url)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 latency: Union[str, float, LatencyModel] = 0.0,
+                 config: Optional[StubConfig] = None, **options: Any):
+        """
+        Args:
+            host: 바인딩할 주소
+            port: 바인딩할 포트 (0이면 빈 포트 자동 선택)
+            latency: 응답 지연 분포 (초 단위 고정값 또는 LatencyModel 명세)
+            config: 전체 동작 설정 (지정하면 latency와 options는 무시)
+            **options: StubConfig에 전달할 추가 설정 (error_rates, quota, rate 등)
+        """
+        self.config = config if config is not None else StubConfig(latency=latency, **options)
+        self._server = _StubHTTPServer((host, port), _StubHandler)
+        self._server.config = self.config
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubTmapServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="tmap-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """현재 스레드에서 서버 실행 (Ctrl+C로 종료)"""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubTmapServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+def _parse_rates(values: List[str]) -> Dict[int, float]:
+    rates = {}
+    for value in values:
+        status, _, rate = value.partition("=")
+        rates[int(status)] = float(rate)
+    return rates
+
+
+def _parse_path_latency(values: List[str]) -> Dict[str, str]:
+    return dict(value.split("=", 1) for value in values)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="로컬 TMAP 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", default="0", help="지연 분포 (예: fixed:0.05, lognormal:0.08,0.5)")
+    parser.add_argument("--path-latency", action="append", default=[],
+                        help="경로별 지연 분포 (예: /transit=lognormal:0.3,0.4), 여러 번 지정 가능")
+    parser.add_argument("--error-rate", action="append", default=[],
+                        help="상태 코드별 오류 주입 확률 (예: 503=0.01), 여러 번 지정 가능")
+    parser.add_argument("--quota", type=int, help="앱 키별 쿼터 (quota-period 동안 최대 호출 수)")
+    parser.add_argument("--quota-period", type=float, default=86400.0, help="쿼터 집계 구간(초)")
+    parser.add_argument("--rate", type=float, help="앱 키별 초당 최대 호출 수")
+    parser.add_argument("--valid-key", action="append", help="허용할 앱 키 (지정하지 않으면 모든 키 허용)")
+    parser.add_argument("--gzip-min-size", type=int,
+                        help="클라이언트가 gzip을 허용할 때 이 크기(바이트) 이상의 JSON 응답을 압축 (미지정 시 압축하지 않음)")
+    parser.add_argument("--seed", type=int, help="난수 시드")
+    args = parser.parse_args()
+
+    config = StubConfig(
+        latency=args.latency,
+        path_latency=_parse_path_latency(args.path_latency),
+        error_rates=_parse_rates(args.error_rate),
+        quota=args.quota,
+        quota_period=args.quota_period,
+        rate=args.rate,
+        valid_keys=args.valid_key,
+        gzip_min_size=args.gzip_min_size,
+        seed=args.seed,
+    )
+    server = StubTmapServer(args.host, args.port, config=config)
+    print(f"TMAP 스텁 서버: {server.base_url} (통계: {server.base_url}/_stub/stats)")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,43 +1,446 @@
+import functools
+import logging
+import os
+import re
+import time
 import requests
 import json
-from typing import Dict, Any, Optional, Union, Tuple
+from typing import Callable, Dict, Any, Optional, Sequence, Union, Tuple
 from datetime import datetime, timezone, timedelta
 from urllib.parse import quote
 
+from . import coords, simplify, trip
+from .address import normalize_address, normalize_province
+from .cache import ResponseCache, cache_key
+from .cassette import Cassette, CassetteMiss
+from .circuit_breaker import CircuitBreakers, CircuitOpenError
+from .deadline import Deadline, DeadlineExceeded, current_deadline
+from .errors import TmapError
+from .hedging import HedgePolicy
+from .http2 import HttpxAdapter
+from .image_cache import StaticMapCache, write_chunks
+from .key_pool import KeyPool, mask_key
+from .log import logger
+from .metrics import TmapMetrics
+from .paging import PoiPager
+from .rate_limit import RateLimiter, SlotLimiter
+from .spatial import TileCache
+from .tracing import Tracer, current_span, traced
+
+DEFAULT_BASE_URL = "https://apis.openapi.sk.com"
+
+# 오류 응답 본문을 로그와 TmapError에 남길 최대 바이트 수
+ERROR_BODY_LIMIT = 1024
+_APP_KEY_PATTERN = re.compile(r"appKey=[^&\s'\"]+")
+
+
+def _postprocessed(fetch: Callable[[], Any], transform: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Any:
+    """fetch 결과가 성공이면 transform을 적용 (TmapError는 그대로)"""
+    result = fetch()
+    if result and isinstance(result, dict):
+        return transform(result)
+    return result
+
+
 class TmapAPI:
     """
     TMAP API 접근을 위한 클래스
     다양한 TMAP 서비스를 사용할 수 있는 메서드를 제공합니다.
     """
     
-    def __init__(self, app_key: str):
+    def __init__(self, app_key: Union[str, Sequence[str], None] = None,
+                 static_map_cache: Optional[StaticMapCache] = None,
+                 metrics: Optional[TmapMetrics] = None, tracer: Optional[Tracer] = None,
+                 base_url: str = DEFAULT_BASE_URL, cassette: Optional[Cassette] = None,
+                 key_pool: Optional[KeyPool] = None, circuit_breakers: Optional[CircuitBreakers] = None,
+                 hedging: Optional[HedgePolicy] = None, response_cache: Optional[ResponseCache] = None,
+                 rate_limiter: Optional[RateLimiter] = None, http2: bool = False,
+                 tile_cache: Optional[TileCache] = None, simplify_tolerance: Optional[float] = None,
+                 simplify_method: str = simplify.DOUGLAS_PEUCKER, slot_limiter: Optional[SlotLimiter] = None):
         """
         TMAP API 클라이언트 초기화
         
         Args:
-            app_key: TMAP API 인증 키
+            app_key: TMAP API 인증 키 또는 키 목록 (여러 개면 키 풀로 요청을 분산)
+            static_map_cache: 정적 지도 이미지 캐시 (선택적, None이면 캐시하지 않음)
+            metrics: 호출 계측 수집기 (선택적, None이면 새로 생성)
+            tracer: 메서드/HTTP 요청 span을 기록할 트레이서 (선택적, None이면 트레이싱하지 않음)
+            base_url: API 서버 주소 (로컬 스텁 서버 등으로 바꿀 때 사용)
+            cassette: 트래픽 녹화/재생 아카이브 (선택적)
+            key_pool: 키별 쿼터, 제외 시간 등을 직접 설정한 키 풀 (선택적, 지정하면 app_key는 무시)
+            circuit_breakers: 엔드포인트 계열별 회로 차단기 (선택적, None이면 연속 5회 실패 시 30초 차단)
+            hedging: 멱등 조회의 꼬리 지연을 줄이는 헤지 정책 (선택적, None이면 사용하지 않음)
+            response_cache: 엔드포인트별 TTL을 갖는 JSON 응답 캐시 (선택적, None이면 캐시하지 않음)
+            rate_limiter: 업스트림 요청 속도 제한기 (선택적, None이면 제한하지 않음)
+            http2: httpx 기반 HTTP/2 다중화 + brotli/gzip 압축 전송 사용 여부 (httpx[http2,brotli] 필요,
+                cassette를 함께 지정하면 cassette가 우선)
+            tile_cache: 주변 POI 검색의 타일 캐시 (선택적, None이면 프로세스 메모리에 저장)
+            simplify_tolerance: 경로 상세 응답(pedestrian_route_detail, car_route)의 기본 단순화 허용 오차(m)
+                (None이면 단순화하지 않음, numpy 필요)
+            simplify_method: 단순화 방식 (douglas_peucker 또는 visvalingam)
+            slot_limiter: 동시 요청 수(연결 슬롯) 제한기 (선택적, None이면 제한하지 않음).
+                지정하면 연결 풀 크기도 max_in_flight에 맞춤
         """
-        self.app_key = app_key
+        if key_pool is None:
+            keys = [app_key] if isinstance(app_key, str) else list(app_key or [])
+            key_pool = KeyPool(keys)
+        self.key_pool = key_pool
+        self.app_key = key_pool.keys[0]
+        self.static_map_cache = static_map_cache
+        self.metrics = metrics if metrics is not None else TmapMetrics()
+        self.tracer = tracer if tracer is not None else Tracer()
+        self.circuit_breakers = circuit_breakers if circuit_breakers is not None else CircuitBreakers()
+        if self.circuit_breakers.on_change is None:
+            self.circuit_breakers.on_change = self.metrics.record_circuit
+        self.hedging = hedging
+        if hedging is not None and hedging.metrics is None:
+            hedging.metrics = self.metrics
+        self.response_cache = response_cache
+        if response_cache is not None and response_cache.metrics is None:
+            response_cache.metrics = self.metrics
+        self.rate_limiter = rate_limiter
+        self.slot_limiter = slot_limiter
+        self.simplify_tolerance = simplify_tolerance
+        self.simplify_method = simplify_method
+        self.tile_cache = tile_cache if tile_cache is not None else TileCache()
+        if self.tile_cache.metrics is None:
+            self.tile_cache.metrics = self.metrics
+        # 연결 재사용을 위한 세션
+        self.session = requests.Session()
+        if http2:
+            adapter = HttpxAdapter(http2=True)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+        elif slot_limiter is not None and slot_limiter.max_in_flight > requests.adapters.DEFAULT_POOLSIZE:
+            # 슬롯 수만큼 연결을 재사용하도록 연결 풀 크기를 늘림 (기본 10개를 넘는 연결은 매번 새로 맺음)
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=slot_limiter.max_in_flight)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+        if cassette is not None:
+            cassette.mount(self.session)
         self.headers = {
             "accept": "application/json",
             "content-type": "application/json",
             "appKey": self.app_key
         }
-        self.base_url = "https://apis.openapi.sk.com"
+        self.base_url = base_url.rstrip("/")
         self.tmap_url = f"{self.base_url}/tmap"
         self.transit_url = f"{self.base_url}/transit"
     
-    def search_poi_keyword(self, keyword: str, search_type: str = "all", count: int = 20) -> Optional[Dict[str, Any]]:
+    def _request(self, method: str, endpoint: str, url: str, **kwargs) -> requests.Response:
+        """
+        엔드포인트 계열의 회로 차단기를 거쳐 HTTP 요청을 보냄
+        
+        회로가 열려 있으면 요청을 보내지 않고 CircuitOpenError를 발생시키며,
+        5xx 응답과 연결 오류는 실패로, 그 외 응답은 성공으로 기록합니다.
+        
+        Args:
+            method: HTTP 메서드 (GET, POST)
+            endpoint: 계측에 사용할 엔드포인트 이름
+            url: 요청 URL
+            **kwargs: requests에 전달할 추가 인자 (params, json, stream 등)
+            
+        Returns:
+            HTTP 응답 객체 (요청 자체가 실패하면 예외 발생)
+        """
+        if not self.circuit_breakers.enabled:
+            return self._request_with_keys(method, endpoint, url, **kwargs)
+        current = current_deadline()
+        if current is not None:
+            # 마감 시각이 지난 요청은 반열림 상태의 probe 자격을 차지하지 않도록 먼저 확인
+            try:
+                current.check()
+            except DeadlineExceeded:
+                self.metrics.record_abandoned(endpoint)
+                raise
+        breaker = self.circuit_breakers.get(CircuitBreakers.family(url))
+        try:
+            breaker.before_call()
+        except CircuitOpenError:
+            self.metrics.record_circuit_rejection(breaker.family)
+            current_span().set_attribute("circuit.open", True)
+            raise
+        try:
+            response = self._request_with_keys(method, endpoint, url, **kwargs)
+        except CassetteMiss:
+            # 녹화되지 않은 요청은 업스트림 장애가 아님
+            breaker.record_success()
+            raise
+        except DeadlineExceeded:
+            # 마감 시각이 지나 포기한 요청은 성공도 실패도 아님
+            breaker.release()
+            raise
+        except BaseException:
+            breaker.record_failure()
+            raise
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+    
+    def _request_with_keys(self, method: str, endpoint: str, url: str, **kwargs) -> requests.Response:
+        """
+        키 풀에서 고른 앱 키로 HTTP 요청을 보냄
+        
+        429나 401/403을 받으면 해당 키를 잠시 순환에서 제외하고, 아직 시도하지 않은
+        사용 가능한 키가 있으면 그 키로 다시 요청합니다.
+        
+        현재 컨텍스트에 마감 시각(deadline)이 있으면 남은 시간을 요청 타임아웃으로 쓰고,
+        보내기 전에 마감 시각이 지나거나 취소되면 속도 제한 토큰과 키 쿼터를 반환하고
+        DeadlineExceeded를 발생시킵니다.
+        """
+        tried = set()
+        current = current_deadline()
+        key = self.key_pool.acquire()
+        while True:
+            try:
+                self._acquire_slot(current)
+            except DeadlineExceeded:
+                self.key_pool.cancel(key)
+                self.metrics.record_abandoned(endpoint)
+                raise
+            send_kwargs = kwargs
+            timed_by_deadline = False
+            left = current.remaining() if current is not None else None
+            if left is not None and (kwargs.get("timeout") is None or left < kwargs["timeout"]):
+                send_kwargs = {**kwargs, "timeout": left}
+                timed_by_deadline = True
+            response = None
+            try:
+                response = self._send(method, endpoint, url, key, **send_kwargs)
+            except requests.RequestException as e:
+                self.key_pool.release(key, "exception")
+                if timed_by_deadline and isinstance(e, requests.Timeout):
+                    self.metrics.record_abandoned(endpoint)
+                    raise DeadlineExceeded() from e
+                raise
+            finally:
+                if self.slot_limiter is not None:
+                    if response is not None and kwargs.get("stream"):
+                        # 스트리밍 응답은 본문을 받는 동안 연결을 계속 쓰므로 응답을 닫을 때 슬롯을 반환
+                        self._release_slot_on_close(response)
+                    else:
+                        self.slot_limiter.release()
+            if not self.key_pool.release(key, response.status_code, self._rejection_code(response)):
+                return response
+            tried.add(key)
+            next_key = self.key_pool.acquire(tried)
+            if next_key is None:
+                return response
+            logger.info("앱 키 %s 제외, 다른 키로 재시도", mask_key(key),
+                        extra={"endpoint": endpoint, "status": response.status_code})
+            response.close()
+            self.metrics.record_retry(endpoint)
+            key = next_key
+    
+    def _acquire_slot(self, current: Optional[Deadline]) -> None:
+        """
+        요청을 보내도 되는지 확인하고 연결 슬롯과 속도 제한 토큰을 가져옴
+        
+        둘 다 현재 컨텍스트의 우선순위 레인 차례로 받으며, 마감 시각이 지나거나 취소되면
+        이미 받은 슬롯과 토큰을 돌려주고 DeadlineExceeded를 발생시킵니다.
+        """
+        if current is not None:
+            current.check()
+        slot = False
+        try:
+            if self.slot_limiter is not None:
+                slot = self.slot_limiter.acquire()
+                if not slot:
+                    # 마감 시각이 없으면 슬롯/토큰을 받을 때까지 기다리므로 실패는 마감 시각 초과나 취소
+                    if current is not None:
+                        current.check()
+                    raise DeadlineExceeded()
+            if self.rate_limiter is not None:
+                if not self.rate_limiter.acquire():
+                    if current is not None:
+                        current.check()
+                    raise DeadlineExceeded()
+                if current is not None:
+                    try:
+                        current.check()
+                    except DeadlineExceeded:
+                        self.rate_limiter.release()
+                        raise
+        except DeadlineExceeded:
+            if slot:
+                self.slot_limiter.release()
+            raise
+    
+    def _release_slot_on_close(self, response: requests.Response) -> None:
+        """응답을 닫을 때(response.close()) 연결 슬롯을 한 번만 반환하도록 연결"""
+        close = response.close
+        released = []
+
+        def close_and_release() -> None:
+            try:
+                close()
+            finally:
+                if not released:
+                    released.append(True)
+                    self.slot_limiter.release()
+
+        response.close = close_and_release
+    
+    def _send(self, method: str, endpoint: str, url: str, key: str, **kwargs) -> requests.Response:
+        """지정한 앱 키로 HTTP 요청 한 건을 보내고 계측 정보와 span을 기록"""
+        headers = dict(kwargs.pop("headers", None) or self.headers)
+        headers["appKey"] = key
+        for name in ("params", "json"):
+            if isinstance(kwargs.get(name), dict) and "appKey" in kwargs[name]:
+                kwargs[name] = {**kwargs[name], "appKey": key}
+        status: Union[int, str] = "exception"
+        received = 0
+        wire = None
+        with self.tracer.span(f"HTTP {method}", kind="client", endpoint=endpoint,
+                              **{"http.method": method, "http.url": url,
+                                 "tmap.app_key": mask_key(key)}) as span:
+            start = time.perf_counter()
+            try:
+                response = self.session.request(method, url, headers=headers, **kwargs)
+                status = response.status_code
+                if kwargs.get("stream"):
+                    # 본문을 아직 받지 않았으므로 Content-Length(압축된 크기)를 네트워크 바이트로 기록
+                    wire = int(response.headers.get("Content-Length", 0)) or None
+                    if wire is not None and not response.headers.get("Content-Encoding"):
+                        received = wire
+                else:
+                    received = len(response.content)
+                    wire = self._wire_bytes(response)
+                return response
+            finally:
+                self.metrics.observe_request(endpoint, status, time.perf_counter() - start, received, wire)
+                span.set_attribute("http.status_code", status)
+                span.set_attribute("http.response_bytes", received)
+                if wire is not None:
+                    span.set_attribute("http.response_wire_bytes", wire)
+    
+    @staticmethod
+    def _wire_bytes(response: requests.Response) -> Optional[int]:
+        """네트워크로 받은(압축된) 응답 본문 바이트 수, 알 수 없으면 None"""
+        tell = getattr(response.raw, "tell", None)
+        try:
+            wire = tell() if tell is not None else 0
+        except (OSError, ValueError):
+            return None
+        return wire or None
+    
+    @staticmethod
+    def _rejection_code(response: requests.Response) -> Optional[str]:
+        """429/401/403 응답의 TMAP 오류 코드 (예: QUOTA_EXCEEDED)"""
+        if response.status_code not in (401, 403, 429):
+            return None
+        try:
+            return (response.json().get("error") or {}).get("code")
+        except (ValueError, AttributeError):
+            return None
+    
+    def _call(self, method: str, endpoint: str, url: str,
+              postprocess: Optional[Tuple[str, Callable[[Dict[str, Any]], Dict[str, Any]]]] = None,
+              **kwargs) -> Union[Dict[str, Any], TmapError]:
+        """
+        JSON API를 호출하고 결과를 반환 (응답 캐시 정책이 있는 엔드포인트는 캐시 사용)
+        
+        Args:
+            postprocess: 성공한 응답을 캐시에 넣기 전에 변환할 (이름, 함수). 이름은 캐시 키에 붙어
+                변환 방식마다 다른 캐시 항목을 씁니다.
+        
+        Returns:
+            응답 JSON 데이터 또는 실패시 TmapError
+        """
+        fetch = functools.partial(self._fetch, method, endpoint, url, **kwargs)
+        if postprocess is not None:
+            fetch = functools.partial(_postprocessed, fetch, postprocess[1])
+        cache = self.response_cache
+        if cache is not None and cache.applies(endpoint):
+            key = cache_key(endpoint, method, url, kwargs.get("params"), kwargs.get("json"))
+            if postprocess is not None:
+                key = f"{key}~{postprocess[0]}"
+            return cache.get_or_fetch(endpoint, key, fetch)
+        return fetch()
+    
+    def _route_postprocess(self, simplify_tolerance: Optional[float]):
+        """경로 응답 단순화 후처리 (허용 오차가 없거나 0이면, 또는 numpy가 없으면 None)"""
+        tolerance = self.simplify_tolerance if simplify_tolerance is None else simplify_tolerance
+        if not tolerance:
+            return None
+        if not simplify.available():
+            logger.warning("numpy가 없어 경로를 단순화하지 않습니다: pip install numpy")
+            return None
+        method = self.simplify_method
+        return (f"simplify:{method}:{tolerance:g}",
+                functools.partial(simplify.simplify_route, tolerance_m=tolerance, method=method))
+    
+    def _fetch(self, method: str, endpoint: str, url: str, **kwargs) -> Union[Dict[str, Any], TmapError]:
+        """JSON API를 실제로 호출 (헤지 정책 대상이면 헤지 요청 사용)"""
+        try:
+            if self.hedging is not None and self.hedging.applies(endpoint, method):
+                response = self.hedging.run(endpoint, functools.partial(self._request, method, endpoint, url, **kwargs))
+            else:
+                response = self._request(method, endpoint, url, **kwargs)
+        except requests.RequestException as e:
+            return self._request_error(endpoint, e)
+        
+        if response.status_code != 200:
+            return self._http_error(endpoint, response)
+        try:
+            return response.json()
+        except ValueError as e:
+            return self._error(endpoint, "INVALID_RESPONSE", f"JSON 파싱 실패: {e}", status=200)
+    
+    def _error(self, endpoint: str, code: str, message: str, status: Optional[int] = None,
+               detail: Optional[Any] = None) -> TmapError:
+        """TmapError를 만들고 구조화된 로그로 남김"""
+        level = logging.INFO if status == 204 else logging.WARNING
+        logger.log(level, "TMAP API 호출 실패: %s", message,
+                   extra={"endpoint": endpoint, "status": status, "code": code, "body": detail})
+        return TmapError(endpoint, code, message, status=status, detail=detail)
+    
+    def _request_error(self, endpoint: str, exc: Exception) -> TmapError:
+        """요청 자체가 실패한 경우(연결 오류, 타임아웃 등)의 TmapError"""
+        # 예외 메시지의 URL에 포함된 앱 키는 가림
+        message = _APP_KEY_PATTERN.sub("appKey=***", str(exc))
+        return self._error(endpoint, getattr(exc, "code", None) or type(exc).__name__, message)
+    
+    def _http_error(self, endpoint: str, response: requests.Response) -> TmapError:
+        """
+        200이 아닌 HTTP 응답의 TmapError
+        
+        TMAP 오류 응답({"error": {"code": ..., "message": ...}})이면 코드와 메시지를 추출하고,
+        본문은 ERROR_BODY_LIMIT 바이트까지만 남깁니다.
+        """
+        status = response.status_code
+        if status == 204:
+            return self._error(endpoint, "NO_CONTENT", "검색 결과가 없습니다.", status=status)
+        
+        body = response.content[:ERROR_BODY_LIMIT].decode("utf-8", errors="replace")
+        code, message = f"HTTP_{status}", response.reason or ""
+        if len(response.content) <= ERROR_BODY_LIMIT:
+            try:
+                error = response.json().get("error") or {}
+                code = error.get("code") or code
+                message = error.get("message") or message
+            except (ValueError, AttributeError):
+                pass
+        return self._error(endpoint, code, message, status=status, detail=body)
+    
+    @traced
+    def search_poi_keyword(self, keyword: str, search_type: str = "all", count: int = 20,
+                           page: int = 1) -> Union[Dict[str, Any], TmapError]:
         """
         키워드로 POI(관심 지점) 검색
         
+        여러 페이지를 이어서 읽으려면 iter_poi_keyword를 사용합니다.
+        
         Args:
             keyword: 검색할 키워드
             search_type: 검색 유형 (all, name, telno)
-            count: 검색 결과 최대 개수
+            count: 검색 결과 최대 개수 (페이지 크기)
+            page: 페이지 번호 (1부터)
             
         Returns:
-            검색 결과 데이터 또는 실패시 None
+            검색 결과 데이터 또는 실패시 TmapError
         """
         url = f"{self.tmap_url}/pois"
         
@@ -48,24 +451,92 @@ class TmapAPI:
             "count": str(count),
             "appKey": self.app_key
         }
+        # 첫 페이지는 기존 캐시 키와 녹화 파일을 그대로 쓰도록 page를 생략
+        if page > 1:
+            params["page"] = str(page)
         
-        try:
-            response = requests.get(url, params=params, headers=self.headers)
+        return self._call("GET", "search_poi_keyword", url, params=params)
+    
+    def iter_poi_keyword(self, keyword: str, search_type: str = "all", page_size: int = 20,
+                         limit: Optional[int] = None, stop_when: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                         max_pages: Optional[int] = None, prefetch: bool = True) -> PoiPager:
+        """
+        키워드 검색 결과를 페이지를 넘기며 POI 단위로 읽는 반복자
+        
+        현재 페이지를 처리하는 동안 다음 페이지를 미리 요청하고, 페이지 사이에 중복된 POI는 건너뜁니다.
+        
+        Args:
+            keyword: 검색할 키워드
+            search_type: 검색 유형 (all, name, telno)
+            page_size: 페이지당 결과 수
+            limit: 최대 POI 수
+            stop_when: True를 반환하면 해당 POI까지 읽고 멈추는 함수
+            max_pages: 요청할 최대 페이지 수
+            prefetch: 다음 페이지를 미리 요청할지 여부
             
-            if response.status_code == 200:
-                result = response.json()
-                return result
-            elif response.status_code == 204:
-                print(f"'{keyword}'에 대한 검색 결과가 없습니다.")
-                return None
-            else:
-                print(f"API 호출 실패: {response.status_code}")
-                print(f"응답 내용: {response.text}")
-                return None
-        except Exception as e:
-            print(f"에러 발생: {str(e)}")
-            return None
+        Returns:
+            POI 딕셔너리를 내주는 PoiPager (실패한 페이지가 있으면 pager.error에 TmapError)
+        """
+        return PoiPager(self, keyword, search_type, page_size, limit, stop_when, max_pages, prefetch)
+        
+    @traced
+    def search_poi_around(self, center_lat: float, center_lon: float, categories: str, radius: int = 1,
+                          count: int = 20, page: int = 1) -> Union[Dict[str, Any], TmapError]:
+        """
+        중심 좌표 주변의 카테고리 POI 검색
+        
+        같은 근처를 반복해서 검색할 때는 타일 캐시를 쓰는 search_poi_nearby를 사용합니다.
+        
+        Args:
+            center_lat: 중심 위도
+            center_lon: 중심 경도
+            categories: 업종 카테고리 (여러 개는 ;로 구분, 예: "카페;편의점")
+            radius: 검색 반경(km, 1~33)
+            count: 페이지당 결과 수 (최대 200)
+            page: 페이지 번호 (1부터)
+            
+        Returns:
+            검색 결과 데이터 또는 실패시 TmapError
+        """
+        url = f"{self.tmap_url}/pois/search/around"
+        
+        params = {
+            "version": "1",
+            "centerLat": str(center_lat),
+            "centerLon": str(center_lon),
+            "categories": categories,
+            "radius": str(radius),
+            "count": str(count),
+            "page": str(page),
+            "reqCoordType": "WGS84GEO",
+            "resCoordType": "WGS84GEO",
+            "appKey": self.app_key
+        }
         
+        return self._call("GET", "search_poi_around", url, params=params)
+    
+    @traced
+    def search_poi_nearby(self, lat: float, lon: float, categories: Union[str, Sequence[str]],
+                          radius_m: float = 500, limit: Optional[int] = 30) -> Union[Dict[str, Any], TmapError]:
+        """
+        중심 좌표 반경 radius_m 안의 카테고리 POI를 가까운 순으로 검색 (타일 캐시 사용)
+        
+        검색 범위와 겹치는 지도 타일 중 캐시에 없는 타일만 주변 검색으로 채우므로,
+        근처에서 겹치는 검색은 추가 요청 없이 응답합니다.
+        
+        Args:
+            lat: 중심 위도
+            lon: 중심 경도
+            categories: 업종 카테고리 ("카페;편의점" 형식 문자열 또는 목록)
+            radius_m: 검색 반경(m)
+            limit: 최대 POI 수
+            
+        Returns:
+            {"pois": [... distance_m 포함], "count", "truncated", "tiles"} 또는 실패시 TmapError
+        """
+        return self.tile_cache.search(self, lat, lon, categories, radius_m, limit)
+        
+    @traced
     def search_address_keyword(self, keyword: str, search_type: str = "all") -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """
         키워드로 주소 검색
@@ -85,6 +556,7 @@ class TmapAPI:
                 return poi['upperAddrName'], poi['middleAddrName'], poi['lowerAddrName']
         return None, None, None
     
+    @traced
     def search_coord_keyword(self, keyword: str, search_type: str = "all") -> Tuple[Optional[float], Optional[float]]:
         """
         키워드로 좌표 검색
@@ -104,42 +576,51 @@ class TmapAPI:
                 return poi['frontLat'], poi['frontLon']
         return None, None
         
-    def geocoding(self, city_do: str, gu_gun: str, dong: str,  coord_type: str = "WGS84GEO") -> Optional[Dict[str, Any]]:
+    def _geocode(self, endpoint: str, url: str, params: Dict[str, Any],
+                 coord_type: str) -> Union[Dict[str, Any], TmapError]:
+        """
+        응답 좌표계를 coord_type으로 맞춘 지오코딩 호출
+
+        로컬 변환(numpy 필요)이 가능하면 항상 WGS84GEO로 요청하고 응답 좌표만 바꾸므로,
+        어떤 좌표계로 묻더라도 같은 캐시 항목을 쓰고 추가 요청이 없습니다.
+        """
+        if coord_type != "WGS84GEO" and coords.supports(coord_type):
+            result = self._call("GET", endpoint, url, params={**params, "coordType": "WGS84GEO"})
+            return coords.convert_geocoding(result, coord_type) if result else result
+        return self._call("GET", endpoint, url, params={**params, "coordType": coord_type})
+
+    @traced
+    def geocoding(self, city_do: str, gu_gun: str, dong: str,  coord_type: str = "WGS84GEO") -> Union[Dict[str, Any], TmapError]:
         """
         주소를 좌표로 변환 (지오코딩)
         
+        자유 형식 주소는 tmap_api.split_address로 (city_do, gu_gun, dong)으로 나눌 수 있습니다.
+        
         Args:
-            address: 변환할 주소
+            city_do: 시도 (서울, 서울시 같은 약칭 허용)
+            gu_gun: 시군구
+            dong: 읍면동 또는 도로명
             coord_type: 응답 좌표계 유형 (WGS84GEO, EPSG3857 등)
             
         Returns:
-            좌표 정보 데이터 또는 실패시 None
+            좌표 정보 데이터 또는 실패시 TmapError
         """
         url = f"{self.tmap_url}/geo/geocoding"
         
         params = {
             "version": "1",
             "appKey": self.app_key,
-            "city_do": quote(city_do, encoding='utf-8'),
-            "gu_gun": quote(gu_gun, encoding='utf-8'),
-            "dong": quote(dong, encoding='utf-8'),
+            # 표기가 달라도 같은 캐시 항목을 쓰도록 정규화한 이름으로 요청
+            "city_do": quote(normalize_province(city_do), encoding='utf-8'),
+            "gu_gun": quote(" ".join(gu_gun.split()), encoding='utf-8'),
+            "dong": quote(normalize_address(dong), encoding='utf-8'),
         }
         
-        try:
-            response = requests.get(url, params=params, headers=self.headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"API 호출 실패: {response.status_code}")
-                print(f"응답 내용: {response.text}")
-                return None
-        except Exception as e:
-            print(f"에러 발생: {str(e)}")
-            return None
+        return self._geocode("geocoding", url, params, coord_type)
     
+    @traced
     def full_text_geocoding(self, address: str, coord_type: str = "WGS84GEO", 
-                           search_count: int = 10) -> Optional[Dict[str, Any]]:
+                           search_count: int = 10) -> Union[Dict[str, Any], TmapError]:
         """
         자유 형식 텍스트 주소를 좌표로 변환 (Full Text 지오코딩)
         
@@ -149,32 +630,22 @@ class TmapAPI:
             search_count: 검색 결과 수
             
         Returns:
-            좌표 정보 데이터 또는 실패시 None
+            좌표 정보 데이터 또는 실패시 TmapError
         """
         url = f"{self.tmap_url}/geo/fullAddrGeo"
         
         params = {
             "version": "1",
             "appKey": self.app_key,
-            "coordType": coord_type,
-            "fullAddr": quote(address, encoding='utf-8'),
+            # 표기가 달라도 같은 캐시 항목을 쓰도록 정규화한 주소로 요청
+            "fullAddr": quote(normalize_address(address), encoding='utf-8'),
             "searchCount": str(search_count)
         }
         
-        try:
-            response = requests.get(url, params=params, headers=self.headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"API 호출 실패: {response.status_code}")
-                print(f"응답 내용: {response.text}")
-                return None
-        except Exception as e:
-            print(f"에러 발생: {str(e)}")
-            return None
+        return self._geocode("full_text_geocoding", url, params, coord_type)
     
-    def reverse_geocoding(self, lat: float, lon: float, address_type: str = "A10") -> Optional[Dict[str, Any]]:
+    @traced
+    def reverse_geocoding(self, lat: float, lon: float, address_type: str = "A10") -> Union[Dict[str, Any], TmapError]:
         """
         좌표를 주소로 변환 (역지오코딩)
         
@@ -184,7 +655,7 @@ class TmapAPI:
             address_type: 주소 유형 (A10: 행정동+법정동, A02: 행정동, A03: 법정동)
             
         Returns:
-            주소 정보 데이터 또는 실패시 None
+            주소 정보 데이터 또는 실패시 TmapError
         """
         url = f"{self.tmap_url}/geo/reversegeocoding"
         
@@ -197,21 +668,11 @@ class TmapAPI:
             "appKey": self.app_key
         }
         
-        try:
-            response = requests.get(url, params=params, headers=self.headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"API 호출 실패: {response.status_code}")
-                print(f"응답 내용: {response.text}")
-                return None
-        except Exception as e:
-            print(f"에러 발생: {str(e)}")
-            return None
+        return self._call("GET", "reverse_geocoding", url, params=params)
     
+    @traced
     def pedestrian_route_detail(self, start_x: float, start_y: float, end_x: float, end_y: float, startName: str, endName: str,
-                        search_option: str = "0") -> Optional[Dict[str, Any]]:
+                        search_option: str = "0", simplify_tolerance: Optional[float] = None) -> Union[Dict[str, Any], TmapError]:
         """
         보행자 경로 상세 정보 조회
         
@@ -223,9 +684,11 @@ class TmapAPI:
             startName: 출발지 이름
             endName: 도착지 이름
             search_option: 경로 검색 옵션 (0: 추천경로, 4: 추천 최단, 10: 최단경로)
+            simplify_tolerance: 경로 좌표 단순화 허용 오차(m, None이면 클라이언트 기본값, 0이면 단순화하지 않음).
+                단순화하면 결과에 _simplified(남은/지운 꼭짓점 수)가 포함됨
             
         Returns:
-            경로 정보 데이터 또는 실패시 None
+            경로 정보 데이터 또는 실패시 TmapError
         """
         url = f"{self.tmap_url}/routes/pedestrian"
         
@@ -239,21 +702,12 @@ class TmapAPI:
             "searchOption": search_option
         }
         
-        try:
-            response = requests.post(url, headers=self.headers, json=payload)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"API 호출 실패: {response.status_code}")
-                print(f"응답 내용: {response.text}")
-                return None
-        except Exception as e:
-            print(f"에러 발생: {str(e)}")
-            return None
+        return self._call("POST", "pedestrian_route_detail", url, json=payload,
+                          postprocess=self._route_postprocess(simplify_tolerance))
         
+    @traced
     def pedestrian_route_summary(self, start_x: float, start_y: float, end_x: float, end_y: float, startName: str, endName: str,
-                        search_option: str = "0") -> Optional[Dict[str, Any]]:
+                        search_option: str = "0") -> Union[Dict[str, Any], TmapError]:
         """
         보행자 경로 요약 정보 조회
         
@@ -267,7 +721,7 @@ class TmapAPI:
             search_option: 경로 검색 옵션 (0: 추천경로, 4: 추천 최단, 10: 최단경로)
             
         Returns:
-            경로 정보 데이터 또는 실패시 None
+            경로 정보 데이터 또는 실패시 TmapError
         """
         routes = self.pedestrian_route_detail(start_x, start_y, end_x, end_y, startName, endName, search_option)
         if routes:
@@ -276,23 +730,41 @@ class TmapAPI:
             total_distance = properties['totalDistance']
             total_time = properties['totalTime']
             return {'total_distance': total_distance, 'total_time': total_time}
-        return None
+        return routes
     
+    @traced
     def static_map(self, start_x: float, start_y: float, end_x: float, end_y: float, 
-                  file_path: str = "route_map.png") -> bool:
+                  file_path: Optional[str] = "route_map.png", stream: bool = False,
+                  return_bytes: bool = False, chunk_size: int = 64 * 1024) -> Union[bool, memoryview, TmapError]:
         """
         경로 정적 지도 이미지 생성
         
+        static_map_cache가 설정되어 있으면 같은 출발지/도착지의 이미지는
+        다시 요청하지 않고 캐시에서 가져옵니다.
+        
         Args:
             start_x: 출발지 경도
             start_y: 출발지 위도
             end_x: 도착지 경도
             end_y: 도착지 위도
-            file_path: 저장할 이미지 파일 경로
+            file_path: 저장할 이미지 파일 경로 (return_bytes=True이면 None 가능)
+            stream: 응답을 청크 단위로 받아 바로 디스크에 기록할지 여부
+            return_bytes: True이면 파일 대신 이미지 바이트를 memoryview로 반환
+            chunk_size: 스트리밍 시 청크 크기(바이트)
             
         Returns:
-            성공 여부
+            성공시 True (return_bytes=True이면 이미지 memoryview), 실패시 TmapError (bool 값은 False)
         """
+        cache = self.static_map_cache
+        cache_key = cache.key(start_x, start_y, end_x, end_y) if cache else None
+        
+        if cache:
+            cached_path = cache.lookup(cache_key)
+            self.metrics.record_cache("static_map", cached_path is not None)
+            current_span().set_attribute("cache.hit", cached_path is not None)
+            if cached_path:
+                return self._static_map_result(cached_path, file_path, return_bytes)
+        
         url = f"{self.tmap_url}/routeStaticMap"
         
         params = {
@@ -305,23 +777,49 @@ class TmapAPI:
         }
         
         try:
-            response = requests.get(url, params=params, headers=self.headers)
-            
-            if response.status_code == 200:
-                with open(file_path, "wb") as f:
-                    f.write(response.content)
-                print(f"경로 지도 이미지가 {file_path}에 저장되었습니다.")
-                return True
-            else:
-                print(f"API 호출 실패: {response.status_code}")
-                print(f"응답 내용: {response.text}")
-                return False
-        except Exception as e:
-            print(f"에러 발생: {str(e)}")
-            return False
+            response = self._request("GET", "static_map", url, params=params, stream=stream)
+        except requests.RequestException as e:
+            return self._request_error("static_map", e)
+        
+        if response.status_code != 200:
+            with response:
+                return self._http_error("static_map", response)
+        
+        chunks = response.iter_content(chunk_size) if stream else (response.content,)
+        # 스트리밍 응답은 본문을 다 받은 뒤 닫아야 연결과 연결 슬롯을 반환
+        try:
+            if cache:
+                cached_path, _, _ = cache.store(cache_key, chunks)
+                return self._static_map_result(cached_path, file_path, return_bytes)
+            if return_bytes:
+                buffer = bytearray()
+                for chunk in chunks:
+                    buffer += chunk
+                return memoryview(buffer)
+            directory = os.path.dirname(os.path.abspath(file_path))
+            _, _, tmp_path = write_chunks(directory, chunks)
+            os.replace(tmp_path, file_path)
+        except (requests.RequestException, OSError) as e:
+            return self._request_error("static_map", e)
+        finally:
+            response.close()
+        logger.info("경로 지도 이미지가 %s에 저장되었습니다.", file_path, extra={"endpoint": "static_map"})
+        return True
+    
+    @staticmethod
+    def _static_map_result(cached_path: str, file_path: Optional[str],
+                           return_bytes: bool) -> Union[bool, memoryview]:
+        """캐시에 저장된 정적 지도 이미지를 요청한 형태로 반환"""
+        if return_bytes:
+            with open(cached_path, "rb") as f:
+                return memoryview(f.read())
+        StaticMapCache.copy_to(cached_path, file_path)
+        logger.info("경로 지도 이미지가 %s에 저장되었습니다.", file_path, extra={"endpoint": "static_map"})
+        return True
     
+    @traced
     def car_route(self, start_x: float, start_y: float, end_x: float, end_y: float, 
-                 search_option: str = "0") -> Optional[Dict[str, Any]]:
+                 search_option: str = "0", simplify_tolerance: Optional[float] = None) -> Union[Dict[str, Any], TmapError]:
         """
         자동차 경로 안내
         
@@ -331,9 +829,10 @@ class TmapAPI:
             end_x: 도착지 경도
             end_y: 도착지 위도
             search_option: 경로 검색 옵션 (0: 추천경로, 1: 교통최적, 2: 최단거리 등)
+            simplify_tolerance: 경로 좌표 단순화 허용 오차(m, None이면 클라이언트 기본값, 0이면 단순화하지 않음)
             
         Returns:
-            경로 정보 데이터 또는 실패시 None
+            경로 정보 데이터 또는 실패시 TmapError
         """
         url = f"{self.tmap_url}/routes"
         
@@ -348,23 +847,14 @@ class TmapAPI:
             "appKey": self.app_key
         }
         
-        try:
-            response = requests.post(url, headers=self.headers, json=payload)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"API 호출 실패: {response.status_code}")
-                print(f"응답 내용: {response.text}")
-                return None
-        except Exception as e:
-            print(f"에러 발생: {str(e)}")
-            return None
+        return self._call("POST", "car_route", url, json=payload,
+                          postprocess=self._route_postprocess(simplify_tolerance))
     
+    @traced
     def time_machine_route(self, start_x: float, start_y: float, end_x: float, end_y: float, 
                           departure_time: Union[datetime, str], search_option: str = "0", 
                           arrival_option: str = "0", via_points: Optional[list] = None,
-                          use_kst: bool = True) -> Optional[Dict[str, Any]]:
+                          use_kst: bool = True) -> Union[Dict[str, Any], TmapError]:
         """
         타임머신 자동차 길 안내 (미래/과거 시간 기준 경로 안내)
         
@@ -380,7 +870,7 @@ class TmapAPI:
             use_kst: 한국 시간대(KST, UTC+9) 사용 여부 (기본값: True)
             
         Returns:
-            경로 정보 데이터 또는 실패시 None
+            경로 정보 데이터 또는 실패시 TmapError
         """
         url = f"{self.tmap_url}/routes/prediction"
         
@@ -424,20 +914,10 @@ class TmapAPI:
         if via_points:
             payload["passList"] = via_points
         
-        try:
-            response = requests.post(url, headers=self.headers, json=payload)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"API 호출 실패: {response.status_code}")
-                print(f"응답 내용: {response.text}")
-                return None
-        except Exception as e:
-            print(f"에러 발생: {str(e)}")
-            return None
+        return self._call("POST", "time_machine_route", url, json=payload)
     
-    def get_poi_detail(self, poi_id: str) -> Optional[Dict[str, Any]]:
+    @traced
+    def get_poi_detail(self, poi_id: str) -> Union[Dict[str, Any], TmapError]:
         """
         POI 상세 정보 검색
         
@@ -445,7 +925,7 @@ class TmapAPI:
             poi_id: POI ID 또는 POI 식별자
             
         Returns:
-            POI 상세 정보 데이터 또는 실패시 None
+            POI 상세 정보 데이터 또는 실패시 TmapError
         """
         url = f"{self.tmap_url}/pois/{poi_id}"
         
@@ -454,20 +934,10 @@ class TmapAPI:
             "appKey": self.app_key
         }
         
-        try:
-            response = requests.get(url, params=params, headers=self.headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"POI 상세 정보 조회 실패: {response.status_code}")
-                print(f"응답 내용: {response.text}")
-                return None
-        except Exception as e:
-            print(f"에러 발생: {str(e)}")
-            return None
+        return self._call("GET", "get_poi_detail", url, params=params)
 
-    def realtime_place_congestion(self, poi_id: str, lat: Optional[float] = None, lng: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    @traced
+    def realtime_place_congestion(self, poi_id: str, lat: Optional[float] = None, lng: Optional[float] = None) -> Union[Dict[str, Any], TmapError]:
         """
         실시간 장소 혼잡도 조회
         
@@ -477,7 +947,7 @@ class TmapAPI:
             lng: 주변 혼잡도를 구할 중심 경도값 (WGS84 경위도 좌표계)
             
         Returns:
-            혼잡도 정보 데이터 또는 실패시 None
+            혼잡도 정보 데이터 또는 실패시 TmapError
             응답 데이터 구조:
             {
                 "status": {
@@ -500,8 +970,9 @@ class TmapAPI:
         # 먼저 POI 상세 정보 조회
         poi_detail = self.get_poi_detail(poi_id)
         if not poi_detail:
-            print(f"POI ID {poi_id}에 대한 상세 정보를 찾을 수 없습니다.")
-            return None
+            logger.warning("POI ID %s에 대한 상세 정보를 찾을 수 없습니다.", poi_id,
+                           extra={"endpoint": "realtime_place_congestion", "code": getattr(poi_detail, "code", None)})
+            return poi_detail
             
         url = f"{self.tmap_url}/puzzle/pois/{poi_id}"
         
@@ -516,19 +987,9 @@ class TmapAPI:
         if lng is not None:
             params["lng"] = str(lng)
         
-        try:
-            response = requests.get(url, params=params, headers=self.headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"API 호출 실패: {response.status_code}")
-                print(f"응답 내용: {response.text}")
-                return None
-        except Exception as e:
-            print(f"에러 발생: {str(e)}")
-            return None
+        return self._call("GET", "realtime_place_congestion", url, params=params)
     
+    @traced
     def public_transit_route(self, 
                            start_x: str,
                            start_y: str,
@@ -537,7 +998,7 @@ class TmapAPI:
                            lang: int = 0,
                            format: str = "json",
                            count: int = 10,
-                           search_dttm: Optional[str] = None) -> Optional[Dict[str, Any]]:
+                           search_dttm: Optional[str] = None) -> Union[Dict[str, Any], TmapError]:
         """
         대중교통 경로 탐색 API
         출발지/목적지에 대한 대중교통 경로탐색 정보와 전체 보행자 이동 경로를 제공
@@ -553,7 +1014,7 @@ class TmapAPI:
             search_dttm: 타임머신 기능 검색 날짜(yyyymmddhhmi)
 
         Returns:
-            대중교통 경로 정보 또는 실패시 None
+            대중교통 경로 정보 또는 실패시 TmapError
             응답 예시:
             {
                 "metaData": {
@@ -630,19 +1091,9 @@ class TmapAPI:
         if search_dttm:
             payload["searchDttm"] = search_dttm
             
-        try:
-            response = requests.post(url, headers=self.headers, json=payload)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"대중교통 경로 검색 실패: {response.status_code}")
-                print(f"응답 내용: {response.text}")
-                return None
-        except Exception as e:
-            print(f"에러 발생: {str(e)}")
-            return None
+        return self._call("POST", "public_transit_route", url, json=payload)
     
+    @traced
     def public_transit_route_summary(self, 
                                    start_x: str,
                                    start_y: str,
@@ -650,7 +1101,7 @@ class TmapAPI:
                                    end_y: str,
                                    format: str = "json",
                                    count: int = 10,
-                                   search_dttm: Optional[str] = None) -> Optional[Dict[str, Any]]:
+                                   search_dttm: Optional[str] = None) -> Union[Dict[str, Any], TmapError]:
         """
         대중교통 경로 요약정보 API
         출발지/목적지에 대한 대중교통 경로탐색 요약정보를 제공
@@ -665,7 +1116,7 @@ class TmapAPI:
             search_dttm: 타임머신 기능 검색 날짜(yyyymmddhhmi)
 
         Returns:
-            대중교통 경로 요약정보 또는 실패시 None
+            대중교통 경로 요약정보 또는 실패시 TmapError
             응답 예시:
             {
                 "metaData": {
@@ -716,24 +1167,14 @@ class TmapAPI:
         if search_dttm:
             payload["searchDttm"] = search_dttm
             
-        try:
-            response = requests.post(url, headers=self.headers, json=payload)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"대중교통 경로 요약정보 검색 실패: {response.status_code}")
-                print(f"응답 내용: {response.text}")
-                return None
-        except Exception as e:
-            print(f"에러 발생: {str(e)}")
-            return None
+        return self._call("POST", "public_transit_route_summary", url, json=payload)
     
+    @traced
     def get_subway_congestion(self, 
                             route_nm: str,
                             station_nm: str,
                             dow: Optional[str] = None,
-                            hh: Optional[str] = None) -> Optional[Dict[str, Any]]:
+                            hh: Optional[str] = None) -> Union[Dict[str, Any], TmapError]:
         """
         지하철 진입 역 기준 열차 혼잡도 조회 API
         지정한 운행 시간대(05:30 ~ 23:50)에 특정 역으로 진입하는 일반/급행 열차에 대한 혼잡도 데이터를 10분 간격으로 제공
@@ -747,7 +1188,7 @@ class TmapAPI:
                 미입력시 현재 시간대 기준 데이터 반환
 
         Returns:
-            열차 혼잡도 정보 또는 실패시 None
+            열차 혼잡도 정보 또는 실패시 TmapError
             응답 예시:
             {
                 "status": {
@@ -797,24 +1238,14 @@ class TmapAPI:
         if hh:
             params["hh"] = hh
             
-        try:
-            response = requests.get(url, params=params, headers=self.headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"지하철 혼잡도 조회 실패: {response.status_code}")
-                print(f"응답 내용: {response.text}")
-                return None
-        except Exception as e:
-            print(f"에러 발생: {str(e)}")
-            return None
+        return self._call("GET", "get_subway_congestion", url, params=params)
     
+    @traced
     def get_subway_car_congestion(self, 
                                 route_nm: str,
                                 station_nm: str,
                                 dow: Optional[str] = None,
-                                hh: Optional[str] = None) -> Optional[Dict[str, Any]]:
+                                hh: Optional[str] = None) -> Union[Dict[str, Any], TmapError]:
         """
         지하철 진입 역 기준 칸별 혼잡도 조회 API
         지정한 운행 시간대(05:30 ~ 23:50)에 특정 역으로 진입하는 일반/급행 열차에 대한 칸별 혼잡도 데이터를 10분 간격으로 제공
@@ -828,7 +1259,7 @@ class TmapAPI:
                 미입력시 현재 시간대 기준 데이터 반환
 
         Returns:
-            칸별 혼잡도 정보 또는 실패시 None
+            칸별 혼잡도 정보 또는 실패시 TmapError
             응답 예시:
             {
                 "status": {
@@ -880,24 +1311,14 @@ class TmapAPI:
         if hh:
             params["hh"] = hh
             
-        try:
-            response = requests.get(url, params=params, headers=self.headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"지하철 칸별 혼잡도 조회 실패: {response.status_code}")
-                print(f"응답 내용: {response.text}")
-                return None
-        except Exception as e:
-            print(f"에러 발생: {str(e)}")
-            return None
+        return self._call("GET", "get_subway_car_congestion", url, params=params)
     
+    @traced
     def get_subway_car_getoff_rate(self, 
                                  route_nm: str,
                                  station_nm: str,
                                  dow: Optional[str] = None,
-                                 hh: Optional[str] = None) -> Optional[Dict[str, Any]]:
+                                 hh: Optional[str] = None) -> Union[Dict[str, Any], TmapError]:
         """
         지하철 진입 역 기준 칸별 하차 비율 조회 API
         지정한 운행 시간대(05:30 ~ 23:50)에 특정 역으로 진입하는 일반/급행 열차에 대한 칸별 하차 비율 데이터를 10분 간격으로 제공
@@ -911,7 +1332,7 @@ class TmapAPI:
                 미입력시 현재 시간대 기준 데이터 반환
 
         Returns:
-            칸별 하차 비율 정보 또는 실패시 None
+            칸별 하차 비율 정보 또는 실패시 TmapError
             응답 예시:
             {
                 "status": {
@@ -963,15 +1384,39 @@ class TmapAPI:
         if hh:
             params["hh"] = hh
             
+        return self._call("GET", "get_subway_car_getoff_rate", url, params=params)
+    
+
+    @traced
+    def plan_trip(self, origin_text: str, destination_text: str,
+                  modes: Union[str, Sequence[str], None] = None) -> Union[Dict[str, Any], TmapError]:
+        """
+        출발지/도착지 텍스트로 자동차, 도보, 대중교통 경로를 한 번에 비교
+
+        두 지점의 좌표 검색과 이동 수단별 경로 조회를 각각 동시에 보냅니다.
+
+        Args:
+            origin_text: 출발지 장소 이름 또는 주소
+            destination_text: 도착지 장소 이름 또는 주소
+            modes: 비교할 이동 수단 ("car,pedestrian,transit" 형식 문자열 또는 목록, None이면 전부)
+
+        Returns:
+            {"origin", "destination", "modes", "fastest"} 비교 결과 또는 실패시 TmapError
+            응답 예시:
+            {
+                "origin": {"name": "서울역", "lat": 37.5547, "lon": 126.9707},
+                "destination": {"name": "강남역", "lat": 37.4979, "lon": 127.0276},
+                "modes": {
+                    "car": {"distance_m": 10215, "time_s": 1632, "toll_fare": 0, "taxi_fare": 14100},
+                    "pedestrian": {"distance_m": 9870, "time_s": 8880},
+                    "transit": {"distance_m": 10540, "time_s": 1980, "fare": 1400, "transfers": 0,
+                                "walk_m": 420, "walk_s": 360, "options": [...]}
+                },
+                "fastest": "car"
+            }
+        """
         try:
-            response = requests.get(url, params=params, headers=self.headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"지하철 칸별 하차 비율 조회 실패: {response.status_code}")
-                print(f"응답 내용: {response.text}")
-                return None
-        except Exception as e:
-            print(f"에러 발생: {str(e)}")
-    
\ No newline at end of file
+            modes = trip.parse_modes(modes)
+        except ValueError as e:
+            return self._error("plan_trip", "INVALID_MODE", str(e))
+        return trip.plan_trip(self, origin_text, destination_text, modes)
@@ -0,0 +1,207 @@
+import functools
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("tmap_current_span", default=None)
+
+
+class Span:
+    """
+    하나의 작업 구간(span)
+
+    같은 트레이스의 span은 trace_id를 공유하고, parent_span_id로 중첩 관계를 표현합니다.
+    """
+
+    def __init__(self, name: str, parent: Optional["Span"], kind: str = "internal",
+                 attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.kind = kind
+        self.trace_id = parent.trace_id if parent else f"{random.getrandbits(128):032x}"
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_span_id = parent.span_id if parent else None
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.error: Optional[str] = None
+        self.start_time_ns = time.time_ns()
+        self._start = time.perf_counter_ns()
+        self.end_time_ns: Optional[int] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """span 속성 설정"""
+        self.attributes[key] = value
+
+    def end(self) -> None:
+        self.end_time_ns = self.start_time_ns + (time.perf_counter_ns() - self._start)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON Lines 내보내기용 딕셔너리"""
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "start_time_unix_nano": self.start_time_ns,
+            "end_time_unix_nano": self.end_time_ns,
+            "duration_ms": (self.end_time_ns - self.start_time_ns) / 1e6,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class _NoopSpan:
+    """트레이싱이 꺼져 있을 때 사용하는 아무 일도 하지 않는 span"""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class JsonLinesExporter:
+    """완료된 span을 한 줄에 하나씩 JSON으로 기록하는 내보내기"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def format(self, span: Span) -> str:
+        return json.dumps(span.to_dict(), ensure_ascii=False, default=str)
+
+    def export(self, span: Span) -> None:
+        line = self.format(span)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class OTLPJsonExporter(JsonLinesExporter):
+    """
+    OTLP/JSON(ExportTraceServiceRequest) 형식으로 span을 기록하는 내보내기
+
+    한 줄이 하나의 요청이며, OpenTelemetry Collector의 otlpjsonfile 수신기 등으로 읽을 수 있습니다.
+    """
+
+    _KINDS = {"internal": 1, "server": 2, "client": 3}
+
+    def __init__(self, path: str, service_name: str = "tmap-mcp"):
+        super().__init__(path)
+        self.service_name = service_name
+
+    def format(self, span: Span) -> str:
+        otlp_span = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": self._KINDS.get(span.kind, 1),
+            "startTimeUnixNano": str(span.start_time_ns),
+            "endTimeUnixNano": str(span.end_time_ns),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in span.attributes.items()],
+            "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+        }
+        if span.parent_span_id:
+            otlp_span["parentSpanId"] = span.parent_span_id
+        request = {
+            "resourceSpans": [{
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": self.service_name}}]},
+                "scopeSpans": [{"scope": {"name": "tmap_api"}, "spans": [otlp_span]}],
+            }]
+        }
+        return json.dumps(request, ensure_ascii=False)
+
+
+class Tracer:
+    """
+    중첩 span을 만들고 내보내는 트레이서
+
+    exporter가 없으면 비활성 상태이며 span()은 거의 비용 없이 NOOP_SPAN을 돌려줍니다.
+    현재 span은 contextvars로 추적하므로 스레드로 작업을 넘길 때는
+    contextvars.copy_context()로 컨텍스트를 함께 넘겨야 부모 관계가 유지됩니다.
+    """
+
+    def __init__(self, exporter: Optional[JsonLinesExporter] = None):
+        self.exporter = exporter
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    @contextmanager
+    def span(self, name: str, kind: str = "internal", **attributes: Any) -> Iterator[Any]:
+        """
+        span 구간을 여는 컨텍스트 매니저
+
+        Args:
+            name: span 이름
+            kind: span 종류 (internal, server, client)
+            **attributes: span 속성
+        """
+        if self.exporter is None:
+            yield NOOP_SPAN
+            return
+        span = Span(name, _current_span.get(), kind, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+            self.exporter.export(span)
+
+
+def current_span() -> Any:
+    """현재 열려 있는 span (없으면 NOOP_SPAN)"""
+    return _current_span.get() or NOOP_SPAN
+
+
+def create_tracer(path: Optional[str], fmt: str = "jsonl") -> Tracer:
+    """
+    파일 경로와 형식으로 트레이서 생성
+
+    Args:
+        path: span을 기록할 파일 경로 (None이면 비활성 트레이서)
+        fmt: 기록 형식 (jsonl, otlp)
+    """
+    if not path:
+        return Tracer()
+    if fmt == "otlp":
+        return Tracer(OTLPJsonExporter(path))
+    if fmt == "jsonl":
+        return Tracer(JsonLinesExporter(path))
+    raise ValueError(f"지원하지 않는 트레이스 형식입니다: {fmt}")
+
+
+def traced(func: Callable) -> Callable:
+    """TmapAPI 메서드 호출을 self.tracer의 span으로 감싸는 데코레이터"""
+    span_name = f"TmapAPI.{func.__name__}"
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not self.tracer.enabled:
+            return func(self, *args, **kwargs)
+        with self.tracer.span(span_name):
+            return func(self, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,183 @@
+"""
+출발지/도착지 텍스트로 여러 이동 수단의 경로를 한 번에 비교하는 여행 계획
+
+두 지점의 좌표 검색을 동시에 보내고, 좌표가 나오면 요청한 이동 수단의 경로 조회를
+다시 동시에 보내므로 전체 지연 시간은 가장 느린 검색 한 번과 가장 느린 경로 조회 한 번의
+합에 가깝습니다.
+"""
+
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .errors import TmapError
+
+# plan_trip이 지원하는 이동 수단 (요청 순서대로 결과에 담김)
+TRIP_MODES = ("car", "pedestrian", "transit")
+
+# 대중교통 결과에 담을 최대 경로 수
+TRANSIT_OPTIONS = 3
+
+
+def parse_modes(modes: Union[str, Iterable[str], None]) -> List[str]:
+    """
+    "car,transit" 같은 문자열이나 목록을 중복 없는 이동 수단 목록으로 변환
+
+    Raises:
+        ValueError: 지원하지 않는 이동 수단이 있는 경우
+    """
+    if modes is None:
+        return list(TRIP_MODES)
+    if isinstance(modes, str):
+        modes = modes.split(",")
+    result: List[str] = []
+    for mode in modes:
+        mode = mode.strip().lower()
+        if not mode:
+            continue
+        if mode not in TRIP_MODES:
+            raise ValueError(f"지원하지 않는 이동 수단: {mode} (가능한 값: {', '.join(TRIP_MODES)})")
+        if mode not in result:
+            result.append(mode)
+    return result or list(TRIP_MODES)
+
+
+def run_parallel(calls: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+    """
+    이름별 호출을 스레드에서 동시에 실행하고 이름별 결과를 반환
+
+    트레이싱 span과 요청 우선순위가 호출한 쪽을 따르도록 호출마다 컨텍스트를 복사해서 실행합니다.
+    """
+    if len(calls) <= 1:
+        return {name: call() for name, call in calls.items()}
+    with ThreadPoolExecutor(max_workers=len(calls), thread_name_prefix="tmap-trip") as pool:
+        futures: Dict[str, Future] = {
+            name: pool.submit(contextvars.copy_context().run, call) for name, call in calls.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
+def resolve_place(tmap: Any, text: str) -> Union[Dict[str, Any], TmapError]:
+    """
+    장소 이름이나 주소를 {"name", "lat", "lon"}으로 변환
+
+    POI 검색 결과가 없으면 Full Text 지오코딩으로 한 번 더 찾습니다.
+    """
+    result = tmap.search_poi_keyword(text, "all", 1)
+    if result:
+        pois = result["searchPoiInfo"]["pois"]["poi"]
+        if pois:
+            poi = pois[0]
+            return {"name": poi["name"], "lat": float(poi["frontLat"]), "lon": float(poi["frontLon"])}
+
+    geocoded = tmap.full_text_geocoding(text, search_count=1)
+    if geocoded:
+        coordinates = (geocoded.get("coordinateInfo") or {}).get("coordinate") or []
+        if coordinates:
+            coordinate = coordinates[0]
+            # 도로명 주소로 찾은 경우 newLat/newLon에, 지번 주소로 찾은 경우 lat/lon에 좌표가 있음
+            lat = coordinate.get("lat") or coordinate.get("newLat")
+            lon = coordinate.get("lon") or coordinate.get("newLon")
+            if lat and lon:
+                return {"name": text, "lat": float(lat), "lon": float(lon)}
+    # 검색 자체가 실패한 경우(쿼터 초과, 회로 차단 등) 원인을 detail에 남김
+    failure = next((item for item in (geocoded, result) if isinstance(item, TmapError)), None)
+    return TmapError("plan_trip", "PLACE_NOT_FOUND", f"장소를 찾지 못했습니다: {text}",
+                     detail=failure["error"] if failure is not None else None)
+
+
+def summarize_car(result: Dict[str, Any]) -> Dict[str, Any]:
+    """자동차 경로 응답에서 거리, 시간, 요금만 추림"""
+    properties = result["features"][0]["properties"]
+    return {
+        "distance_m": properties.get("totalDistance"),
+        "time_s": properties.get("totalTime"),
+        "toll_fare": properties.get("totalFare"),
+        "taxi_fare": properties.get("taxiFare"),
+    }
+
+
+def summarize_pedestrian(result: Dict[str, Any]) -> Dict[str, Any]:
+    """보행자 경로 요약 결과를 비교용 키로 변환"""
+    return {"distance_m": result["total_distance"], "time_s": result["total_time"]}
+
+
+def summarize_transit(result: Dict[str, Any], limit: int = TRANSIT_OPTIONS) -> Union[Dict[str, Any], TmapError]:
+    """
+    대중교통 경로 요약 응답에서 소요 시간이 짧은 순으로 limit개 경로를 추림
+
+    경로가 없으면 TMAP은 200 응답에 {"result": {"status": 11, ...}} 본문을 주므로(출발지와
+    도착지가 너무 가까운 경우 등) NO_ROUTE TmapError로 바꿉니다.
+    """
+    plan = (result.get("metaData") or {}).get("plan") or {}
+    itineraries = plan.get("itineraries")
+    if not itineraries:
+        status = result.get("result") or {}
+        return TmapError("public_transit_route_summary", "NO_ROUTE",
+                         status.get("message") or "대중교통 경로를 찾지 못했습니다.",
+                         detail=status or None)
+    options = []
+    for itinerary in sorted(itineraries, key=lambda item: item.get("totalTime", 0))[:limit]:
+        options.append({
+            "distance_m": itinerary.get("totalDistance"),
+            "time_s": itinerary.get("totalTime"),
+            "fare": itinerary.get("fare", {}).get("regular", {}).get("totalFare"),
+            "transfers": itinerary.get("transferCount"),
+            "walk_m": itinerary.get("totalWalkDistance"),
+            "walk_s": itinerary.get("totalWalkTime"),
+        })
+    summary: Dict[str, Any] = dict(options[0]) if options else {}
+    summary["options"] = options
+    return summary
+
+
+def _route_calls(tmap: Any, modes: List[str], origin: Dict[str, Any],
+                 destination: Dict[str, Any]) -> Dict[str, Tuple[Callable[[], Any], Callable[[Any], Any]]]:
+    coords = (origin["lon"], origin["lat"], destination["lon"], destination["lat"])
+    calls = {
+        "car": (lambda: tmap.car_route(*coords), summarize_car),
+        "pedestrian": (lambda: tmap.pedestrian_route_summary(*coords, origin["name"], destination["name"]),
+                       summarize_pedestrian),
+        "transit": (lambda: tmap.public_transit_route_summary(*map(str, coords)), summarize_transit),
+    }
+    return {mode: calls[mode] for mode in modes}
+
+
+def plan_trip(tmap: Any, origin_text: str, destination_text: str,
+              modes: Union[str, Iterable[str], None] = None) -> Dict[str, Any]:
+    """
+    출발지/도착지 텍스트로 이동 수단별 경로를 비교
+
+    Args:
+        tmap: TmapAPI 인스턴스
+        origin_text: 출발지 장소 이름 또는 주소
+        destination_text: 도착지 장소 이름 또는 주소
+        modes: 비교할 이동 수단 (car, pedestrian, transit 중 일부, None이면 전부)
+
+    Returns:
+        {"origin", "destination", "modes": {이동 수단: 요약 또는 TmapError}, "fastest"} 딕셔너리.
+        출발지나 도착지를 찾지 못하면 PLACE_NOT_FOUND TmapError
+    """
+    modes = parse_modes(modes)
+    places = run_parallel({
+        "origin": lambda: resolve_place(tmap, origin_text),
+        "destination": lambda: resolve_place(tmap, destination_text),
+    })
+    for place in places.values():
+        if not place:
+            return place
+    origin, destination = places["origin"], places["destination"]
+
+    calls = _route_calls(tmap, modes, origin, destination)
+    results = run_parallel({mode: call for mode, (call, _) in calls.items()})
+    summaries: Dict[str, Any] = {}
+    for mode, (_, summarize) in calls.items():
+        result = results[mode]
+        summaries[mode] = summarize(result) if result else result
+
+    fastest: Optional[str] = None
+    timed = [(summary["time_s"], mode) for mode, summary in summaries.items()
+             if summary and summary.get("time_s") is not None]
+    if timed:
+        fastest = min(timed)[1]
+    return {"origin": origin, "destination": destination, "modes": summaries, "fastest": fastest}
@@ -0,0 +1,152 @@
+"""
+설정 파일로 지정한 자주 쓰는 장소, 주소, 지하철역, 경로를 서버 시작 직후 미리 조회해
+응답 캐시를 채우는 예열기
+
+설정 파일(JSON) 예:
+    {
+        "pois": ["10067845"],
+        "keywords": ["서울역", "강남역"],
+        "addresses": ["서울특별시 중구 세종대로 110"],
+        "subway": [{"route": "2호선", "station": "강남", "dow": ["MON", "FRI"], "hh": ["08", "18"]}],
+        "routes": [{"start": [126.9707, 37.5547], "end": [127.0276, 37.4979],
+                    "modes": ["car", "pedestrian", "transit"]}]
+    }
+
+모든 예열 요청은 BACKGROUND 우선순위로 보내므로, 속도 제한기가 있으면 일반 도구 호출에
+토큰을 양보합니다. 경로와 지하철 혼잡도는 기본으로 캐시하지 않으므로, 설정에 있으면 해당
+엔드포인트의 캐시 정책(OPTIONAL_POLICIES)을 켠 뒤 예열합니다.
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .log import logger
+from .rate_limit import BACKGROUND, priority
+
+# (이름, 엔드포인트, 호출 함수)
+Task = Tuple[str, str, Callable[[], Any]]
+
+
+def load_warmup_config(path: str) -> Dict[str, Any]:
+    """예열 설정 파일(JSON) 읽기"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def warmup_tasks(tmap: Any, config: Dict[str, Any]) -> Iterator[Task]:
+    """
+    설정에서 (이름, 엔드포인트, 호출 함수) 예열 작업 목록 생성
+
+    Args:
+        tmap: TmapAPI 인스턴스
+        config: load_warmup_config로 읽은 설정
+    """
+    for poi_id in config.get("pois", []):
+        yield f"poi:{poi_id}", "get_poi_detail", lambda poi_id=poi_id: tmap.get_poi_detail(str(poi_id))
+    for keyword in config.get("keywords", []):
+        yield f"keyword:{keyword}", "search_poi_keyword", lambda keyword=keyword: tmap.search_poi_keyword(keyword)
+    for address in config.get("addresses", []):
+        yield f"address:{address}", "full_text_geocoding", lambda address=address: tmap.full_text_geocoding(address)
+    for item in config.get("subway", []):
+        route, station = item["route"], item["station"]
+        for dow in item.get("dow") or [None]:
+            for hh in item.get("hh") or [None]:
+                yield (f"subway:{route}/{station}/{dow}/{hh}", "get_subway_congestion",
+                       lambda route=route, station=station, dow=dow, hh=hh:
+                       tmap.get_subway_congestion(route, station, dow, hh))
+    for item in config.get("routes", []):
+        (start_x, start_y), (end_x, end_y) = item["start"], item["end"]
+        modes = item.get("modes") or ["car", "pedestrian", "transit"]
+        name = f"route:{start_x},{start_y}->{end_x},{end_y}"
+        coords = (start_x, start_y, end_x, end_y)
+        if "car" in modes:
+            yield f"{name}:car", "car_route", lambda c=coords: tmap.car_route(*c)
+        if "pedestrian" in modes:
+            yield f"{name}:pedestrian", "pedestrian_route_detail", lambda c=coords: tmap.pedestrian_route_detail(*c, "출발지", "도착지")
+        if "transit" in modes:
+            yield f"{name}:transit", "public_transit_route_summary", lambda c=coords: tmap.public_transit_route_summary(*map(str, c))
+
+
+class CacheWarmer:
+    """
+    예열 작업을 데몬 스레드에서 BACKGROUND 우선순위로 실행하는 예열기
+
+    start()는 바로 반환하므로 MCP 서버는 예열이 끝나기 전에도 도구 호출을 받을 수 있습니다.
+    """
+
+    def __init__(self, tmap: Any, config: Dict[str, Any], workers: int = 2):
+        """
+        Args:
+            tmap: TmapAPI 인스턴스 (응답 캐시가 설정되어 있어야 효과가 있음)
+            config: 예열 설정
+            workers: 동시에 실행할 예열 요청 수
+        """
+        self.tmap = tmap
+        self.tasks: List[Task] = list(warmup_tasks(tmap, config))
+        # 기본으로 캐시하지 않는 예열 대상 엔드포인트(경로, 지하철 혼잡도)의 캐시 정책을 켬
+        self.enabled: List[str] = []
+        if tmap.response_cache is not None:
+            for endpoint in dict.fromkeys(endpoint for _, endpoint, _ in self.tasks):
+                if tmap.response_cache.enable(endpoint):
+                    self.enabled.append(endpoint)
+        self.workers = workers
+        self.done = 0
+        self.failed: List[str] = []
+        self.elapsed: Optional[float] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run_task(self, task: Task) -> None:
+        name, _, call = task
+        if self._stop.is_set():
+            return
+        with priority(BACKGROUND):
+            try:
+                result = call()
+            except Exception:
+                logger.exception("예열 실패: %s", name)
+                result = None
+        with self._lock:
+            if result:
+                self.done += 1
+            else:
+                self.failed.append(name)
+
+    def _run(self) -> None:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="tmap-warmup") as pool:
+            list(pool.map(self._run_task, self.tasks))
+        self.elapsed = time.perf_counter() - start
+        logger.info("캐시 예열 완료: %d/%d건, %.2f초", self.done, len(self.tasks), self.elapsed)
+
+    def start(self) -> "CacheWarmer":
+        """백그라운드 예열 시작"""
+        self._thread = threading.Thread(target=self._run, name="tmap-warmup", daemon=True)
+        self._thread.start()
+        return self
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """예열이 끝날 때까지 대기, 끝났으면 True"""
+        if self._thread is None:
+            return True
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def stop(self) -> None:
+        """아직 시작하지 않은 예열 작업 취소"""
+        self._stop.set()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """예열 진행 상황"""
+        return {
+            "total": len(self.tasks),
+            "done": self.done,
+            "failed": list(self.failed),
+            "running": self._thread is not None and self._thread.is_alive(),
+            "elapsed": self.elapsed,
+            "enabled_policies": list(self.enabled),
+        }